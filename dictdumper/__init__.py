@@ -21,6 +21,30 @@ following formats:
 
   Dump tree-view text (``TXT``) format file.
 
+- :class:`~dictdumper.cbor.CBOR`
+
+  Dump concise binary object representation (``CBOR``) format file.
+
+- :class:`~dictdumper.csv.CSV`
+
+  Dump flattened comma-separated values (``CSV``/``TSV``) format file.
+
+- :class:`~dictdumper.yaml.YAML`
+
+  Dump multi-document YAML Ain't Markup Language (``YAML``) format file.
+
+- :class:`~dictdumper.sqlite.SQLite`
+
+  Dump blocks as rows of ``SQLite`` database file.
+
+- :class:`~dictdumper.html.HTML`
+
+  Dump static ``HTML`` viewer file, loading and rendering blocks on demand.
+
+- :class:`~dictdumper.pool.DumperPool`
+
+  Fan out blocks to one dumper per key, capping open output files.
+
 - :class:`~dictdumper.xml.XML`
 
   Dump extensible markup language (``XML``) file;
@@ -33,20 +57,78 @@ following formats:
 
   .. deprecated:: 0.8.0
 
-"""
-# Base Class for DictDumper
-from dictdumper.dumper import Dumper  # pylint: disable=unused-import
-from dictdumper.xml import XML  # pylint: disable=unused-import
-
-# Utility Classes
-from dictdumper.json import JSON
-from dictdumper.plist import PLIST
-from dictdumper.tree import Tree
+     Use :class:`~dictdumper.html.HTML` instead.
 
-# Deprecated Classes
-from dictdumper.vuejs import VueJS  # pylint: disable=unused-import
+"""
+import importlib
+import sys
 
-__all__ = ['JSON', 'PLIST', 'Tree']
+__all__ = ['JSON', 'PLIST', 'Tree', 'CBOR', 'CSV', 'YAML', 'SQLite', 'HTML', 'DumperPool']
 
 # version string
 __version__ = '0.8.4.post6'
+
+#: Dict[str, str]: Modules of lazily loaded attributes.
+_LAZY_ATTRS = {
+    # Base Class for DictDumper
+    'Dumper': 'dictdumper.dumper',
+    'XML': 'dictdumper.xml',
+
+    # Utility Classes
+    'CBOR': 'dictdumper.cbor',
+    'CSV': 'dictdumper.csv',
+    'HTML': 'dictdumper.html',
+    'JSON': 'dictdumper.json',
+    'PLIST': 'dictdumper.plist',
+    'SQLite': 'dictdumper.sqlite',
+    'Tree': 'dictdumper.tree',
+    'YAML': 'dictdumper.yaml',
+
+    # Keyed Pool of Dumpers
+    'DumperPool': 'dictdumper.pool',
+
+    # Deprecated Classes
+    'VueJS': 'dictdumper.vuejs',
+}
+
+#: Tuple[str]: Lazily loaded submodules.
+_LAZY_MODULES = (
+    'bench', 'cbor', 'compression', 'csv', 'dumper', 'durability', 'html', 'index',
+    'json', 'mapped', 'memo', 'plist', 'pool', 'profiler', 'reader', 'rotation',
+    'sqlite', 'stats', 'tree', 'vuejs', 'xml', 'yaml',
+)
+
+
+def __getattr__(name):
+    """Load format modules on first use.
+
+    Args:
+        name (str): attribute name
+
+    Returns:
+        Any: the dumper class or submodule
+
+    Raises:
+        AttributeError: no such attribute
+
+    """
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module('%s.%s' % (__name__, name))
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List module attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_MODULES))
+
+
+# module-level __getattr__ requires Python 3.7 (PEP 562)
+if sys.version_info < (3, 7):
+    for _name in _LAZY_ATTRS:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Typed arrays support."""
+
+import abc
+import array
+import sys
+
+#: Number of items converted to Python objects at once.
+_CHUNK_SIZE = 4096
+
+#: Dict[str, type]: Kinds of numbers by type codes of :class:`array.array`.
+_ARRAY_KINDS = dict([(code, int) for code in 'bBhHiIlLqQ'] + [(code, float) for code in 'fd'])
+
+#: Dict[str, type]: Kinds of numbers by kinds of :class:`numpy.dtype`.
+_DTYPE_KINDS = {'i': int, 'u': int, 'f': float}
+
+
+def _numpy():
+    """NumPy module, if imported.
+
+    NumPy is never imported by :mod:`dictdumper` itself: unless imported
+    elsewhere, no value can be a NumPy array anyway.
+
+    Returns:
+        Optional[types.ModuleType]: :mod:`numpy` if imported
+
+    """
+    return sys.modules.get('numpy')
+
+
+class ArrayType(abc.ABCMeta(str('ArrayBase'), (object,), {})):  # pylint: disable=too-few-public-methods
+    """Abstract base class of typed arrays, i.e. :class:`array.array`, and
+    :class:`numpy.ndarray` once NumPy is imported."""
+
+    __slots__ = ()
+
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        if issubclass(subclass, array.array):
+            return True
+        numpy = _numpy()
+        if numpy is not None and issubclass(subclass, numpy.ndarray):
+            return True
+        return NotImplemented
+
+
+def israw(value):
+    """Check if a typed array holds raw data rather than numbers.
+
+    Args:
+        value (Union[array.array, numpy.ndarray]): typed array to check
+
+    Returns:
+        bool: if ``value`` is a NumPy array of bytes or structured (void)
+        data type
+
+    """
+    numpy = _numpy()
+    return numpy is not None and isinstance(value, numpy.ndarray) and value.dtype.kind in 'SV'
+
+
+def rawview(value):
+    """Flat byte view of raw typed array.
+
+    Args:
+        value (numpy.ndarray): typed array of raw data
+
+    Returns:
+        memoryview: view of ``value`` in unsigned bytes, which is copied only
+        if ``value`` is not C-contiguous
+
+    """
+    numpy = _numpy()
+    return memoryview(numpy.ascontiguousarray(value).reshape(-1).view(numpy.uint8))
+
+
+def numeric(value):
+    """Kind of numbers held by a one-dimensional typed array.
+
+    Args:
+        value (Union[array.array, numpy.ndarray]): typed array to check
+
+    Returns:
+        Optional[type]: :obj:`int` if ``value`` is a non-empty array of
+        integers, :obj:`float` if of finite floats of at most double
+        precision, or :data:`None` otherwise
+
+    """
+    if isinstance(value, array.array):
+        kind = _ARRAY_KINDS.get(value.typecode)
+    elif value.ndim == 1 and value.dtype.itemsize <= 8:
+        kind = _DTYPE_KINDS.get(value.dtype.kind)
+    else:
+        return None
+    if kind is None or not len(value):
+        return None
+    if kind is int:
+        return int
+
+    numpy = _numpy()
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if not numpy.isfinite(value).all():
+            return None
+    else:
+        total = sum(value)
+        if total - total != 0.0:  # NaN, infinity or overflow
+            return None
+    return float
+
+
+def chunks(value):
+    """Convert numbers into Python objects chunk by chunk.
+
+    Args:
+        value (Union[List[Any], Tuple[Any], array.array, numpy.ndarray]):
+            contents to convert
+
+    Yields:
+        Union[List[Any], Tuple[Any]]: items of ``value`` in chunks, along
+        the first axis of typed arrays; lists and tuples are yielded as is
+
+    """
+    if isinstance(value, (list, tuple)):
+        yield value
+        return
+    if not len(value):
+        return
+
+    size = getattr(value, 'size', len(value)) // len(value)
+    step = max(_CHUNK_SIZE // max(size, 1), 1)
+    for start in range(0, len(value), step):
+        yield value[start:start + step].tolist()
@@ -2,6 +2,7 @@
 """Binary data processing utilities."""
 
 import binascii
+import codecs
 
 
 def hexlify(s):
@@ -9,3 +10,17 @@ def hexlify(s):
     if hasattr(s, 'hex'):
         return s.hex()
     return binascii.hexlify(s).decode()
+
+
+def byteview(view):
+    """Flat unsigned byte view of a memoryview, copying non-contiguous ones only."""
+    if not getattr(view, 'c_contiguous', False):
+        return view.tobytes()
+    if view.format != 'B' or view.ndim != 1:
+        return view.cast('B')
+    return view
+
+
+def decode(s):
+    """UTF-8 representation of binary data, with malformed data replaced."""
+    return codecs.decode(s, 'utf-8', 'replace')
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Iteration utilities."""
+
+import itertools
+
+
+def peek(iterable):
+    """Check if an iterable is empty without consuming it.
+
+    Args:
+        iterable (Iterable[Any]): iterable to check
+
+    Returns:
+        Tuple[bool, Iterator[Any]]: if ``iterable`` is empty, and an
+        iterator over all its items
+
+    """
+    items = iter(iterable)
+    for item in items:
+        return (False, itertools.chain((item,), items))
+    return (True, items)
+
+
+def lookahead(iterable):
+    """Iterate over an iterable, flagging its last item.
+
+    Args:
+        iterable (Iterable[Any]): iterable to iterate over
+
+    Yields:
+        Tuple[Any, bool]: item of ``iterable``, and if it is the last one
+
+    """
+    items = iter(iterable)
+    for prev in items:
+        break
+    else:
+        return
+    for item in items:
+        yield (prev, False)
+        prev = item
+    yield (prev, True)
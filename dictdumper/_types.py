@@ -6,6 +6,10 @@ import sys
 if sys.version_info.major < 3:
     bytes_type = str
     str_type = unicode
+
+    from collections import Iterable, Iterator, Mapping, Sized  # pylint: disable=no-name-in-module
 else:
     bytes_type = bytes
     str_type = str
+
+    from collections.abc import Iterable, Iterator, Mapping, Sized
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite.
+
+:mod:`dictdumper.bench` benchmarks all dumpers on deterministic
+synthetic workloads modelled on dissected network packets. Run it
+from command line as below, results are written to a JSON file for
+comparing runs.
+
+.. code:: shell
+
+    $ python -m dictdumper.bench --output results.json
+    $ python -m dictdumper.bench --compare results.json
+    $ python -m dictdumper.bench --memory --check
+    $ python -m dictdumper.bench --import-time
+
+- :mod:`~dictdumper.bench.workload`
+
+  Synthetic workload generator.
+
+- :mod:`~dictdumper.bench.speed`
+
+  Throughput and latency benchmarks.
+
+- :mod:`~dictdumper.bench.memory`
+
+  Peak memory and allocation benchmarks, checked against stored
+  baselines.
+
+- :mod:`~dictdumper.bench.importtime`
+
+  Import time benchmarks, checking format modules are lazily loaded.
+
+"""
+
+from dictdumper.bench.importtime import run_import
+from dictdumper.bench.memory import check, load_baseline, run_memory, update_baseline
+from dictdumper.bench.speed import TARGETS, compare, run, run_speed
+from dictdumper.bench.workload import WORKLOADS, make_records
+
+__all__ = ['TARGETS', 'WORKLOADS', 'make_records', 'run', 'run_speed', 'compare',
+           'run_memory', 'check', 'load_baseline', 'update_baseline', 'run_import']
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Command line interface of the benchmark suite."""
+
+from __future__ import print_function
+
+import argparse
+import json
+import sys
+
+from dictdumper.bench import memory
+from dictdumper.bench.importtime import run_import
+from dictdumper.bench.speed import TARGETS, compare, run
+from dictdumper.bench.workload import WORKLOADS
+
+
+def get_parser():
+    """Argument parser."""
+    parser = argparse.ArgumentParser(prog='python -m dictdumper.bench',
+                                     description='benchmark dumpers on synthetic workloads')
+    parser.add_argument('-t', '--target', action='append', choices=list(TARGETS),
+                        help='benchmark target (default: all)')
+    parser.add_argument('-w', '--workload', action='append', choices=list(WORKLOADS),
+                        help='workload (default: all)')
+    parser.add_argument('-n', '--count', type=int,
+                        help='number of records per workload (default: 1000, or 50 with --memory)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs, the fastest is reported (default: %(default)s)')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='random seed (default: %(default)s)')
+    parser.add_argument('-o', '--output', default='dictdumper-bench.json',
+                        help='path to results file (default: %(default)s)')
+    parser.add_argument('-c', '--compare', metavar='RESULTS',
+                        help='path to previous results file to compare with')
+
+    parser.add_argument('-i', '--import-time', action='store_true',
+                        help='measure import time of dictdumper, failing if format '
+                             'modules are loaded eagerly')
+
+    group = parser.add_argument_group('memory benchmarks')
+    group.add_argument('-m', '--memory', action='store_true',
+                       help='trace peak memory and allocations instead of throughput')
+    group.add_argument('--check', action='store_true',
+                       help='fail if memory regresses beyond tolerance of stored baselines')
+    group.add_argument('--tolerance', type=float, default=0.1,
+                       help='relative tolerance of memory regressions (default: %(default)s)')
+    group.add_argument('--baseline', default=memory.BASELINE,
+                       help='path to stored baselines (default: %(default)s)')
+    group.add_argument('--update-baseline', action='store_true',
+                       help='store results as baselines of running Python version')
+    return parser
+
+
+def main_memory(args):
+    """Entrypoint of memory benchmarks."""
+    report = memory.run(targets=args.target, workloads=args.workload,
+                        count=memory.BASELINE_COUNT if args.count is None else args.count,
+                        seed=args.seed, repeat=args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    print('%-16s %-8s %12s %12s %10s' % ('target', 'workload', 'peak (KiB)',
+                                         'record (KiB)', 'blocks'))
+    for item in report['results']:
+        print('%-16s %-8s %12.1f %12s %10s' % (
+            item['target'], item['workload'], item['peak'] / 1024.0,
+            '-' if item['record_peak'] is None else '%.1f' % (item['record_peak'] / 1024.0),
+            '-' if item['blocks'] is None else item['blocks']))
+
+    if args.update_baseline:
+        memory.update_baseline(report, args.baseline)
+        print()
+        print('baselines of Python %s stored in %s' % (report['meta']['python'], args.baseline))
+
+    if args.check:
+        baseline = memory.load_baseline(args.baseline)
+        if baseline is None:
+            print()
+            print('no baselines of Python %s stored in %s' % (report['meta']['python'], args.baseline))
+            return 0
+
+        regressions = memory.check(report, baseline, args.tolerance)
+        print()
+        if not regressions:
+            print('no memory regressions beyond tolerance of %.0f%%' % (args.tolerance * 100))
+            return 0
+
+        print('%-16s %-8s %-12s %12s %12s' % ('target', 'workload', 'metric', 'baseline', 'current'))
+        for (target, workload, metric, old, new) in regressions:
+            print('%-16s %-8s %-12s %12d %12d' % (target, workload, metric, old, new))
+        return 1
+    return 0
+
+
+def main_import(args):
+    """Entrypoint of import time benchmarks."""
+    result = run_import(repeat=args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(result, file, indent=2)
+
+    print('import dictdumper: %.3f ms, %d modules loaded' % (result['time'] * 1e3,
+                                                            len(result['modules'])))
+    if result['unexpected']:
+        print('eagerly loaded: %s' % ', '.join(result['unexpected']))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """Entrypoint."""
+    args = get_parser().parse_args(argv)
+    if args.import_time:
+        return main_import(args)
+    if args.memory:
+        return main_memory(args)
+
+    report = run(targets=args.target, workloads=args.workload,
+                 count=1000 if args.count is None else args.count,
+                 seed=args.seed, repeat=args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    print('%-16s %-8s %12s %12s %10s %10s' % ('target', 'workload', 'records/s', 'MB/s',
+                                              'p50 (us)', 'p99 (us)'))
+    for item in report['results']:
+        print('%-16s %-8s %12.1f %12.3f %10.1f %10.1f' % (
+            item['target'], item['workload'], item['records_per_sec'] or 0,
+            (item['bytes_per_sec'] or 0) / 1e6, item['latency']['p50'] * 1e6,
+            item['latency']['p99'] * 1e6))
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            previous = json.load(file)
+
+        print()
+        print('%-16s %-8s %12s %12s %8s' % ('target', 'workload', 'old rec/s', 'new rec/s', 'ratio'))
+        for (target, workload, old, new, ratio) in compare(previous, report):
+            print('%-16s %-8s %12.1f %12.1f %7.2fx' % (target, workload, old, new, ratio))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
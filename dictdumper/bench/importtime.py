@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Import time benchmarks.
+
+:mod:`dictdumper.bench.importtime` measures the time to import
+:mod:`dictdumper` in fresh interpreters, along with the modules it
+loads, so that format modules stay lazily loaded (c.f.
+:data:`EAGER_MODULES`).
+
+"""
+
+import collections
+import os
+import subprocess  # nosec: B404
+import sys
+
+__all__ = ['EAGER_MODULES', 'run_import']
+
+#: Tuple[str]: :mod:`dictdumper` modules allowed to be loaded on
+#: ``import dictdumper``.
+EAGER_MODULES = ('dictdumper',)
+
+#: Script measuring import time in a fresh interpreter.
+_SCRIPT = '''\
+import sys, time
+timer = getattr(time, 'perf_counter', time.time)
+loaded = set(sys.modules)
+start = timer()
+import dictdumper
+elapsed = timer() - start
+print(repr(elapsed))
+for name in sorted(set(sys.modules) - loaded):
+    print(name)
+'''
+
+
+def _measure():
+    """Import :mod:`dictdumper` in a fresh interpreter.
+
+    Returns:
+        Tuple[float, List[str]]: import time and newly loaded modules
+
+    """
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT], env=env).decode()  # nosec: B603
+    lines = output.splitlines()
+    return float(lines[0]), lines[1:]
+
+
+def run_import(repeat=5):
+    """Benchmark import time of :mod:`dictdumper`.
+
+    Args:
+        repeat (int): number of fresh interpreters, the fastest of
+            which is reported
+
+    Returns:
+        Dict[str, Any]: benchmark result, with import ``time`` in seconds,
+        all newly loaded ``modules`` and the loaded ``dictdumper`` modules
+        beyond :data:`EAGER_MODULES` as ``unexpected``
+
+    """
+    runs = [_measure() for _ in range(max(repeat, 1))]
+    elapsed = min(run[0] for run in runs)
+    modules = runs[0][1]
+
+    result = collections.OrderedDict()
+    result['time'] = elapsed
+    result['modules'] = modules
+    result['unexpected'] = [name for name in modules
+                            if name.split('.')[0] == 'dictdumper' and name not in EAGER_MODULES]
+    return result
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""Peak memory and allocation benchmarks.
+
+:mod:`dictdumper.bench.memory` traces memory allocations of dumpers on
+synthetic workloads (c.f. :mod:`dictdumper.bench.workload`) with
+:mod:`tracemalloc`, and checks the results against stored baselines
+(c.f. :data:`BASELINE`) within a tolerance.
+
+"""
+
+import collections
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+from dictdumper.bench.speed import TARGETS
+from dictdumper.bench.workload import WORKLOADS, make_records
+
+__all__ = ['BASELINE', 'run_memory', 'run', 'check', 'load_baseline', 'update_baseline']
+
+#: Path to stored baselines, keyed by Python version (``'X.Y'``).
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+#: Metrics checked against baselines.
+METRICS = ('peak', 'record_peak', 'blocks')
+
+#: Number of records per workload of stored baselines.
+BASELINE_COUNT = 50
+
+#: Number of records dumped before tracing, so that caches and lazy
+#: initialisations are not accounted.
+_WARMUP = 10
+
+#: Absolute slack of metrics before regressing, so that tiny metrics
+#: are not failed by noise.
+_SLACK = {
+    'peak': 16384,
+    'record_peak': 16384,
+    'blocks': 256,
+}
+
+#: Filters excluding allocations of :mod:`tracemalloc` itself.
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+def _python_version():
+    """Python version as key of baselines."""
+    return '%d.%d' % sys.version_info[:2]
+
+
+def _traced_blocks():
+    """Number of live memory blocks traced."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+    return sum(stat.count for stat in snapshot.statistics('filename'))
+
+
+def _trace(factory, target, records, tempdir=None):
+    """Trace memory allocations of a single run.
+
+    Args:
+        factory (Callable[[str], Dumper]): benchmark target
+        target (str): name of benchmark target
+        records (List[Tuple[str, Dict[str, Any]]]): records to dump
+        tempdir (Optional[str]): directory of output files
+
+    Returns:
+        Tuple[int, Optional[int], Optional[int]]: ``peak``, ``record_peak``
+        and ``blocks`` of the run (c.f. :func:`run_memory`)
+
+    """
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)
+
+    path = tempfile.mkdtemp(prefix='%s-' % target, dir=tempdir)
+    started = tracemalloc.is_tracing()
+    enabled = gc.isenabled()
+    try:
+        dumper = factory(os.path.join(path, 'warmup.%s' % target))
+        for (name, record) in records[:_WARMUP]:
+            dumper(record, name)
+        dumper.close()
+        del dumper
+
+        gc.collect()
+        gc.disable()
+        if not started:
+            tracemalloc.start()
+        tracemalloc.clear_traces()
+        blocks = None if reset_peak is None else _traced_blocks()
+        origin = tracemalloc.get_traced_memory()[0]
+
+        peak = record_peak = 0
+        dumper = factory(os.path.join(path, 'bench.%s' % target))
+        for (name, record) in records:
+            if reset_peak is None:
+                dumper(record, name)
+                continue
+
+            current = tracemalloc.get_traced_memory()[0]
+            reset_peak()
+            dumper(record, name)
+            traced = tracemalloc.get_traced_memory()[1]
+            peak = max(peak, traced)
+            record_peak = max(record_peak, traced - current)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+
+        if reset_peak is None:
+            record_peak = None
+        else:
+            gc.collect()
+            blocks = _traced_blocks() - blocks
+            reset_peak()
+        dumper.close()
+        peak = max(peak, tracemalloc.get_traced_memory()[1]) - origin
+    finally:
+        if not started:
+            tracemalloc.stop()
+        if enabled:
+            gc.enable()
+        shutil.rmtree(path, ignore_errors=True)
+    return peak, record_peak, blocks
+
+
+def run_memory(target, records, repeat=3, tempdir=None):
+    """Trace memory allocations of a target on records.
+
+    Args:
+        target (str): name of benchmark target
+            (c.f. :data:`~dictdumper.bench.speed.TARGETS`)
+        records (List[Tuple[str, Dict[str, Any]]]): records to dump
+        repeat (int): number of runs, the minimum of each metric is reported
+        tempdir (Optional[str]): directory of output files
+
+    Returns:
+        Dict[str, Any]: benchmark result, where ``peak`` is the peak of
+        traced memory over the whole run, ``record_peak`` the largest peak
+        of a single call over memory traced before the call, and ``blocks``
+        the number of memory blocks still allocated after the last call
+        (i.e. retained by the dumper)
+
+    """
+    factory = TARGETS[target]
+    prepare = getattr(factory, 'prepare', None)
+    if prepare is not None:
+        records = [(name, prepare(record)) for (name, record) in records]
+
+    runs = [_trace(factory, target, records, tempdir) for _ in range(max(repeat, 1))]
+
+    result = collections.OrderedDict()
+    result['target'] = target
+    result['records'] = len(records)
+    for (index, metric) in enumerate(METRICS):
+        values = [run[index] for run in runs if run[index] is not None]
+        result[metric] = min(values) if values else None
+    return result
+
+
+def run(targets=None, workloads=None, count=BASELINE_COUNT, seed=0, repeat=3, tempdir=None):
+    """Trace memory allocations of targets on workloads.
+
+    Args:
+        targets (Optional[List[str]]): names of benchmark targets,
+            default to all (c.f. :data:`~dictdumper.bench.speed.TARGETS`)
+        workloads (Optional[List[str]]): names of workloads, default to all
+            (c.f. :data:`~dictdumper.bench.workload.WORKLOADS`)
+        count (int): number of records per workload
+        seed (int): random seed
+        repeat (int): number of runs per target and workload
+        tempdir (Optional[str]): directory of output files
+
+    Returns:
+        Dict[str, Any]: benchmark report, with ``meta`` and ``results``
+
+    """
+    targets = list(TARGETS) if targets is None else targets
+    workloads = list(WORKLOADS) if workloads is None else workloads
+
+    results = list()
+    for workload in workloads:
+        records = make_records(workload, count, seed)
+        for target in targets:
+            result = run_memory(target, records, repeat=repeat, tempdir=tempdir)
+            result['workload'] = workload
+            results.append(result)
+
+    meta = collections.OrderedDict()
+    meta['python'] = _python_version()
+    meta['count'] = count
+    meta['seed'] = seed
+
+    report = collections.OrderedDict()
+    report['meta'] = meta
+    report['results'] = results
+    return report
+
+
+def load_baseline(path=BASELINE, version=None):
+    """Load stored baseline of a Python version.
+
+    Args:
+        path (str): path to baselines file
+        version (Optional[str]): Python version (``'X.Y'``),
+            default to the running one
+
+    Returns:
+        Optional[Dict[str, Any]]: baseline report, or :data:`None` if
+        no baseline is stored for the Python version
+
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path) as file:
+        baselines = json.load(file)
+    return baselines.get(_python_version() if version is None else version)
+
+
+def update_baseline(report, path=BASELINE):
+    """Store a benchmark report as baseline of its Python version.
+
+    Args:
+        report (Dict[str, Any]): benchmark report (c.f. :func:`run`)
+        path (str): path to baselines file
+
+    """
+    baselines = dict()
+    if os.path.isfile(path):
+        with open(path) as file:
+            baselines = json.load(file)
+    baselines[report['meta']['python']] = report
+
+    with open(path, 'w') as file:
+        json.dump(baselines, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def check(report, baseline, tolerance=0.1):
+    """Check a benchmark report against baseline.
+
+    Args:
+        report (Dict[str, Any]): benchmark report (c.f. :func:`run`)
+        baseline (Dict[str, Any]): baseline report
+        tolerance (float): relative tolerance of regressions
+
+    Returns:
+        List[Tuple[str, str, str, int, int]]: ``(target, workload, metric,
+        baseline value, current value)`` of metrics regressed beyond
+        tolerance, of results present in both reports
+
+    Raises:
+        ValueError: reports of different record counts or seeds
+
+    """
+    for key in ('count', 'seed'):
+        if report['meta'][key] != baseline['meta'][key]:
+            raise ValueError('incomparable reports: different %s' % key)
+    previous = dict(((item['target'], item['workload']), item) for item in baseline['results'])
+
+    regressions = list()
+    for item in report['results']:
+        prev = previous.get((item['target'], item['workload']))
+        if prev is None:
+            continue
+        for metric in METRICS:
+            old, new = prev.get(metric), item.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) + _SLACK[metric]:
+                regressions.append((item['target'], item['workload'], metric, old, new))
+    return regressions
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Throughput and latency benchmarks.
+
+:mod:`dictdumper.bench.speed` measures records per second, bytes per
+second and per-call latency percentiles of dumpers on synthetic
+workloads (c.f. :mod:`dictdumper.bench.workload`), along with the
+standard library :mod:`json` and :mod:`plistlib` as baselines.
+
+"""
+
+import collections
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import plistlib
+import shutil
+import sys
+import tempfile
+import time
+
+from dictdumper import __version__
+from dictdumper._hexlify import hexlify
+from dictdumper.bench.workload import WORKLOADS, make_records
+from dictdumper.cbor import CBOR
+from dictdumper.csv import CSV
+from dictdumper.html import HTML
+from dictdumper.json import JSON
+from dictdumper.plist import PLIST
+from dictdumper.sqlite import SQLite
+from dictdumper.tree import Tree
+from dictdumper.yaml import YAML
+
+__all__ = ['TARGETS', 'run', 'run_speed', 'compare']
+
+#: Timer function.
+timer = getattr(time, 'perf_counter', time.time)
+
+#: Percentiles of per-call latency to report.
+_PERCENTILES = (50, 90, 99)
+
+
+def _json_default(o):
+    """Convert unsupported types for :func:`json.dumps`."""
+    if isinstance(o, (bytes, bytearray, memoryview)):
+        return hexlify(o)
+    if isinstance(o, (datetime.date, datetime.datetime, datetime.time)):
+        return o.isoformat()
+    raise TypeError('unsupported content type: %s' % type(o).__name__)
+
+
+def _plist_prepare(o):
+    """Convert unsupported types for :mod:`plistlib`."""
+    if isinstance(o, dict):
+        return dict((str(key), _plist_prepare(val)) for (key, val) in o.items() if val is not None)
+    if isinstance(o, (list, tuple)):
+        return [_plist_prepare(val) for val in o if val is not None]
+    if isinstance(o, int) and not isinstance(o, bool) and not -2 ** 63 <= o < 2 ** 64:
+        return str(o)
+    return o
+
+
+class _Baseline(object):  # pylint: disable=useless-object-inheritance
+    """Baseline serialiser writing one block per line to an open file."""
+
+    #: File open mode.
+    mode = 'w'
+
+    def __init__(self, fname):
+        self._file = open(fname, self.mode)
+
+    def __call__(self, value, name=None):
+        self._file.write(self.dumps(value, name))
+        return self
+
+    def close(self):
+        """Close the output file."""
+        self._file.close()
+
+    @staticmethod
+    def prepare(value):
+        """Convert record before benchmarking."""
+        return value
+
+    def dumps(self, value, name):
+        """Serialise a block."""
+        raise NotImplementedError
+
+
+class StdlibJSON(_Baseline):
+    """Baseline of :func:`json.dumps`."""
+
+    def dumps(self, value, name):
+        return json.dumps({name: value}, default=_json_default) + '\n'
+
+
+class StdlibPlist(_Baseline):
+    """Baseline of :func:`plistlib.dumps`."""
+
+    mode = 'wb'
+    prepare = staticmethod(_plist_prepare)
+
+    def dumps(self, value, name):
+        return plistlib.dumps({name: value})
+
+
+#: Dict[str, Callable[[str], Dumper]]: Benchmark targets.
+TARGETS = collections.OrderedDict([
+    ('json', JSON),
+    ('plist', PLIST),
+    ('tree', Tree),
+    ('cbor', CBOR),
+    ('yaml', YAML),
+    ('csv', CSV),
+    ('html', HTML),
+    ('sqlite', SQLite),
+    ('stdlib-json', StdlibJSON),
+    ('stdlib-plistlib', StdlibPlist),
+])
+
+
+def _percentile(data, percent):
+    """Nearest-rank percentile of sorted ``data``."""
+    index = int(math.ceil(percent / 100.0 * len(data))) - 1
+    return data[min(max(index, 0), len(data) - 1)]
+
+
+def _disk_usage(path):
+    """Total size of files under ``path``."""
+    size = 0
+    for (root, _, files) in os.walk(path):
+        for name in files:
+            size += os.path.getsize(os.path.join(root, name))
+    return size
+
+
+def run_speed(target, records, repeat=3, tempdir=None):
+    """Benchmark a target on records.
+
+    Args:
+        target (str): name of benchmark target (c.f. :data:`TARGETS`)
+        records (List[Tuple[str, Dict[str, Any]]]): records to dump
+        repeat (int): number of runs, the fastest of which is reported
+        tempdir (Optional[str]): directory of output files
+
+    Returns:
+        Dict[str, Any]: benchmark result
+
+    """
+    factory = TARGETS[target]
+    prepare = getattr(factory, 'prepare', None)
+    if prepare is not None:
+        records = [(name, prepare(record)) for (name, record) in records]
+
+    best = None
+    for index in range(max(repeat, 1)):
+        path = tempfile.mkdtemp(prefix='%s-%d-' % (target, index), dir=tempdir)
+        try:
+            latency = list()
+
+            gc.collect()
+            start = timer()
+            dumper = factory(os.path.join(path, 'bench.%s' % target))
+            for (name, record) in records:
+                point = timer()
+                dumper(record, name)
+                latency.append(timer() - point)
+            dumper.close()
+            elapsed = timer() - start
+
+            size = _disk_usage(path)
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+        if best is None or elapsed < best[0]:
+            best = (elapsed, size, latency)
+
+    elapsed, size, latency = best
+    latency.sort()
+
+    result = collections.OrderedDict()
+    result['target'] = target
+    result['records'] = len(records)
+    result['bytes'] = size
+    result['elapsed'] = elapsed
+    result['records_per_sec'] = len(records) / elapsed if elapsed else None
+    result['bytes_per_sec'] = size / elapsed if elapsed else None
+    result['latency'] = collections.OrderedDict(
+        [('mean', sum(latency) / len(latency) if latency else None)]
+        + [('p%d' % percent, _percentile(latency, percent) if latency else None)
+           for percent in _PERCENTILES]
+        + [('max', latency[-1] if latency else None)]
+    )
+    return result
+
+
+def run(targets=None, workloads=None, count=1000, seed=0, repeat=3, tempdir=None):
+    """Benchmark targets on workloads.
+
+    Args:
+        targets (Optional[List[str]]): names of benchmark targets,
+            default to all (c.f. :data:`TARGETS`)
+        workloads (Optional[List[str]]): names of workloads, default to all
+            (c.f. :data:`~dictdumper.bench.workload.WORKLOADS`)
+        count (int): number of records per workload
+        seed (int): random seed
+        repeat (int): number of runs per target and workload
+        tempdir (Optional[str]): directory of output files
+
+    Returns:
+        Dict[str, Any]: benchmark report, with ``meta`` and ``results``
+
+    """
+    targets = list(TARGETS) if targets is None else targets
+    workloads = list(WORKLOADS) if workloads is None else workloads
+
+    results = list()
+    for workload in workloads:
+        records = make_records(workload, count, seed)
+        for target in targets:
+            result = run_speed(target, records, repeat=repeat, tempdir=tempdir)
+            result['workload'] = workload
+            results.append(result)
+
+    meta = collections.OrderedDict()
+    meta['version'] = __version__
+    meta['python'] = sys.version.split()[0]
+    meta['implementation'] = platform.python_implementation()
+    meta['platform'] = platform.platform()
+    meta['date'] = datetime.datetime.utcnow().isoformat()
+    meta['count'] = count
+    meta['seed'] = seed
+    meta['repeat'] = repeat
+    meta['workloads'] = collections.OrderedDict((name, WORKLOADS[name]) for name in workloads)
+
+    report = collections.OrderedDict()
+    report['meta'] = meta
+    report['results'] = results
+    return report
+
+
+def compare(old, new):
+    """Compare throughput of two benchmark reports.
+
+    Args:
+        old (Dict[str, Any]): previous benchmark report
+        new (Dict[str, Any]): current benchmark report
+
+    Returns:
+        List[Tuple[str, str, float, float, float]]: ``(target, workload,
+        old records/sec, new records/sec, ratio)`` of results present in
+        both reports
+
+    """
+    previous = dict(((item['target'], item['workload']), item) for item in old['results'])
+
+    rows = list()
+    for item in new['results']:
+        prev = previous.get((item['target'], item['workload']))
+        if prev is None or not prev['records_per_sec'] or not item['records_per_sec']:
+            continue
+        rows.append((item['target'], item['workload'], prev['records_per_sec'],
+                     item['records_per_sec'], item['records_per_sec'] / prev['records_per_sec']))
+    return rows
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Synthetic workloads.
+
+:mod:`dictdumper.bench.workload` generates deterministic synthetic
+records modelled on dissected network packets (frame, Ethernet, IPv4,
+TCP and payload), with extension layers of configurable width, depth,
+string/bytes size and type mix.
+
+"""
+
+import collections
+import datetime
+import random
+
+__all__ = ['WORKLOADS', 'make_records']
+
+#: Dict[str, Dict[str, Any]]: Preset workload parameters.
+#:
+#: * ``width`` -- number of fields per extension layer
+#: * ``depth`` -- nesting levels of extension layers
+#: * ``text`` -- length of string fields
+#: * ``data`` -- length of bytes fields (and of the packet payload)
+#: * ``mix`` -- type mix of extension fields, one of ``'mixed'``,
+#:   ``'text'``, ``'binary'`` and ``'numeric'``
+WORKLOADS = collections.OrderedDict([
+    ('small', dict(width=2, depth=1, text=16, data=32, mix='mixed')),
+    ('wide', dict(width=64, depth=1, text=16, data=16, mix='mixed')),
+    ('deep', dict(width=2, depth=12, text=16, data=16, mix='mixed')),
+    ('text', dict(width=8, depth=2, text=512, data=0, mix='text')),
+    ('binary', dict(width=4, depth=2, text=8, data=1460, mix='binary')),
+    ('numeric', dict(width=16, depth=2, text=8, data=0, mix='numeric')),
+])
+
+#: Vocabulary of string fields.
+_WORDS = (
+    'GET', 'POST', 'HTTP/1.1', 'Host:', 'example.com', 'User-Agent:', 'curl/7.68.0',
+    'Accept:', '*/*', 'Content-Type:', 'application/json', 'charset=utf-8', 'gzip',
+    'keep-alive', 'no-cache', '"quoted"', 'path/to/resource', 'tab\tseparated', 'line\nbreak',
+)
+
+#: Type cycle of the ``'mixed'`` type mix.
+_MIXED = ('text', 'integer', 'float', 'bool', 'null', 'bytes', 'list', 'tuple')
+
+#: Epoch of frame timestamps.
+_EPOCH = datetime.datetime(2020, 1, 31, 20, 15, 10)
+
+
+def _text(rng, size):
+    """Generate a string of ``size`` characters."""
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def _bytes(rng, size):
+    """Generate a bytestring of ``size`` bytes."""
+    if size <= 0:
+        return b''
+    return rng.getrandbits(size * 8).to_bytes(size, 'little')
+
+
+def _field(rng, kind, params):
+    """Generate a field value of type ``kind``."""
+    if kind == 'text':
+        return _text(rng, params['text'])
+    if kind == 'integer':
+        return rng.randint(-2 ** 31, 2 ** 31)
+    if kind == 'float':
+        return rng.random() * 1e6
+    if kind == 'bool':
+        return rng.random() < 0.5
+    if kind == 'null':
+        return None
+    if kind == 'bytes':
+        return _bytes(rng, params['data'] or 8)
+    if kind == 'list':
+        return [rng.randint(0, 65535) for _ in range(8)]
+    if kind == 'tuple':
+        return tuple(rng.random() for _ in range(8))
+    raise ValueError('unknown field kind: %s' % kind)
+
+
+def _layer(rng, params, depth):
+    """Generate an extension layer."""
+    mix = params['mix']
+    layer = collections.OrderedDict()
+    for index in range(params['width']):
+        if mix == 'mixed':
+            kind = _MIXED[index % len(_MIXED)]
+        elif mix == 'numeric':
+            kind = 'integer' if index % 2 else 'float'
+        elif mix == 'binary':
+            kind = 'bytes'
+        else:
+            kind = 'text'
+        layer['field_%d' % index] = _field(rng, kind, params)
+    if mix == 'numeric':
+        layer['samples'] = [rng.random() for _ in range(params['width'] * 4)]
+    if depth > 1:
+        layer['next'] = _layer(rng, params, depth - 1)
+    return layer
+
+
+def _record(rng, index, params):
+    """Generate a packet-like record."""
+    payload = _bytes(rng, params['data'])
+
+    frame = collections.OrderedDict()
+    frame['number'] = index
+    frame['time'] = _EPOCH + datetime.timedelta(microseconds=index * 1337)
+    frame['length'] = 54 + len(payload)
+    frame['protocols'] = 'eth:ethertype:ip:tcp'
+
+    ethernet = collections.OrderedDict()
+    ethernet['dst'] = _bytes(rng, 6)
+    ethernet['src'] = _bytes(rng, 6)
+    ethernet['type'] = 'IPv4'
+
+    flags = collections.OrderedDict()
+    flags['df'] = True
+    flags['mf'] = False
+
+    ipv4 = collections.OrderedDict()
+    ipv4['version'] = 4
+    ipv4['hdr_len'] = 20
+    ipv4['len'] = 40 + len(payload)
+    ipv4['id'] = rng.randint(0, 65535)
+    ipv4['flags'] = flags
+    ipv4['ttl'] = 64
+    ipv4['proto'] = 'TCP'
+    ipv4['src'] = '10.0.%d.%d' % (rng.randint(0, 255), rng.randint(1, 254))
+    ipv4['dst'] = '192.168.%d.%d' % (rng.randint(0, 255), rng.randint(1, 254))
+
+    tcp_flags = collections.OrderedDict()
+    for name in ('fin', 'syn', 'rst', 'psh', 'ack', 'urg'):
+        tcp_flags[name] = rng.random() < 0.5
+
+    tcp = collections.OrderedDict()
+    tcp['srcport'] = rng.randint(1024, 65535)
+    tcp['dstport'] = 443
+    tcp['seq'] = rng.getrandbits(32)
+    tcp['ack'] = rng.getrandbits(32)
+    tcp['flags'] = tcp_flags
+    tcp['window'] = rng.randint(0, 65535)
+    tcp['options'] = [(2, 4, 1460), (4, 2), (8, 10, rng.getrandbits(32), 0), (1,), (3, 3, 7)]
+
+    record = collections.OrderedDict()
+    record['frame'] = frame
+    record['ethernet'] = ethernet
+    record['ipv4'] = ipv4
+    record['tcp'] = tcp
+    if payload:
+        record['payload'] = payload
+    record['ext'] = _layer(rng, params, params['depth'])
+    return record
+
+
+def make_records(workload, count, seed=0):
+    """Generate records of a workload.
+
+    Args:
+        workload (Union[str, Dict[str, Any]]): name of preset workload
+            (c.f. :data:`WORKLOADS`) or workload parameters
+        count (int): number of records
+        seed (int): random seed
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: deterministic list of
+        ``(name, record)`` pairs
+
+    """
+    params = WORKLOADS[workload] if isinstance(workload, str) else workload
+    rng = random.Random(seed)
+    return [('packet_%d' % index, _record(rng, index, params)) for index in range(count)]
@@ -0,0 +1,541 @@
+# -*- coding: utf-8 -*-
+"""dumper a CBOR file
+
+:mod:`dictdumper.cbor` contains :class:`~dictdumper.cbor.CBOR`
+only, which dumpers a concise binary object representation (CBOR,
+:rfc:`8949`) file. Usage sample is described as below.
+
+.. code:: python
+
+    >>> dumper = CBOR(file_name)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+
+"""
+# Writer for CBOR files
+# Dump a CBOR file for PCAP analyser
+
+import binascii
+import calendar
+import datetime
+import itertools
+import os
+import struct
+
+from dictdumper._arrays import ArrayType, chunks, israw
+from dictdumper._dateutil import isoformat
+from dictdumper._hexlify import byteview
+from dictdumper._types import Iterable, Mapping, Sized, bytes_type, str_type
+from dictdumper.dumper import Dumper
+
+__all__ = ['CBOR']
+
+#: CBOR head string (indefinite-length map).
+_HEADER_START = b'\xbf'
+
+#: CBOR tail string (break stop code).
+_HEADER_END = b'\xff'
+
+#: Initial byte of indefinite-length arrays.
+_ARRAY_START = b'\x9f'
+
+#: Break stop code of indefinite-length arrays.
+_ARRAY_END = b'\xff'
+
+# major types
+#: Major type of unsigned integers.
+_MAJOR_UINT = 0
+#: Major type of negative integers.
+_MAJOR_NINT = 1
+#: Major type of byte strings.
+_MAJOR_BYTES = 2
+#: Major type of text strings.
+_MAJOR_TEXT = 3
+#: Major type of arrays.
+_MAJOR_ARRAY = 4
+#: Major type of maps.
+_MAJOR_MAP = 5
+#: Major type of tags.
+_MAJOR_TAG = 6
+
+# semantic tags
+#: Standard date/time string (:rfc:`3339`).
+_TAG_DATETIME = 0
+#: Epoch-based date/time.
+_TAG_EPOCH = 1
+#: Unsigned bignum.
+_TAG_UBIGNUM = 2
+#: Negative bignum.
+_TAG_NBIGNUM = 3
+#: Mathematical finite set (IANA registry).
+_TAG_SET = 258
+#: Full-date string (:rfc:`8943`).
+_TAG_DATE = 1004
+
+#: Struct formats (and their initial bytes) tried for floats, shortest first.
+_FLOAT_FORMATS = (
+    (b'\xf9', '>e'),  # half precision
+    (b'\xfa', '>f'),  # single precision
+)
+
+
+def _head(major, value):
+    """Encode initial byte and argument of a data item.
+
+    Args:
+        major (int): major type
+        value (int): argument (length, count, tag or unsigned value)
+
+    Returns:
+        bytes: encoded head of the data item
+
+    """
+    major <<= 5
+    if value < 24:
+        return struct.pack('>B', major | value)
+    if value < 0x100:
+        return struct.pack('>BB', major | 24, value)
+    if value < 0x10000:
+        return struct.pack('>BH', major | 25, value)
+    if value < 0x100000000:
+        return struct.pack('>BI', major | 26, value)
+    return struct.pack('>BQ', major | 27, value)
+
+
+def _integer(value):
+    """Encode an integer data item.
+
+    Args:
+        value (int): integer
+
+    Returns:
+        bytes: encoded data item
+
+    Notes:
+        Integers beyond the 64-bit range are encoded as bignums
+        (tag 2 and tag 3).
+
+    """
+    if value >= 0:
+        major, tag = _MAJOR_UINT, _TAG_UBIGNUM
+    else:
+        major, tag = _MAJOR_NINT, _TAG_NBIGNUM
+        value = -1 - value
+
+    if value < 0x10000000000000000:
+        return _head(major, value)
+
+    text = '%x' % value
+    data = binascii.unhexlify(('0' * (len(text) % 2)) + text)
+    return _head(_MAJOR_TAG, tag) + _head(_MAJOR_BYTES, len(data)) + data
+
+
+def _float(value):
+    """Encode a floating-point data item.
+
+    Args:
+        value (float): float
+
+    Returns:
+        bytes: encoded data item
+
+    Notes:
+        The shortest of half, single and double precision which
+        represents ``value`` losslessly is used.
+
+    """
+    for (code, fmt) in _FLOAT_FORMATS:
+        try:
+            data = struct.pack(fmt, value)
+        except (OverflowError, struct.error):
+            continue
+        if value != value or struct.unpack(fmt, data)[0] == value:  # pylint: disable=comparison-with-itself
+            return code + data
+    return b'\xfb' + struct.pack('>d', value)
+
+
+def _text(value):
+    """Encode a text string data item.
+
+    Args:
+        value (str): text string
+
+    Returns:
+        bytes: encoded data item
+
+    """
+    data = value.encode('utf-8')
+    return _head(_MAJOR_TEXT, len(data)) + data
+
+
+class CBOR(Dumper):
+    """Dump concise binary object representation (CBOR) format file.
+
+    .. code:: python
+
+        >>> dumper = CBOR(file_name)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper(content_dict_2, name=content_name_2)
+        ............
+
+    Attributes:
+        _file (str): output file name
+        _sptr (int): indicates start of appending point (file pointer)
+        _tctr (int): tab level counter
+        _hsrt (bytes): start string (:data:`~dictdumper.cbor._HEADER_START`)
+        _hend (bytes): end string (:data:`~dictdumper.cbor._HEADER_END`)
+        _tstp (bool): encode :obj:`datetime.datetime` as epoch-based
+            timestamps (tag 1) rather than date/time strings (tag 0)
+
+    .. note::
+
+        Terminology:
+
+        .. code::
+
+            value    ::=  uint | nint | bytes | text | array | map
+                            | tag | float | bool | null
+            file     ::=  0xbf (text map)* 0xff
+            map      ::=  head(5, n) (value value){n}
+            array    ::=  head(4, n) value{n} | 0x9f value* 0xff
+            tag      ::=  head(6, tag) value
+            datetime ::=  tag(0, text) | tag(1, uint | nint | float)
+
+    The outermost map is of indefinite length, so that blocks can be
+    appended without rewriting any item count; the break stop code
+    (:data:`~dictdumper.cbor._HEADER_END`) is rewritten after each block.
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        """File format of current dumper.
+
+        :rtype: Literal['cbor']
+        """
+        return 'cbor'
+
+    ##########################################################################
+    # Type codes.
+    ##########################################################################
+
+    #: Tuple[Tuple[type, str]]: Type codes.
+    __type__ = (
+        # text
+        (str_type, 'text'),
+
+        # bytes
+        (bytes_type, 'bytes'),
+        (bytearray, 'bytes'),
+        (memoryview, 'memoryview'),
+
+        # bool
+        (bool, 'bool'),
+
+        # number
+        (int, 'integer'),
+        (float, 'float'),
+
+        # date
+        (datetime.datetime, 'datetime'),
+        (datetime.date, 'date'),
+        (datetime.time, 'time'),
+
+        # map
+        (dict, 'map'),
+        (Mapping, 'map'),
+
+        # array
+        (list, 'array'),
+        (tuple, 'array'),
+        (set, 'set'),
+        (frozenset, 'set'),
+        (ArrayType, 'buffer'),
+        (Iterable, 'array'),
+
+        # null
+        (type(None), 'null'),
+    )
+
+    ##########################################################################
+    # Attributes.
+    ##########################################################################
+
+    __slots__ = ('_tstp',)
+
+    #: CBOR head string.
+    _hsrt = _HEADER_START
+    #: CBOR tail string.
+    _hend = _HEADER_END
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, timestamp=False, **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            timestamp (bool): encode :obj:`datetime.datetime` as epoch-based
+                timestamps (tag 1) rather than date/time strings (tag 0)
+            **kwargs: addition keyword arguments for initialisation
+
+        """
+        super(CBOR, self).__init__(fname, **kwargs)
+
+        #: bool: Encode datetime as epoch-based timestamps.
+        self._tstp = timestamp
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _open(self, mode):
+        """Open the output file in binary mode.
+
+        Args:
+            mode (str): file open mode, e.g. ``'w'`` or ``'r+'``
+
+        Returns:
+            io.BufferedIOBase: the output file object
+
+        """
+        return open(self._file, mode + 'b')
+
+    def _append_value(self, value, file, name):
+        """Call this function to write contents.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            file (io.BufferedRandom): output file
+            name (str): name of current content block
+
+        """
+        file.seek(self._sptr, os.SEEK_SET)
+        self._append_text(str_type(name), file)
+        self._append_map(value, file)
+
+    ##########################################################################
+    # Functions.
+    ##########################################################################
+
+    def _append_map(self, value, file):
+        """Call this function to write map contents.
+
+        Args:
+            value (Mapping[Any, Any]): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(_head(_MAJOR_MAP, len(value)))
+        for (item, text) in value.items():
+            enc_item = self._encode_value(item)
+            func = self._encode_func(enc_item)
+            func(enc_item, file)
+
+            enc_text = self._encode_value(text)
+            func = self._encode_func(enc_text)
+            func(enc_text, file)
+
+    def _append_array(self, value, file):
+        """Call this function to write array contents.
+
+        Args:
+            value (Iterable[Any]): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            Iterables without length (e.g. generators) are written as
+            indefinite-length arrays. Homogeneous numbers are written at
+            once (c.f. :meth:`~dictdumper.dumper.Dumper._numeric`), and
+            other typed arrays are converted in chunks.
+
+        """
+        kind = self._numeric(value)
+        if kind is not None:
+            file.write(_head(_MAJOR_ARRAY, len(value)))
+            for chunk in chunks(value):
+                file.write(b''.join(map(_integer if kind is int else _float, chunk)))
+            return
+
+        sized = isinstance(value, Sized)
+        if sized:
+            file.write(_head(_MAJOR_ARRAY, len(value)))
+        else:
+            file.write(_ARRAY_START)
+        if isinstance(value, ArrayType):
+            value = itertools.chain.from_iterable(chunks(value))
+        for item in value:
+            enc_item = self._encode_value(item)
+            func = self._encode_func(enc_item)
+            func(enc_item, file)
+        if not sized:
+            file.write(_ARRAY_END)
+
+    def _append_buffer(self, value, file):
+        """Call this function to write typed array contents.
+
+        Args:
+            value (Union[array.array, numpy.ndarray]): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            Unlike :meth:`Dumper._append_buffer <dictdumper.dumper.Dumper._append_buffer>`,
+            typed arrays written as arrays are handed to :meth:`_append_array`
+            as is, thus always written as definite-length arrays.
+
+        """
+        if israw(value) or getattr(value, 'ndim', 1) == 0:
+            return super(CBOR, self)._append_buffer(value, file)
+        if self._stat is not None:
+            self._stat.handlers['array'] += 1
+        return self._append_array(value, file)
+
+    def _append_set(self, value, file):
+        """Call this function to write set contents.
+
+        Args:
+            value (Union[Set[Any], FrozenSet[Any]]): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(_head(_MAJOR_TAG, _TAG_SET))
+        self._append_array(value, file)
+
+    def _append_text(self, value, file):
+        """Call this function to write text string contents.
+
+        Args:
+            value (str): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        data = self._render('cbor.text', value, _text)
+        file.write(data)
+
+    def _append_bytes(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write byte string contents.
+
+        Args:
+            value (Union[bytes, bytearray]): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(_head(_MAJOR_BYTES, len(value)))
+        file.write(value)
+
+    def _append_memoryview(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write memoryview contents.
+
+        Args:
+            value (memoryview): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            Contiguous buffers are written as is (by casting to unsigned
+            bytes where necessary) without copying.
+
+        """
+        value = byteview(value)
+        file.write(_head(_MAJOR_BYTES, len(value)))
+        file.write(value)
+
+    def _append_integer(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write integer contents.
+
+        Args:
+            value (int): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            Integers beyond the 64-bit range are encoded as bignums
+            (tag 2 and tag 3).
+
+        """
+        file.write(_integer(value))
+
+    def _append_float(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write float contents.
+
+        Args:
+            value (float): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            The shortest of half, single and double precision which
+            represents ``value`` losslessly is used.
+
+        """
+        file.write(_float(value))
+
+    def _append_datetime(self, value, file):
+        """Call this function to write date/time contents.
+
+        Args:
+            value (datetime.datetime): content to be dumped
+            file (io.BufferedRandom): output file
+
+        Notes:
+            Naive :obj:`datetime.datetime` objects are considered as in UTC.
+
+        """
+        if self._tstp:
+            stamp = calendar.timegm(value.utctimetuple())
+            file.write(_head(_MAJOR_TAG, _TAG_EPOCH))
+            if value.microsecond:
+                self._append_float(stamp + value.microsecond / 1e6, file)
+            else:
+                self._append_integer(stamp, file)
+            return
+
+        text = self._render('isoformat', value, isoformat)
+        if value.utcoffset() is None:
+            text += 'Z'
+        file.write(_head(_MAJOR_TAG, _TAG_DATETIME))
+        self._append_text(text, file)
+
+    def _append_date(self, value, file):
+        """Call this function to write date contents.
+
+        Args:
+            value (datetime.date): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(_head(_MAJOR_TAG, _TAG_DATE))
+        self._append_text(self._render('isoformat', value, isoformat), file)
+
+    def _append_time(self, value, file):
+        """Call this function to write time contents.
+
+        Args:
+            value (datetime.time): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        self._append_text(self._render('isoformat', value, isoformat), file)
+
+    def _append_bool(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write bool contents.
+
+        Args:
+            value (bool): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(b'\xf5' if value else b'\xf4')
+
+    def _append_null(self, value, file):  # pylint: disable=unused-argument,no-self-use
+        """Call this function to write null contents.
+
+        Args:
+            value (None): content to be dumped
+            file (io.BufferedRandom): output file
+
+        """
+        file.write(b'\xf6')
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""streaming compression of outputs
+
+:mod:`dictdumper.compression` contains
+:class:`~dictdumper.compression.CompressedFile` only, which is an
+append-only file object compressing written data as a stream. It is
+enabled by the ``compression`` argument of dumpers. Usage sample is
+described as below.
+
+.. code:: python
+
+    >>> dumper = JSON('capture.json.gz', compression='gzip', compresslevel=6)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.close()  # write file tails
+
+"""
+# Streaming compression of outputs
+# Compress buffered chunks without seeking back
+
+import io
+import locale
+import os
+import zlib
+
+from dictdumper._types import str_type
+
+__all__ = ['CompressedFile', 'FORMATS']
+
+#: Dict[str, str]: File extensions of supported compression formats.
+FORMATS = {
+    'gzip': 'gz',
+    'bz2': 'bz2',
+    'xz': 'xz',
+}
+
+#: Size of buffered chunks fed to compressors.
+_CHUNK_SIZE = 1 << 20
+
+
+def _compressor(compression, level):
+    """Create a compressor object.
+
+    Args:
+        compression (Literal['gzip', 'bz2', 'xz']): compression format
+        level (Optional[int]): compression level, or :data:`None` for
+            the default of the format
+
+    Returns:
+        Any: compressor object with ``compress`` and ``flush`` methods
+
+    Raises:
+        ValueError: unknown compression format
+
+    """
+    if compression == 'gzip':
+        return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+                                zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == 'bz2':
+        import bz2  # pylint: disable=import-outside-toplevel
+        return bz2.BZ2Compressor(9 if level is None else level)
+    if compression == 'xz':
+        import lzma  # pylint: disable=import-outside-toplevel
+        return lzma.LZMACompressor(preset=level)
+    raise ValueError('unknown compression format: %s' % compression)
+
+
+class CompressedFile(object):  # pylint: disable=useless-object-inheritance
+    """Append-only file compressing written data as a stream.
+
+    .. code:: python
+
+        >>> with CompressedFile(file_name, 'w', 'gzip') as file:
+        ...     file.write('text')
+
+    Written data are buffered and fed to the compressor in chunks of at
+    least :data:`_CHUNK_SIZE` bytes, only at block boundaries marked by
+    :meth:`commit`, so that a partially written block can always be
+    truncated. Positions (c.f. :meth:`tell`) are offsets of the
+    uncompressed data, seeking is only supported to the current position,
+    and truncation only within pending chunks. Each open-close
+    cycle in ``'a'`` mode appends a new stream (e.g. gzip member), which
+    decompressors of all supported formats concatenate transparently.
+
+    Attributes:
+        _file (io.BufferedWriter): underlying file
+        _cobj (Any): compressor object
+        _bufs (List[bytes]): pending chunks
+        _blen (int): size of pending chunks
+        _fptr (int): uncompressed position
+        _encd (str): encoding of text data
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def closed(self):
+        """If the file is closed.
+
+        :rtype: bool
+        """
+        return self._file.closed
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def write(self, data):
+        """Write and compress ``data``.
+
+        Args:
+            data (Union[str, bytes]): data to be written, text is encoded
+                with the preferred encoding of the locale
+
+        Returns:
+            int: length of ``data``
+
+        """
+        chunk = data.encode(self._encd) if isinstance(data, str_type) else data
+        self._bufs.append(chunk)
+        self._blen += len(chunk)
+        self._fptr += len(chunk)
+        return len(data)
+
+    def commit(self):
+        """Mark a block boundary, feeding pending chunks to the compressor
+        once they reach :data:`_CHUNK_SIZE` bytes."""
+        if self._blen >= _CHUNK_SIZE:
+            self._drain()
+
+    def tell(self):
+        """Current (uncompressed) position."""
+        return self._fptr
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Seek to current position.
+
+        Args:
+            offset (int): position
+            whence (int): reference point of ``offset``
+
+        Returns:
+            int: current position
+
+        Raises:
+            io.UnsupportedOperation: seeking elsewhere
+
+        """
+        if (whence == os.SEEK_SET and offset == self._fptr) or (whence != os.SEEK_SET and offset == 0):
+            return self._fptr
+        raise io.UnsupportedOperation('compressed output cannot seek')
+
+    def truncate(self, size=None):
+        """Truncate pending chunks not yet fed to the compressor.
+
+        Args:
+            size (Optional[int]): (uncompressed) size, default to current
+                position
+
+        Returns:
+            int: current position
+
+        Raises:
+            io.UnsupportedOperation: truncating data already compressed
+
+        """
+        if size is None or size == self._fptr:
+            return self._fptr
+        if size > self._fptr or size < self._fptr - self._blen:
+            raise io.UnsupportedOperation('compressed output cannot truncate flushed data')
+
+        data = b''.join(self._bufs)[:self._blen - (self._fptr - size)]
+        self._bufs[:] = [data] if data else []
+        self._blen = len(data)
+        self._fptr = size
+        return size
+
+    def flush(self):
+        """Feed pending chunks to the compressor."""
+        self._drain()
+        self._file.flush()
+
+    def close(self):
+        """Finish the compressed stream and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self._drain()
+            self._file.write(self._cobj.flush())
+        finally:
+            self._file.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, path, mode='w', compression='gzip', level=None, offset=0, encoding=None):
+        """Open file.
+
+        Args:
+            path (str): path to the file
+            mode (Literal['w', 'a']): truncate or append to the file
+            compression (Literal['gzip', 'bz2', 'xz']): compression format
+            level (Optional[int]): compression level
+            offset (int): uncompressed position of appending point,
+                i.e. size of uncompressed data in the file
+            encoding (Optional[str]): encoding of text data, default to
+                the preferred encoding of the locale
+
+        """
+        #: Any: Compressor object.
+        self._cobj = _compressor(compression, level)
+        #: io.BufferedWriter: Underlying file.
+        self._file = open(path, mode + 'b')
+        #: List[bytes]: Pending chunks.
+        self._bufs = list()
+        #: int: Size of pending chunks.
+        self._blen = 0
+        #: int: Uncompressed position.
+        self._fptr = offset
+        #: str: Encoding of text data.
+        self._encd = encoding or locale.getpreferredencoding(False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _drain(self):
+        """Feed pending chunks to the compressor."""
+        if not self._bufs:
+            return
+        data = self._cobj.compress(b''.join(self._bufs))
+        if data:
+            self._file.write(data)
+        del self._bufs[:]
+        self._blen = 0
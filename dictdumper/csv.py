@@ -0,0 +1,545 @@
+# -*- coding: utf-8 -*-
+"""dumper a CSV file
+
+:mod:`dictdumper.csv` contains :class:`~dictdumper.csv.CSV`
+only, which dumpers a flattened comma-separated values (CSV)
+or tab-separated values (TSV) file. Usage sample is described
+as below.
+
+.. code:: python
+
+    >>> dumper = CSV(file_name)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.close()
+
+"""
+# Writer for CSV files
+# Dump a flattened CSV file for PCAP analyser
+
+from __future__ import absolute_import, unicode_literals
+
+import collections
+import csv
+import datetime
+import json
+import math
+import os
+import sys
+
+from dictdumper._arrays import ArrayType, chunks, israw, rawview
+from dictdumper._dateutil import isoformat
+from dictdumper._hexlify import hexlify
+from dictdumper._types import Iterable, Mapping, bytes_type, str_type
+from dictdumper.dumper import Dumper
+
+__all__ = ['CSV']
+
+#: CSV head string.
+_HEADER_START = ''
+
+#: CSV tail string.
+_HEADER_END = ''
+
+#: Column name of block names.
+_NAME_COLUMN = 'name'
+
+#: Column name of overflow (unknown) key paths.
+_OVERFLOW_COLUMN = '_overflow'
+
+#: Column names reserved for block names and overflow key paths.
+_RESERVED_COLUMNS = frozenset([_NAME_COLUMN, _OVERFLOW_COLUMN])
+
+
+class CSV(Dumper):
+    """Dump flattened comma-separated values (CSV) format file.
+
+    .. code:: python
+
+        >>> dumper = CSV(file_name)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper(content_dict_2, name=content_name_2)
+        ............
+        >>> dumper.close()
+
+    Each block is flattened into a single row, whose columns are the dotted
+    key paths of the block (e.g. ``ip.src``, ``tcp.flags.syn``). The column
+    schema is inferred from the first ``infer`` blocks and then frozen; key
+    paths unknown to the schema are either spilled into an overflow JSON
+    column (:data:`~dictdumper.csv._OVERFLOW_COLUMN`), or cause the dumper
+    to rotate to a new file (``name.0001.csv``, ``name.0002.csv``, etc.)
+    with an extended schema.
+
+    The ``name`` (:data:`~dictdumper.csv._NAME_COLUMN`) and overflow
+    columns are reserved, thus blocks with top-level keys of the same
+    names (other than non-empty objects) raise :exc:`ValueError`.
+
+    Attributes:
+        _file (str): output file name
+        _sptr (int): indicates start of appending point (file pointer)
+        _tctr (int): tab level counter
+        _hsrt (str): start string (:data:`~dictdumper.csv._HEADER_START`)
+        _hend (str): end string (:data:`~dictdumper.csv._HEADER_END`)
+        _root (str): original output file name
+        _dlmt (str): field delimiter
+        _nblk (int): number of blocks to infer the column schema from
+        _bsiz (int): number of rows to write per batch
+        _ovfl (str): overflow policy for unknown columns
+        _cols (Optional[List[str]]): frozen column schema
+        _cset (FrozenSet[str]): column schema lookup set
+        _rows (List[Dict[str, str]]): pending rows
+        _hdrw (bool): if the header row has been written
+        _rctr (int): file rotation counter
+
+    .. note::
+
+        Rows are buffered and written in batches, thus :meth:`close` (or
+        :meth:`flush`) must be called for the output file to be complete.
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        """File format of current dumper.
+
+        :rtype: Literal['csv', 'tsv']
+        """
+        return 'tsv' if self._dlmt == '\t' else 'csv'
+
+    @property
+    def columns(self):
+        """Frozen column schema (``None`` if not yet inferred).
+
+        :rtype: Optional[List[str]]
+        """
+        if self._cols is None:
+            return None
+        return list(self._cols)
+
+    ##########################################################################
+    # Type codes.
+    ##########################################################################
+
+    #: Tuple[Tuple[type, str]]: Type codes.
+    __type__ = (
+        # string
+        (str_type, 'string'),
+
+        # bool
+        (bool, 'bool'),
+
+        # number
+        (int, 'number'),
+        (float, 'number'),
+
+        # object
+        (dict, 'object'),
+        (Mapping, 'object'),
+
+        # bytes
+        (bytes_type, 'bytes'),
+        (bytearray, 'bytes'),
+        (memoryview, 'bytes'),
+
+        # date
+        (datetime.date, 'date'),
+        (datetime.datetime, 'date'),
+        (datetime.time, 'date'),
+
+        # array
+        (list, 'array'),
+        (tuple, 'array'),
+        (set, 'array'),
+        (frozenset, 'array'),
+        (ArrayType, 'buffer'),
+        (Iterable, 'array'),
+
+        # null
+        (type(None), 'null'),
+    )
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def flush(self):
+        """Write pending rows to the output file.
+
+        If the column schema is not yet frozen, it will be inferred from
+        the pending rows.
+
+        """
+        if not self._rows:
+            return
+        if self._cols is None:
+            self._freeze()
+
+        if self._fobj is None:
+            with self._output('r+') as file:
+                self._dump_rows(file)
+        else:
+            self._dump_rows(self._fobj)
+        del self._rows[:]
+
+    def release(self):
+        """Write all pending rows, then flush and close the held output file."""
+        self.flush()
+        super(CSV, self).release()
+
+    ##########################################################################
+    # Attributes.
+    ##########################################################################
+
+    __slots__ = ('_dlmt', '_nblk', '_bsiz', '_ovfl', '_cols', '_cset', '_rows', '_hdrw')
+
+    #: CSV head string.
+    _hsrt = _HEADER_START
+    #: CSV tail string.
+    _hend = _HEADER_END
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, delimiter=',', infer=100, batch=1000, overflow='column', **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            delimiter (str): field delimiter, use ``'\\t'`` for TSV
+            infer (int): number of blocks to infer the column schema from
+            batch (int): number of rows to write per batch
+            overflow (Literal['column', 'rotate']): policy for key paths
+                unknown to the frozen column schema
+            **kwargs: addition keyword arguments for initialisation
+
+        Raises:
+            ValueError: unknown ``overflow`` policy, or index, resuming
+                or durability requested
+
+        """
+        if overflow not in ('column', 'rotate'):
+            raise ValueError('unknown overflow policy: %s' % overflow)
+        if kwargs.get('index'):
+            raise ValueError('index is not supported by CSV')
+        if kwargs.get('mode') == 'resume':
+            raise ValueError('resume is not supported by CSV')
+        if kwargs.get('durability', 'none') != 'none':
+            raise ValueError('durability is not supported by CSV')
+
+        #: str: Field delimiter.
+        self._dlmt = str(delimiter)
+        #: int: Number of blocks to infer the column schema from.
+        self._nblk = max(infer, 1)
+        #: int: Number of rows to write per batch.
+        self._bsiz = max(batch, 1)
+        #: str: Overflow policy for unknown columns.
+        self._ovfl = overflow
+        #: Optional[List[str]]: Frozen column schema.
+        self._cols = None
+        #: FrozenSet[str]: Column schema lookup set.
+        self._cset = frozenset()
+        #: List[Dict[str, str]]: Pending rows.
+        self._rows = list()
+        #: bool: If the header row has been written.
+        self._hdrw = False
+
+        super(CSV, self).__init__(fname, **kwargs)
+
+    def __call__(self, value, name=None):
+        """Dumper a new block.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            name (str): name of current content block
+
+        Returns:
+            CSV: the dumper class itself (to support chain calling)
+
+        """
+        if self._rott is not None:
+            self._rollover()
+        if self._stat is not None:
+            token = self._stat.start()
+
+        written = False
+        try:
+            row = collections.OrderedDict()
+            row[_NAME_COLUMN] = str_type(name)
+            try:
+                self._append_object(value, row, None)
+            except BaseException:
+                if self._rott is not None:
+                    self._rblk -= 1
+                raise
+
+            if self._cols is None:
+                self._rows.append(row)
+                if len(self._rows) >= self._nblk:
+                    self._freeze()
+            else:
+                extra = [key for key in row if key not in self._cset]
+                if extra:
+                    if self._ovfl == 'column':
+                        spill = collections.OrderedDict((key, row.pop(key)) for key in extra)
+                        row[_OVERFLOW_COLUMN] = json.dumps(spill)
+                    else:
+                        self._rotate(extra)
+
+                self._rows.append(row)
+                if len(self._rows) >= self._bsiz:
+                    self.flush()
+            written = True
+        finally:
+            if self._stat is not None:
+                self._stat.stop(token, written)
+        return self
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _dump_header(self, **kwargs):
+        """Initially dump file heads and tails.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._hdrw = False
+        super(CSV, self)._dump_header(**kwargs)
+
+    def _dump_footer(self):
+        """Finally dump pending rows and file tails of compressed output."""
+        if self._cmpr is not None and not self._cftr:
+            self.flush()
+        super(CSV, self)._dump_footer()
+
+    def _open(self, mode):
+        """Open the output file with universal newlines disabled, i.e. in
+        binary mode on Python 2, as its :mod:`csv` module writes bytes.
+
+        Args:
+            mode (str): file open mode, e.g. ``'w'`` or ``'r+'``
+
+        Returns:
+            io.IOBase: the output file object
+
+        """
+        if sys.version_info.major < 3:
+            return open(self._file, mode + 'b')
+        return open(self._file, mode, newline='')
+
+    def _dump_rows(self, file):
+        """Write pending rows and rewrite file tails.
+
+        Args:
+            file (io.TextIOWrapper): output file
+
+        """
+        file.seek(self._sptr, os.SEEK_SET)
+
+        writer = csv.DictWriter(file, fieldnames=self._cols, restval='',
+                                delimiter=self._dlmt, lineterminator='\n')
+        if not self._hdrw:
+            writer.writeheader()
+            self._hdrw = True
+        writer.writerows(self._rows)
+
+        self._sptr = file.tell()
+        if self._cmpr is None:
+            file.write(self._hend)
+        else:
+            file.commit()
+
+    def _freeze(self):
+        """Infer and freeze the column schema from pending rows."""
+        cols = collections.OrderedDict()
+        cols[_NAME_COLUMN] = None
+        for row in self._rows:
+            for key in row:
+                cols[key] = None
+        if self._ovfl == 'column':
+            cols[_OVERFLOW_COLUMN] = None
+
+        self._cols = list(cols)
+        self._cset = frozenset(self._cols)
+
+    def _rotate(self, extra):
+        """Rotate to a new output file with an extended column schema.
+
+        Args:
+            extra (List[str]): key paths to be appended to the column schema
+
+        """
+        self.rotate()
+
+        self._cols.extend(extra)
+        self._cset = frozenset(self._cols)
+
+    ##########################################################################
+    # Functions.
+    ##########################################################################
+
+    def _append_object(self, value, row, path):
+        """Call this function to flatten object contents.
+
+        Args:
+            value (Mapping[str, Any]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (Optional[str]): key path of ``value``
+
+        Raises:
+            ValueError: top-level key would be written to a reserved column
+                (c.f. :data:`_RESERVED_COLUMNS`)
+
+        """
+        if not value and path is not None:
+            row[path] = ''
+            return
+
+        for (item, text) in value.items():
+            key = str_type(item) if path is None else '%s.%s' % (path, item)
+
+            enc_text = self._encode_value(text)
+            if key in _RESERVED_COLUMNS and not (isinstance(enc_text, Mapping) and enc_text):
+                raise ValueError('key collides with reserved column: %s' % key)
+            func = self._encode_func(enc_text)
+            func(enc_text, row, key)
+
+    def _append_array(self, value, row, path):
+        """Call this function to write array contents as JSON array.
+
+        Args:
+            value (Iterable[Any]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        Notes:
+            As the array is rendered into a single cell, its items are
+            collected before rendering.
+
+        """
+        row[path] = json.dumps(list(value), default=self._json_default)
+
+    def _append_buffer(self, value, row, path):
+        """Call this function to write typed array contents as JSON array.
+
+        Args:
+            value (Union[array.array, numpy.ndarray]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        Notes:
+            NumPy arrays of bytes and structured data types are written as
+            hex strings. Other arrays are converted and rendered in chunks,
+            then joined into a single cell.
+
+        """
+        if israw(value):
+            self._append_bytes(rawview(value), row, path)
+        elif getattr(value, 'ndim', 1) == 0:
+            enc_value = value.tolist()
+            func = self._encode_func(enc_value)
+            func(enc_value, row, path)
+        else:
+            text = (json.dumps(chunk, default=self._json_default)[1:-1] for chunk in chunks(value))
+            row[path] = '[%s]' % ', '.join(text)
+
+    def _append_string(self, value, row, path):  # pylint: disable=no-self-use
+        """Call this function to write string contents.
+
+        Args:
+            value (str): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        row[path] = value
+
+    def _append_bytes(self, value, row, path):
+        """Call this function to write bytes contents as hex string.
+
+        Args:
+            value (Union[bytes, bytearray, memoryview]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        row[path] = self._render('hex', value, hexlify)
+
+    def _append_date(self, value, row, path):
+        """Call this function to write date contents.
+
+        Args:
+            value (Union[datetime.date, datetime.datetime, datetime.time]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        row[path] = self._render('isoformat', value, isoformat)
+
+    def _append_number(self, value, row, path):  # pylint: disable=no-self-use
+        """Call this function to write number contents.
+
+        Args:
+            value (Union[int, float]): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        if isinstance(value, float) and math.isnan(value):
+            row[path] = 'NaN'
+        else:
+            row[path] = str_type(value)
+
+    def _append_bool(self, value, row, path):  # pylint: disable=no-self-use
+        """Call this function to write bool contents.
+
+        Args:
+            value (bool): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        row[path] = 'true' if value else 'false'
+
+    def _append_null(self, value, row, path):  # pylint: disable=unused-argument,no-self-use
+        """Call this function to write null contents.
+
+        Args:
+            value (None): content to be dumped
+            row (Dict[str, str]): flattened row
+            path (str): key path of ``value``
+
+        """
+        row[path] = ''
+
+    def _json_default(self, o):
+        """Convert nested content of arrays for :func:`json.dumps`.
+
+        Args:
+            o (Any): object to convert
+
+        Returns:
+            Any: JSON serialisable object
+
+        """
+        enc = self._encode_value(o)
+        if isinstance(enc, (bytes_type, bytearray, memoryview)):
+            return hexlify(enc)
+        if isinstance(enc, (datetime.date, datetime.datetime, datetime.time)):
+            return isoformat(enc)
+        if isinstance(enc, Mapping):
+            return collections.OrderedDict(enc.items())
+        if isinstance(enc, ArrayType):
+            return hexlify(rawview(enc)) if israw(enc) else enc.tolist()
+        if isinstance(enc, Iterable) and not isinstance(enc, str_type):
+            return list(enc)
+        if enc is not o:
+            return enc
+        return self.default(o)
@@ -12,13 +12,50 @@ which is an abstract base class for all dumpers, eg. :class:`~dictdumper.vuejs.V
 
 import abc
 import collections
+import itertools
 import os
+import sys
 import warnings
 
+from dictdumper._arrays import ArrayType, chunks, israw, numeric, rawview
 from dictdumper._types import str_type
 
 __all__ = ['Dumper']
 
+#: Number of bytes scanned backwards beyond file tails when resuming.
+_RESUME_SCAN = 4096
+
+
+def _instance(value, module, name):
+    """Check type of a value without importing the module of the type.
+
+    Optional features (e.g. :mod:`dictdumper.stats`) are imported only
+    once used, so that plain dumpers load none of them.
+
+    Args:
+        value (Any): value to check
+        module (str): name of the module defining the type
+        name (str): name of the type
+
+    Returns:
+        bool: if ``value`` is an instance of the type, which it cannot be
+        unless ``module`` is imported
+
+    """
+    mod = sys.modules.get(module)
+    return mod is not None and isinstance(value, getattr(mod, name))
+
+
+def _segment_timer():
+    """Start time of a segment (c.f. :data:`dictdumper.rotation.timer`).
+
+    Returns:
+        float: current time of the rotation timer
+
+    """
+    from dictdumper.rotation import timer  # pylint: disable=import-outside-toplevel
+    return timer()
+
 
 def deprecated(cls):
     """Deprecation warning.
@@ -54,6 +91,23 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
         _tctr (int): tab level counter
         _hsrt (str): start string (``_HEADER_START``)
         _hend (str): end string (``_HEADER_END``)
+        _stat (Optional[Stats]): runtime metrics
+        _prof (Optional[Profiler]): key-path profiler
+        _pact (Optional[Profiler]): key-path profiler of current block,
+            if sampled
+        _fobj (Optional[io.IOBase]): output file held open across calls
+        _root (str): output file name of the first segment
+        _rctr (int): segment counter
+        _rott (Optional[Rotation]): rotation policy
+        _rblk (int): number of blocks in current segment
+        _rtim (float): start time of current segment
+        _cmpr (Optional[Tuple[str, Optional[int]]]): compression format
+            and level
+        _cftr (bool): if file tails of compressed output are written
+        _indx (Optional[bytearray]): pending entries of sidecar index
+        _bknd (str): output backend, i.e. ``'file'`` or ``'mmap'``
+        _dura (Optional[GroupCommit]): durability policy
+        _memo (Optional[Memo]): memo of leaf renderings
 
     """
     __metaclass__ = abc.ABCMeta
@@ -79,6 +133,38 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
         """
         return self._file
 
+    @property
+    def stats(self):
+        """Runtime metrics of current dumper, :data:`None` if disabled.
+
+        :rtype: Optional[dictdumper.stats.Stats]
+        """
+        return self._stat
+
+    @property
+    def profiler(self):
+        """Key-path profiler of current dumper, :data:`None` if disabled.
+
+        :rtype: Optional[dictdumper.profiler.Profiler]
+        """
+        return self._prof
+
+    @property
+    def memo(self):
+        """Memo of leaf renderings of current dumper, :data:`None` if disabled.
+
+        :rtype: Optional[dictdumper.memo.Memo]
+        """
+        return self._memo
+
+    @property
+    def held(self):
+        """If the output file is held open across calls.
+
+        :rtype: bool
+        """
+        return self._fobj is not None
+
     ##########################################################################
     # Type codes.
     ##########################################################################
@@ -134,14 +220,87 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
         """
         raise DumperError('unsupported content type: %s' % type(o).__name__)
 
+    def hold(self):
+        """Hold the output file open across calls.
+
+        By default, the output file is opened and closed on each call,
+        thus always kept valid on disk. Once held, it is opened once and
+        writes are buffered until :meth:`release` (or :meth:`close`),
+        saving the cost of reopening the file per block.
+
+        """
+        if self._fobj is None:
+            self._fobj = self._output('r+')
+
+    def release(self):
+        """Flush and close the output file held by :meth:`hold`.
+
+        The dumper resumes at the appending point (:attr:`_sptr`) on the
+        next call, reopening the output file as needed. Pending entries
+        of the sidecar index, if any, are written as well.
+
+        """
+        if self._indx:
+            self._flush_index()
+        if self._fobj is not None:
+            file, self._fobj = self._fobj, None
+            file.close()
+
+    def rotate(self):
+        """Close current segment and start a new output file.
+
+        Segments are named after the output file of the first one, e.g.
+        ``name.json``, ``name.0001.json``, ``name.0002.json``, etc. The
+        rotated segment is then finished as per the rotation policy
+        (c.f. :class:`~dictdumper.rotation.Rotation`), if any.
+
+        Returns:
+            str: output file name of the rotated segment
+
+        """
+        self._dump_footer()
+        held = self.held
+        self.release()
+        if self._dura is not None:
+            self._dura.discard(self)
+
+        path = self._file
+        self._rctr += 1
+        self._file = self._segment(self._rctr)
+        self._rblk = 0
+        self._rtim = 0.0 if self._rott is None else _segment_timer()
+
+        self._dump_header()
+        if held:
+            self.hold()
+        if self._rott is not None:
+            self._rott.submit(path)
+        return path
+
+    def close(self):
+        """Finalise the output file.
+
+        As the output file is kept valid after each call, this only
+        releases the held output file (c.f. :meth:`release`), synchronises
+        it to disk as per the durability policy, and waits for pending
+        compressions of rotated segments by default. For compressed
+        output, file tails are written here.
+
+        """
+        self._dump_footer()
+        self.release()
+        if self._dura is not None:
+            self._dura.discard(self)
+        if self._rott is not None:
+            self._rott.wait()
+
     ##########################################################################
     # Attributes.
     ##########################################################################
 
-    #: :obj:`int`, file pointer: Indicates start of appending point.
-    _sptr = os.SEEK_SET    # seek pointer
-    #: :obj:`int`: Tab level counter.
-    _tctr = 1              # counter for tab level
+    __slots__ = ('_file', '_sptr', '_tctr', '_stat', '_prof', '_pact', '_fobj',
+                 '_root', '_rctr', '_rott', '_rblk', '_rtim', '_cmpr', '_cftr', '_indx',
+                 '_bknd', '_dura', '_memo', '__weakref__')
 
     #: Dumper head string.
     _hsrt = ''
@@ -156,16 +315,155 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
         self = super(Dumper, cls).__new__(cls)
         return self
 
-    def __init__(self, fname, **kwargs):  # pylint: disable=unused-argument
+    def __init__(self, fname, stats=False, profile=None, rotate=None,  # pylint: disable=unused-argument
+                 compression=None, compresslevel=None, index=False, mode='write',
+                 backend='file', durability='none', sync_interval=1.0, memo=None, **kwargs):
         """Initialise dumper.
 
         Args:
             fname (str): output file name
+            stats (Union[bool, Stats]): collect runtime metrics, or a
+                :class:`~dictdumper.stats.Stats` instance to collect
+                metrics into (e.g. shared by multiple dumpers)
+            profile (Union[None, int, Profiler]): profile key paths of
+                every N-th block, or a :class:`~dictdumper.profiler.Profiler`
+                instance to profile into
+            rotate (Optional[Rotation]): rotation policy of output files
+            compression (Optional[Literal['gzip', 'bz2', 'xz']]): compress
+                output files as a stream, whose file tails are written on
+                :meth:`close`
+            compresslevel (Optional[int]): compression level, default to
+                that of the compression format
+            index (bool): write a sidecar index of blocks to
+                ``fname + '.idx'`` (c.f. :mod:`dictdumper.index`), which is
+                complete once the output file is released or closed
+            mode (Literal['write', 'resume']): truncate the output file, or
+                resume appending to an existing well-formed output file
+                (and its latest rotated segment, if any)
+            backend (Literal['file', 'mmap']): write the output file through
+                buffered file objects, or through a memory map (c.f.
+                :class:`~dictdumper.mapped.MappedFile`), which is held open
+                and complete once released or closed
+            durability (Union[str, GroupCommit]): synchronise the output
+                file to disk never (``'none'``), after each block
+                (``'block'``), every ``sync_interval`` seconds
+                (``'interval'``), along with all dumpers of the process
+                (``'group'``, c.f. :data:`dictdumper.durability.GROUP`),
+                or as per a :class:`~dictdumper.durability.GroupCommit`
+                instance
+            sync_interval (float): interval of ``durability='interval'``
+                in seconds
+            memo (Union[None, bool, Memo]): cache renderings of recurring
+                leaf values, or a :class:`~dictdumper.memo.Memo` instance
+                to cache into (e.g. shared by multiple dumpers)
             **kwargs: addition keyword arguments for initialisation
 
+        Raises:
+            ValueError: unknown compression format, mode, backend or
+                durability, compressing output files which are compressed
+                on rotation, resumed, memory-mapped or synchronised,
+                synchronising memory-mapped output files, or resuming a
+                malformed output file
+
         """
+        if mode not in ('write', 'resume'):
+            raise ValueError('unknown mode: %s' % mode)
+        if backend not in ('file', 'mmap'):
+            raise ValueError('unknown backend: %s' % backend)
+        if durability not in ('none', 'block', 'interval', 'group') and \
+                not _instance(durability, 'dictdumper.durability', 'GroupCommit'):
+            raise ValueError('unknown durability: %s' % durability)
+        if compression is not None:
+            if mode == 'resume':
+                raise ValueError('compressed output cannot be resumed')
+            if backend == 'mmap':
+                raise ValueError('compressed output cannot be memory-mapped')
+            if durability != 'none':
+                raise ValueError('compressed output cannot be synchronised before closed')
+            from dictdumper.compression import FORMATS  # pylint: disable=import-outside-toplevel
+            if compression not in FORMATS:
+                raise ValueError('unknown compression format: %s' % compression)
+            if rotate is not None and rotate.compress is not None:
+                raise ValueError('rotated segments of compressed output cannot be compressed again')
+        if backend == 'mmap' and durability != 'none':
+            raise ValueError('memory-mapped output cannot be synchronised before closed')
+
+        #: str: Output file name.
         self._file = fname           # dump file name
-        self._dump_header(**kwargs)  # initialise output file
+        #: int: Indicates start of appending point (file pointer).
+        self._sptr = os.SEEK_SET     # seek pointer
+        #: int: Tab level counter.
+        self._tctr = 1               # counter for tab level
+
+        #: Optional[Stats]: Runtime metrics.
+        self._stat = None
+        if _instance(stats, 'dictdumper.stats', 'Stats'):
+            self._stat = stats
+        elif stats:
+            from dictdumper.stats import Stats  # pylint: disable=import-outside-toplevel
+            self._stat = Stats([('kind', self.kind), ('file', fname)])
+
+        #: Optional[Profiler]: Key-path profiler.
+        self._prof = None
+        if _instance(profile, 'dictdumper.profiler', 'Profiler'):
+            self._prof = profile
+        elif profile:
+            from dictdumper.profiler import Profiler  # pylint: disable=import-outside-toplevel
+            self._prof = Profiler(profile)
+        #: Optional[Profiler]: Key-path profiler of current block, if sampled.
+        self._pact = None
+        #: Optional[io.IOBase]: Output file held open across calls.
+        self._fobj = None
+
+        #: str: Output file name of the first segment.
+        self._root = fname
+        #: int: Segment counter.
+        self._rctr = 0
+        #: Optional[Rotation]: Rotation policy.
+        self._rott = rotate
+        #: int: Number of blocks in current segment.
+        self._rblk = 0
+        #: float: Start time of current segment.
+        self._rtim = 0.0 if rotate is None else _segment_timer()
+
+        #: Optional[Tuple[str, Optional[int]]]: Compression format and level.
+        self._cmpr = None if compression is None else (compression, compresslevel)
+        #: bool: If file tails of compressed output are written.
+        self._cftr = False
+        #: Optional[bytearray]: Pending entries of sidecar index.
+        self._indx = bytearray() if index else None
+        #: str: Output backend.
+        self._bknd = backend
+        #: Optional[GroupCommit]: Durability policy.
+        self._dura = None
+        if durability not in ('none', 'block', 'interval', 'group'):
+            self._dura = durability
+        elif durability != 'none':
+            from dictdumper.durability import GROUP, GroupCommit  # pylint: disable=import-outside-toplevel
+            if durability == 'block':
+                self._dura = GroupCommit(blocks=1)
+            elif durability == 'interval':
+                self._dura = GroupCommit(interval=sync_interval)
+            else:
+                self._dura = GROUP
+        #: Optional[Memo]: Memo of leaf renderings.
+        self._memo = None
+        if _instance(memo, 'dictdumper.memo', 'Memo'):
+            self._memo = memo
+        elif memo:
+            from dictdumper.memo import Memo  # pylint: disable=import-outside-toplevel
+            self._memo = Memo()
+
+        if mode == 'resume':
+            while self._exists(self._segment(self._rctr + 1)):
+                self._rctr += 1
+            self._file = self._segment(self._rctr)
+        if mode == 'resume' and os.path.isfile(self._file) and os.path.getsize(self._file):
+            self._resume_header(**kwargs)  # recover appending point
+        else:
+            self._dump_header(**kwargs)  # initialise output file
+        if backend == 'mmap':
+            self.hold()
 
     def __call__(self, value, name=None):
         """Dumper a new block.
@@ -178,12 +476,42 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
             Dumper: the dumper class itself (to support chain calling)
 
         """
-        with open(self._file, 'r+') as file:
-            self._append_value(value, file, name)
-            self._sptr = file.tell()
-            file.write(self._hend)
+        if self._rott is not None:
+            self._rollover()
+        if self._stat is not None:
+            token = self._stat.start()
+        if self._prof is not None:
+            self._pact = self._prof if self._prof.sample() else None
+        dura = self._dura
+        if dura is not None:
+            dura.enter(self)
+        written = False
+        try:
+            if self._fobj is None:
+                with self._output('r+') as file:
+                    self._dump_block(value, file, name)
+                    if dura is not None:
+                        dura.mark(self, file)
+            else:
+                self._dump_block(value, self._fobj, name)
+                if dura is not None:
+                    dura.mark(self, self._fobj)
+            written = True
+        except BaseException:
+            if dura is not None:
+                dura.leave(self)
+            raise
+        finally:
+            if self._stat is not None:
+                self._stat.stop(token, written)
         return self
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     ##########################################################################
     # Utilities.
     ##########################################################################
@@ -195,11 +523,284 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
             **kwargs: Arbitrary keyword arguments.
 
         """
-        with open(self._file, 'w') as file:
+        if self._indx is not None:
+            from dictdumper import index  # pylint: disable=import-outside-toplevel
+            del self._indx[:]
+            index.dump_header(index.index_path(self._file), self.kind)
+
+        if self._cmpr is not None:
+            self._cftr = False
+            self._fobj = self._output('w')
+            self._fobj.write(self._hsrt)
+            self._sptr = self._fobj.tell()
+            return
+
+        with self._output('w') as file:
             file.write(self._hsrt)
             self._sptr = file.tell()
             file.write(self._hend)
 
+    def _resume_header(self, **kwargs):  # pylint: disable=unused-argument
+        """Recover appending point from an existing output file.
+
+        The file tail is looked up by scanning backwards from the end of
+        file, over trailing whitespaces (and null paddings of memory-mapped
+        output), so that the cost is proportional to the tail size rather
+        than the file size. The tail is rewritten to drop such paddings.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Raises:
+            ValueError: file tail not found
+
+        """
+        tail = self._hend if isinstance(self._hend, bytes) else self._hend.encode('utf-8')
+        with open(self._file, 'rb+') as file:
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+
+            # skip null paddings of memory-mapped output not truncated
+            while size:
+                file.seek(max(size - _RESUME_SCAN, 0), os.SEEK_SET)
+                data = file.read(min(size, _RESUME_SCAN)).rstrip(b'\x00')
+                if data:
+                    size -= min(size, _RESUME_SCAN) - len(data)
+                    break
+                size = max(size - _RESUME_SCAN, 0)
+
+            file.seek(max(size - len(tail) - _RESUME_SCAN, 0), os.SEEK_SET)
+            data = file.read(size - file.tell())
+
+            mark = tail.rstrip()
+            tptr = data.rfind(mark)
+            if tptr == -1 or data[tptr + len(mark):].strip():
+                raise ValueError('malformed output file: %s' % self._file)
+            self._sptr = size - len(data) + tptr
+
+            file.seek(self._sptr, os.SEEK_SET)
+            file.write(tail)
+            file.truncate()
+
+        if self._indx is not None:
+            from dictdumper import index  # pylint: disable=import-outside-toplevel
+            if not os.path.isfile(index.index_path(self._file)):
+                index.dump_header(index.index_path(self._file), self.kind)
+
+    def _dump_block(self, value, file, name):
+        """Dump a new block and rewrite file tails.
+
+        Blocks are transactional, i.e. if any exception is raised while
+        dumping, the output file and counters are rolled back to the last
+        block (c.f. :meth:`_rollback`), before the exception is re-raised.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            file (io.IOBase): output file
+            name (str): name of current content block
+
+        """
+        start = self._sptr
+        state = self._checkpoint()
+        try:
+            self._append_value(value, file, name)
+        except BaseException:
+            self._rollback(file, state)
+            raise
+        self._sptr = file.tell()
+        if self._cmpr is None:
+            file.write(self._hend)
+        else:
+            file.commit()
+
+        if self._indx is not None:
+            from dictdumper import index  # pylint: disable=import-outside-toplevel
+            self._indx += index.pack_entry(name, start, self._sptr)
+            if len(self._indx) >= index._BUFFER_SIZE:  # pylint: disable=protected-access
+                self._flush_index()
+
+    def _checkpoint(self):
+        """Save counters before dumping a block.
+
+        Returns:
+            Tuple[int, ...]: appending point and tab level counter, followed
+            by counters of subclasses, if any
+
+        """
+        return (self._sptr, self._tctr)
+
+    def _rollback(self, file, state):
+        """Roll back a partially dumped block.
+
+        The output file is truncated to the appending point of the last
+        block with file tails rewritten, and counters are restored.
+
+        Args:
+            file (io.IOBase): output file
+            state (Tuple[int, ...]): counters saved by :meth:`_checkpoint`
+
+        """
+        self._sptr, self._tctr = state[:2]
+        if self._rott is not None:
+            self._rblk -= 1
+
+        if self._cmpr is None:
+            file.seek(self._sptr, os.SEEK_SET)
+            file.write(self._hend)
+            file.truncate()
+        else:
+            file.truncate(self._sptr)
+
+    def _dump_footer(self):
+        """Finally dump file tails of compressed output.
+
+        As compressed output cannot seek back, file tails are written
+        only once, i.e. on :meth:`close` or :meth:`rotate`.
+
+        """
+        if self._cmpr is None or self._cftr:
+            return
+
+        self.hold()
+        self._fobj.write(self._hend)
+        self._cftr = True
+
+    def _flush_index(self):
+        """Append pending entries to the sidecar index."""
+        from dictdumper import index  # pylint: disable=import-outside-toplevel
+        with open(index.index_path(self._file), 'ab') as file:
+            file.write(self._indx)
+        del self._indx[:]
+
+    def _rollover(self):
+        """Rotate if current segment is due, then count a new block.
+
+        Segments are checked before the next block rather than after the
+        last one, so that no empty segment is left when closing.
+
+        """
+        rott = self._rott
+        if self._rblk and rott.due(self._rblk, 0 if rott.size is None else self._size(), self._rtim):
+            self.rotate()
+        self._rblk += 1
+
+    def _sync(self, file=None):
+        """Synchronise the output file to disk.
+
+        Args:
+            file (Optional[io.IOBase]): open file object of the output
+                file, default to the held one, if any
+
+        """
+        from dictdumper.durability import fsync  # pylint: disable=import-outside-toplevel
+        fsync(self._file, self._fobj if file is None else file)
+
+    def _segment(self, ctr):
+        """Output file name of a segment.
+
+        Args:
+            ctr (int): segment counter
+
+        Returns:
+            str: output file name, e.g. ``name.0001.json``
+
+        """
+        if not ctr:
+            return self._root
+        root, ext = os.path.splitext(self._root)
+        if self._cmpr is not None:
+            from dictdumper.compression import FORMATS  # pylint: disable=import-outside-toplevel
+            if ext == '.' + FORMATS[self._cmpr[0]]:
+                root, base = os.path.splitext(root)
+                ext = base + ext
+        return '%s.%04d%s' % (root, ctr, ext)
+
+    def _exists(self, path):
+        """Check if a segment exists, possibly compressed on rotation.
+
+        Args:
+            path (str): output file name of the segment
+
+        Returns:
+            bool: if the segment exists
+
+        """
+        if os.path.exists(path):
+            return True
+        from dictdumper.compression import FORMATS  # pylint: disable=import-outside-toplevel
+        return any(os.path.exists('%s.%s' % (path, ext)) for ext in FORMATS.values())
+
+    def _size(self):
+        """Size of current segment, as of the last block.
+
+        Returns:
+            int: size of the output file in bytes
+
+        """
+        return self._sptr + len(self._hend)
+
+    def _open(self, mode):
+        """Open the output file.
+
+        Args:
+            mode (str): file open mode, e.g. ``'w'`` or ``'r+'``
+
+        Returns:
+            io.IOBase: the output file object
+
+        """
+        return open(self._file, mode)
+
+    def _output(self, mode):
+        """Open the output file, tracing its I/O if metrics are enabled.
+
+        Args:
+            mode (str): file open mode, e.g. ``'w'`` or ``'r+'``
+
+        Returns:
+            io.IOBase: the output file object
+
+        """
+        if self._cmpr is not None:
+            opener = self._compress
+        elif self._bknd == 'mmap':
+            opener = self._map
+        else:
+            opener = self._open
+        if self._stat is None:
+            return opener(mode)
+        return self._stat.open(opener, mode)
+
+    def _map(self, mode):
+        """Open the output file through a memory map.
+
+        Args:
+            mode (str): file open mode, i.e. ``'w'`` or ``'r+'``
+
+        Returns:
+            MappedFile: the output file object
+
+        """
+        from dictdumper.mapped import MappedFile  # pylint: disable=import-outside-toplevel
+        return MappedFile(self._file, mode)
+
+    def _compress(self, mode):
+        """Open the output file as a compressed stream.
+
+        Args:
+            mode (str): file open mode, i.e. ``'w'`` to truncate, or
+                ``'r+'`` to append a new stream at the appending point
+
+        Returns:
+            CompressedFile: the output file object
+
+        """
+        from dictdumper.compression import CompressedFile  # pylint: disable=import-outside-toplevel
+        compression, level = self._cmpr
+        if mode == 'w':
+            return CompressedFile(self._file, 'w', compression, level)
+        return CompressedFile(self._file, 'a', compression, level, offset=self._sptr)
+
     def _encode_func(self, o):
         """Check content type for function call.
 
@@ -217,7 +818,11 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
                 name = code
                 break
         if name is None:
+            if self._stat is not None:
+                self._stat.defaults += 1
             name = self.default(o)  # pylint: disable=assignment-from-no-return
+        if self._stat is not None:
+            self._stat.handlers[name] += 1
 
         func = '_append_%s' % name
         return getattr(self, func)
@@ -235,7 +840,79 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
             The function is a direct wrapper for :meth:`~Dumper.object_hook`.
 
         """
-        return self.object_hook(o)
+        enc = self.object_hook(o)
+        if self._stat is not None and enc is not o:
+            self._stat.hooks += 1
+        return enc
+
+    def _render(self, code, value, func):
+        """Render a leaf value, through the memo if enabled.
+
+        Args:
+            code (str): name of the rendering
+            value (Any): value to render
+            func (Callable[[Any], Union[str, bytes]]): rendering function
+
+        Returns:
+            Union[str, bytes]: rendering of ``value``
+
+        """
+        if self._memo is None:
+            return func(value)
+        return self._memo.render(code, value, func)
+
+    def _numeric(self, value, dispatch=True):
+        """Check if contents are homogeneous numbers to be written in bulk.
+
+        Args:
+            value (Any): content to check
+            dispatch (bool): if items are counted as dispatched to handlers
+                in runtime metrics
+
+        Returns:
+            Optional[type]: :obj:`int` if ``value`` is a non-empty :obj:`list`,
+            :obj:`tuple` or one-dimensional typed array (c.f.
+            :meth:`~Dumper._append_buffer`) of integers only, :obj:`float` if of
+            finite floats only, or :data:`None` otherwise
+
+        Notes:
+            Items are checked by exact types, thus :obj:`bool` and other
+            subclasses never qualify; typed arrays are checked by their type
+            codes. Floats are checked for NaN and infinity at once, by their
+            sum or vectorised with NumPy. As items of such contents bypass
+            :meth:`~Dumper._encode_value` and :meth:`~Dumper._encode_func`,
+            :data:`None` is always returned if :meth:`~Dumper.object_hook` is
+            overridden; runtime metrics are counted as if they were not.
+
+        """
+        if type(self).object_hook != Dumper.object_hook:
+            return None
+
+        if type(value) in (list, tuple):  # pylint: disable=unidiomatic-typecheck
+            if not value:
+                return None
+            kind = type(value[0])
+            if kind not in (int, float):
+                return None
+            if set(map(type, value)) != {kind}:
+                return None
+            if kind is float:
+                total = sum(value)
+                if total - total != 0.0:  # NaN, infinity or overflow
+                    return None
+        elif isinstance(value, ArrayType):
+            kind = numeric(value)
+            if kind is None:
+                return None
+        else:
+            return None
+
+        if self._stat is not None and dispatch:
+            for (test, code) in self.__type__:
+                if issubclass(kind, test):
+                    break
+            self._stat.handlers[code] += len(value)  # pylint: disable=undefined-loop-variable
+        return kind
 
     @abc.abstractmethod
     def _append_value(self, value, file, name):
@@ -247,3 +924,37 @@ class Dumper(object):  # pylint: disable=metaclass-assignment,useless-object-inh
             name (str): name of current content block
 
         """
+
+    def _append_buffer(self, value, file):
+        """Call this function to write typed array contents.
+
+        Args:
+            value (Union[array.array, numpy.ndarray]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            NumPy arrays of bytes and structured data types are written as
+            binary data, viewed without copying if C-contiguous. Zero-dimensional
+            arrays are written as their only items. One-dimensional arrays of
+            numbers are handed to the array handler as is, thus written in
+            bulk (c.f. :meth:`~Dumper._numeric`); others are converted to
+            Python objects in chunks along the first axis.
+
+        """
+        if israw(value):
+            value = rawview(value)
+        elif getattr(value, 'ndim', 1) == 0:
+            value = value.tolist()
+        elif numeric(value) is None or type(self).object_hook != Dumper.object_hook:
+            value = itertools.chain.from_iterable(chunks(value))
+        else:
+            for (kind, name) in self.__type__:
+                if issubclass(list, kind):
+                    break
+            if self._stat is not None:
+                self._stat.handlers[name] += 1  # pylint: disable=undefined-loop-variable
+            func = getattr(self, '_append_%s' % name)  # pylint: disable=undefined-loop-variable
+            return func(value, file)
+
+        func = self._encode_func(value)
+        return func(value, file)
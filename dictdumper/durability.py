@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""durability policy of dumpers
+
+:mod:`dictdumper.durability` contains
+:class:`~dictdumper.durability.GroupCommit` only, which decides when
+output files are synchronised to disk (c.f. :func:`os.fsync`). It is
+enabled by the ``durability`` argument of dumpers. Usage sample is
+described as below.
+
+.. code:: python
+
+    >>> dumper_1 = JSON('flow_1.json', durability='group')
+    >>> dumper_2 = JSON('flow_2.json', durability='group')
+    >>> dumper_1(content_dict_1, name=content_name_1)
+    >>> dumper_2(content_dict_2, name=content_name_2)
+    ............
+
+Dumpers with ``durability='group'`` share the process-wide
+:data:`GROUP`, which synchronises all output files written since the
+last commit at once, every :data:`_GROUP_BLOCKS` blocks or
+:data:`_GROUP_INTERVAL` seconds, whichever comes first.
+
+"""
+# Durability policy of dumpers
+# Synchronise output files per block, per interval or per group
+
+import os
+import threading
+import weakref
+
+from dictdumper.rotation import timer
+
+__all__ = ['GroupCommit', 'GROUP']
+
+#: Number of blocks per commit of the process-wide group.
+_GROUP_BLOCKS = 1000
+
+#: Maximum interval between commits of the process-wide group in seconds.
+_GROUP_INTERVAL = 0.1
+
+
+def fsync(path, file=None):
+    """Synchronise an output file to disk.
+
+    Args:
+        path (str): path to the output file
+        file (Optional[io.IOBase]): open file object of the output file,
+            to be flushed and synchronised through
+
+    """
+    if file is not None:
+        file.flush()
+        os.fsync(file.fileno())
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class GroupCommit(object):  # pylint: disable=useless-object-inheritance
+    """Commit policy of output files.
+
+    .. code:: python
+
+        >>> group = GroupCommit(blocks=100, interval=0.05)
+        >>> dumper = Tree(file_name, durability=group)
+
+    Dumpers mark their output files dirty after each block, and once
+    ``blocks`` blocks are written or ``interval`` seconds elapse since
+    the last commit, as checked on each block, all dirty output files
+    are flushed and synchronised to disk. As blocks are written along
+    with file tails, output files on disk always end with valid tails
+    after each commit. Dumpers in the middle of a block (c.f.
+    :meth:`enter`) are never synchronised by others; they are synchronised
+    at the end of their own blocks instead. Idle dumpers are synchronised
+    on :meth:`Dumper.close <dictdumper.dumper.Dumper.close>`.
+
+    Attributes:
+        blocks (Optional[int]): maximum number of blocks per commit
+        interval (Optional[float]): maximum interval between commits
+            in seconds
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def enter(self, dumper):
+        """Mark a dumper as in the middle of a block.
+
+        Args:
+            dumper (Dumper): dumper to write a block
+
+        """
+        with self._lock:
+            self._busy.add(dumper)
+
+    def leave(self, dumper, file=None):
+        """Mark a dumper as at a block boundary, e.g. after a failed block.
+
+        Output files of which commits have been deferred while the dumper
+        was in the middle of a block are synchronised.
+
+        Args:
+            dumper (Dumper): dumper which has left a block
+            file (Optional[io.IOBase]): open file object of the output file
+
+        """
+        with self._lock:
+            self._busy.discard(dumper)
+            if dumper in self._owed:
+                self._owed.discard(dumper)
+                dumper._sync(file)  # pylint: disable=protected-access
+
+    def mark(self, dumper, file=None):
+        """Mark output file of a dumper dirty, and commit if due.
+
+        Args:
+            dumper (Dumper): dumper which has written a block
+            file (Optional[io.IOBase]): open file object of the output file
+
+        """
+        with self._lock:
+            self._busy.discard(dumper)
+            if dumper in self._owed:
+                self._owed.discard(dumper)
+                self._dirt.pop(dumper, None)
+                dumper._sync(file)  # pylint: disable=protected-access
+                return
+
+            self._dirt[dumper] = None
+            self._bctr += 1
+            if self.blocks is not None and self._bctr >= self.blocks:
+                due = True
+            else:
+                due = self.interval is not None and timer() - self._last >= self.interval
+            if due:
+                self._commit(dumper, file)
+
+    def commit(self):
+        """Synchronise all dirty output files to disk."""
+        with self._lock:
+            self._commit()
+
+    def discard(self, dumper):
+        """Synchronise and forget output file of a dumper.
+
+        Args:
+            dumper (Dumper): dumper to be discarded
+
+        """
+        with self._lock:
+            self._busy.discard(dumper)
+            if dumper in self._dirt or dumper in self._owed:
+                self._dirt.pop(dumper, None)
+                self._owed.discard(dumper)
+                dumper._sync()  # pylint: disable=protected-access
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, blocks=None, interval=None):
+        """Initialise commit policy.
+
+        Args:
+            blocks (Optional[int]): maximum number of blocks per commit
+            interval (Optional[float]): maximum interval between commits
+                in seconds
+
+        """
+        #: Optional[int]: Maximum number of blocks per commit.
+        self.blocks = None if blocks is None else max(int(blocks), 1)
+        #: Optional[float]: Maximum interval between commits in seconds.
+        self.interval = interval
+
+        #: WeakKeyDictionary[Dumper, None]: Dumpers with dirty output files.
+        self._dirt = weakref.WeakKeyDictionary()
+        #: WeakSet[Dumper]: Dumpers in the middle of a block.
+        self._busy = weakref.WeakSet()
+        #: WeakSet[Dumper]: Dumpers of which commits are deferred to their block boundaries.
+        self._owed = weakref.WeakSet()
+        #: int: Number of blocks since the last commit.
+        self._bctr = 0
+        #: float: Time of the last commit.
+        self._last = timer()
+        #: threading.RLock: Lock of dirty dumpers and counters.
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return 'GroupCommit(blocks=%r, interval=%r)' % (self.blocks, self.interval)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _commit(self, current=None, file=None):
+        """Synchronise all dirty output files, with lock held.
+
+        Output files of dumpers in the middle of a block are not touched,
+        but synchronised once the dumpers leave their blocks (c.f.
+        :meth:`mark` and :meth:`leave`).
+
+        Args:
+            current (Optional[Dumper]): dumper of which ``file`` is open
+            file (Optional[io.IOBase]): open file object of ``current``
+
+        """
+        dumpers = list(self._dirt.keys())
+        self._dirt.clear()
+        self._bctr = 0
+        self._last = timer()
+        for dumper in dumpers:
+            if dumper is current:
+                dumper._sync(file)  # pylint: disable=protected-access
+            elif dumper in self._busy:
+                self._owed.add(dumper)
+            else:
+                dumper._sync()  # pylint: disable=protected-access
+
+
+#: GroupCommit: Process-wide group of dumpers with ``durability='group'``.
+GROUP = GroupCommit(blocks=_GROUP_BLOCKS, interval=_GROUP_INTERVAL)
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+"""dumper a HTML file
+
+:mod:`dictdumper.html` contains :class:`~dictdumper.html.HTML`
+only, which dumpers a static hypertext markup language (HTML)
+viewer file, loading and rendering blocks on demand. Usage sample
+is described as below.
+
+.. code:: python
+
+    >>> dumper = HTML(file_name)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+
+"""
+# Writer for HTML files
+# Dump a static HTML viewer for PCAP analyser
+
+from __future__ import absolute_import, unicode_literals
+
+import base64
+import io
+import json
+import os
+import xml.sax.saxutils
+
+from dictdumper._types import str_type
+from dictdumper.json import JSON
+
+__all__ = ['HTML']
+
+#: HTML head string.
+_HEADER_START = '''\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>DictDumper</title>
+<style>
+html, body { height: 100%; margin: 0; font-family: monospace; font-size: 13px; }
+#dd-app { display: flex; height: 100%; }
+#dd-side { display: flex; flex-direction: column; width: 30%; min-width: 200px; border-right: 1px solid #ccc; }
+#dd-filter { margin: 4px; padding: 2px 4px; }
+#dd-list { flex: 1; overflow-y: auto; }
+#dd-list > .dd-spacer { position: relative; }
+.dd-row { position: absolute; left: 0; right: 0; height: 20px; line-height: 20px; padding: 0 6px;
+          overflow: hidden; white-space: nowrap; text-overflow: ellipsis; cursor: pointer; }
+.dd-row:hover { background: #eef; }
+.dd-row.dd-active { background: #ccf; }
+#dd-view { flex: 1; overflow: auto; padding: 6px 18px; }
+#dd-view details, #dd-view .dd-leaf { margin-left: 1.2em; }
+#dd-view summary { margin-left: -1.2em; cursor: pointer; }
+#dd-view .dd-leaf { white-space: pre-wrap; }
+.dd-key { color: #881391; }
+.dd-str { color: #c41a16; }
+.dd-num { color: #1c00cf; }
+.dd-lit { color: #0d22aa; font-weight: bold; }
+</style>
+<script>
+var DictDumper = (function () {
+  'use strict';
+
+  var ROW = 20, OVERSCAN = 8, CACHE = 16;
+  var blocks = [], shown = [], active = -1;
+  var chunks = {}, order = [], pending = {};
+  var list, spacer, view, frame = 0;
+
+  function decode(text) {
+    var raw = atob(text.trim()), bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+    return JSON.parse(new TextDecoder('utf-8').decode(bytes));
+  }
+
+  function chunk(src, data) {
+    if (!chunks.hasOwnProperty(src)) {
+      order.push(src);
+      if (order.length > CACHE) delete chunks[order.shift()];
+    }
+    chunks[src] = data;
+    var callbacks = pending[src] || [];
+    delete pending[src];
+    callbacks.forEach(function (callback) { callback(data); });
+  }
+
+  function load(index, callback) {
+    var entry = blocks[index], src = entry.getAttribute('data-chunk');
+    if (src === null) return callback(decode(entry.textContent));
+
+    var pos = +entry.getAttribute('data-index');
+    if (chunks.hasOwnProperty(src)) return callback(chunks[src][pos]);
+    if (pending.hasOwnProperty(src)) return pending[src].push(function (data) { callback(data[pos]); });
+
+    pending[src] = [function (data) { callback(data[pos]); }];
+    var script = document.createElement('script');
+    script.src = src;
+    script.onload = function () { script.remove(); };
+    script.onerror = function () {
+      script.remove();
+      delete pending[src];
+      view.textContent = 'failed to load ' + src;
+    };
+    document.head.appendChild(script);
+  }
+
+  function label(key) {
+    var span = document.createElement('span');
+    span.className = 'dd-key';
+    span.textContent = key + ': ';
+    return span;
+  }
+
+  function node(key, value) {
+    if (value !== null && typeof value === 'object') {
+      var keys = Object.keys(value);
+      var details = document.createElement('details'), summary = document.createElement('summary');
+      summary.appendChild(label(key));
+      summary.appendChild(document.createTextNode(
+        Array.isArray(value) ? '[' + keys.length + ']' : '{' + keys.length + '}'));
+      details.appendChild(summary);
+      details.addEventListener('toggle', function expand() {
+        if (!details.open) return;
+        details.removeEventListener('toggle', expand);
+        keys.forEach(function (item) { details.appendChild(node(item, value[item])); });
+      });
+      return details;
+    }
+
+    var div = document.createElement('div'), span = document.createElement('span');
+    if (typeof value === 'string') {
+      span.className = 'dd-str';
+      span.textContent = JSON.stringify(value);
+    } else {
+      span.className = typeof value === 'number' ? 'dd-num' : 'dd-lit';
+      span.textContent = String(value);
+    }
+    div.className = 'dd-leaf';
+    div.appendChild(label(key));
+    div.appendChild(span);
+    return div;
+  }
+
+  function paint() {
+    frame = 0;
+    var first = Math.max(0, Math.floor(list.scrollTop / ROW) - OVERSCAN);
+    var last = Math.min(shown.length, Math.ceil((list.scrollTop + list.clientHeight) / ROW) + OVERSCAN);
+
+    var fragment = document.createDocumentFragment();
+    for (var i = first; i < last; i++) {
+      var row = document.createElement('div'), index = shown[i];
+      row.className = index === active ? 'dd-row dd-active' : 'dd-row';
+      row.style.top = (i * ROW) + 'px';
+      row.textContent = blocks[index].getAttribute('data-name');
+      row.setAttribute('data-block', index);
+      fragment.appendChild(row);
+    }
+    spacer.textContent = '';
+    spacer.appendChild(fragment);
+  }
+
+  function schedule() {
+    if (!frame) frame = requestAnimationFrame(paint);
+  }
+
+  function select(index) {
+    active = index;
+    schedule();
+    view.textContent = 'loading...';
+    load(index, function (data) {
+      if (active !== index) return;
+      var root = node(blocks[index].getAttribute('data-name'), data);
+      view.textContent = '';
+      view.appendChild(root);
+      root.open = true;
+    });
+  }
+
+  function filter(text) {
+    shown = [];
+    for (var i = 0; i < blocks.length; i++) {
+      if (!text || blocks[i].getAttribute('data-name').indexOf(text) !== -1) shown.push(i);
+    }
+    spacer.style.height = (shown.length * ROW) + 'px';
+    list.scrollTop = 0;
+    schedule();
+  }
+
+  document.addEventListener('DOMContentLoaded', function () {
+    blocks = Array.prototype.slice.call(document.querySelectorAll('script.dd-block'));
+    list = document.getElementById('dd-list');
+    spacer = list.firstElementChild;
+    view = document.getElementById('dd-view');
+
+    list.addEventListener('scroll', schedule);
+    window.addEventListener('resize', schedule);
+    spacer.addEventListener('click', function (event) {
+      var row = event.target.closest('.dd-row');
+      if (row) select(+row.getAttribute('data-block'));
+    });
+    document.getElementById('dd-filter').addEventListener('input', function (event) {
+      filter(event.target.value);
+    });
+    filter('');
+  });
+
+  return { chunk: chunk };
+})();
+</script>
+</head>
+<body>
+<div id="dd-app">
+<div id="dd-side">
+<input id="dd-filter" type="search" placeholder="filter blocks by name">
+<div id="dd-list"><div class="dd-spacer"></div></div>
+</div>
+<div id="dd-view">select a block to view</div>
+</div>
+'''
+
+#: HTML tail string.
+_HEADER_END = '''\
+</body>
+</html>
+'''
+
+#: Chunk file head string.
+_CHUNK_START = 'DictDumper.chunk(%s, [\n'
+
+#: Chunk file tail string.
+_CHUNK_END = '\n]);\n'
+
+
+def _quote(value):
+    """Escape string as HTML attribute value.
+
+    Args:
+        value (str): string to escape
+
+    Returns:
+        str: escaped string
+
+    """
+    return xml.sax.saxutils.escape(value, {'"': '&quot;'})
+
+
+class HTML(JSON):
+    """Dump static hypertext markup language (HTML) viewer file.
+
+    .. code:: python
+
+        >>> dumper = HTML(file_name)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper(content_dict_2, name=content_name_2)
+        ............
+
+    Each block is rendered as a JSON object, and then either written to
+    chunk files (``name.chunks/chunk_000001.js``, etc.) which are loaded
+    by the viewer on demand, or embedded inline as Base64 encoded
+    ``<script type="application/json">`` segments which are decoded by
+    the viewer on demand. The viewer lists block names with virtual
+    scrolling and renders the selected block as a collapsible tree.
+
+    Attributes:
+        _file (str): output file name
+        _sptr (int): indicates start of appending point (file pointer)
+        _tctr (int): tab level counter
+        _hsrt (str): start string (:data:`~dictdumper.html._HEADER_START`)
+        _hend (str): end string (:data:`~dictdumper.html._HEADER_END`)
+        _vctr (array.array): value counter stack, indexed by tab level
+        _inln (bool): if embed blocks inline
+        _csiz (int): number of blocks per chunk file
+        _cdir (str): directory of chunk files
+        _cidx (int): index of current chunk file
+        _cctr (int): number of blocks in current chunk file
+        _cptr (int): indicates start of appending point of current chunk file
+
+    .. note::
+
+        Chunk files are JavaScript files (i.e. JSONP) rather than plain
+        JSON files, since browsers refuse to ``fetch`` local files from
+        ``file://`` pages, whilst ``<script>`` elements are always allowed.
+        Thus, the viewer works offline without a server.
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        """File format of current dumper.
+
+        :rtype: Literal['html']
+        """
+        return 'html'
+
+    ##########################################################################
+    # Attributes.
+    ##########################################################################
+
+    __slots__ = ('_inln', '_csiz', '_cdir', '_cidx', '_cctr', '_cptr')
+
+    #: HTML head string.
+    _hsrt = _HEADER_START
+    #: HTML tail string.
+    _hend = _HEADER_END
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, inline=False, chunk=1000, **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            inline (bool): if embed blocks inline as Base64 encoded segments,
+                rather than writing chunk files
+            chunk (int): number of blocks per chunk file
+            **kwargs: addition keyword arguments for initialisation
+
+        Raises:
+            ValueError: resuming requested
+
+        """
+        if kwargs.get('mode') == 'resume':
+            raise ValueError('resume is not supported by HTML')
+
+        root = os.path.splitext(fname)[0] + '.chunks'
+
+        #: bool: If embed blocks inline.
+        self._inln = inline
+        #: int: Number of blocks per chunk file.
+        self._csiz = max(chunk, 1)
+        #: str: Directory of chunk files.
+        self._cdir = root
+        #: int: Index of current chunk file.
+        self._cidx = 0
+        #: int: Number of blocks in current chunk file.
+        self._cctr = self._csiz
+        #: int: Indicates start of appending point of current chunk file.
+        self._cptr = 0
+
+        super(HTML, self).__init__(fname, **kwargs)
+
+        #: int: Tab level counter.
+        self._tctr = 0
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _dump_header(self, **kwargs):
+        """Initially dump file heads and tails.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._cdir = os.path.splitext(self._file)[0] + '.chunks'
+        self._cidx = 0
+        self._cctr = self._csiz
+        self._cptr = 0
+
+        super(HTML, self)._dump_header(**kwargs)
+        if not self._inln and not os.path.isdir(self._cdir):
+            os.makedirs(self._cdir)
+
+    def _append_value(self, value, file, name):
+        """Call this function to write contents.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            file (io.TextIOWrapper): output file
+            name (str): name of current content block
+
+        """
+        temp = io.StringIO()
+        self._append_object(value, temp)
+        text = temp.getvalue()
+
+        file.seek(self._sptr, os.SEEK_SET)
+        if self._inln:
+            data = base64.b64encode(text.encode('utf-8')).decode('ascii')
+            file.write('<script type="application/json" class="dd-block" data-name="%s">%s</script>\n'
+                       % (_quote(str_type(name)), data))
+        else:
+            src, index = self._append_chunk(text)
+            file.write('<script type="application/json" class="dd-block" data-name="%s" '
+                       'data-chunk="%s" data-index="%d"></script>\n'
+                       % (_quote(str_type(name)), _quote(src), index))
+
+    def _append_chunk(self, text):
+        """Call this function to write block to chunk file.
+
+        Args:
+            text (str): rendered JSON object of current content block
+
+        Returns:
+            Tuple[str, int]: source URL (relative to the output file) of the
+            chunk file, and index of the block in the chunk file
+
+        """
+        if self._cctr >= self._csiz:
+            self._cidx += 1
+            self._cctr = 0
+
+        base = 'chunk_%06d.js' % self._cidx
+        src = '%s/%s' % (os.path.basename(self._cdir), base)
+
+        path = os.path.join(self._cdir, base)
+        mode = 'r+' if self._cctr else 'w'
+        if self._stat is None:
+            chunk = io.open(path, mode, encoding='utf-8')
+        else:
+            chunk = self._stat.open(io.open, path, mode, encoding='utf-8')
+        with chunk as file:
+            if self._cctr:
+                file.seek(self._cptr, os.SEEK_SET)
+                file.write(',\n')
+            else:
+                file.write(_CHUNK_START % json.dumps(src))
+            file.write(text)
+            self._cptr = file.tell()
+            file.write(_CHUNK_END)
+
+        index = self._cctr
+        self._cctr += 1
+        return src, index
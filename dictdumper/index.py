@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""sidecar block index of dumpers
+
+:mod:`dictdumper.index` contains :class:`~dictdumper.index.Index` and
+:func:`~dictdumper.index.open_block`, which look up blocks in output
+files through their sidecar index files (``name.json.idx``), written by
+dumpers with the ``index`` argument. Usage sample is described as below.
+
+.. code:: python
+
+    >>> dumper = JSON('capture.json', index=True)
+    >>> dumper(content_dict_1, name='test_1')
+    ............
+    >>> dumper.close()  # flush the index
+    >>> open_block('capture.json', 'test_1', parse=True)
+    {...}
+
+An index file starts with :data:`_MAGIC` and the file format of the
+output file, followed by an entry per block, i.e. its start and end
+offsets in the output file, and its name (c.f. :data:`_ENTRY`).
+
+"""
+# Sidecar block index of dumpers
+# Seek straight to blocks by name or sequence number
+
+import array
+import collections
+import io
+import json
+import os
+import struct
+
+from dictdumper._types import str_type
+from dictdumper.compression import FORMATS
+
+__all__ = ['Index', 'open_block']
+
+#: Magic bytes of index files.
+_MAGIC = b'DDIX\x01'
+
+#: Entry head of index files, as ``(start offset, end offset, name size)``,
+#: followed by the UTF-8 encoded name.
+_ENTRY = struct.Struct('<QQI')
+
+#: Number of bytes of index entries buffered before written.
+_BUFFER_SIZE = 65536
+
+#: Number of indices cached by :func:`open_block`.
+_CACHE_SIZE = 8
+
+#: OrderedDict[str, Tuple[Tuple[float, int], Index]]: Cached indices,
+#: keyed by path to output files, with modification times and sizes of index files.
+_CACHE = collections.OrderedDict()
+
+
+def index_path(path):
+    """Path to the index file of an output file.
+
+    Args:
+        path (str): path to the output file
+
+    Returns:
+        str: path to the index file
+
+    """
+    return path + '.idx'
+
+
+def dump_header(path, kind):
+    """Create an index file.
+
+    Args:
+        path (str): path to the index file
+        kind (str): file format of the output file
+
+    """
+    data = kind.encode('ascii')
+    with open(path, 'wb') as file:
+        file.write(_MAGIC + struct.pack('<B', len(data)) + data)
+
+
+def pack_entry(name, start, end):
+    """Pack an index entry.
+
+    Args:
+        name (str): name of the block
+        start (int): start offset of the block
+        end (int): end offset of the block
+
+    Returns:
+        bytes: packed entry
+
+    """
+    data = str_type(name).encode('utf-8')
+    return _ENTRY.pack(start, end, len(data)) + data
+
+
+class Index(object):  # pylint: disable=useless-object-inheritance
+    """Sidecar block index of an output file.
+
+    .. code:: python
+
+        >>> index = Index('capture.json')
+        >>> index.lookup('test_1')
+        (0, 2, 181)
+        >>> index.read(0)
+        ',\\n\\t"test_1": {...}'
+
+    Offsets are of the uncompressed output file. Blocks are looked up
+    by name, or by (zero-based) sequence number if the key is an
+    :obj:`int`; of blocks with duplicate names, the first one is found.
+
+    Attributes:
+        path (str): path to the output file
+        kind (str): file format of the output file
+        names (List[str]): names of blocks
+        starts (array.array): start offsets of blocks
+        ends (array.array): end offsets of blocks
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def lookup(self, key):
+        """Look up a block.
+
+        Args:
+            key (Union[str, int]): name or sequence number of the block
+
+        Returns:
+            Tuple[int, int, int]: sequence number, start and end offsets
+            of the block
+
+        Raises:
+            KeyError: no such block
+
+        """
+        if isinstance(key, int) and not isinstance(key, bool):
+            if not -len(self.names) <= key < len(self.names):
+                raise KeyError(key)
+            seq = key % len(self.names)
+        else:
+            if self._seqs is None:
+                self._seqs = dict()
+                for (seq, name) in enumerate(self.names):
+                    self._seqs.setdefault(name, seq)
+            seq = self._seqs[str_type(key)]
+        return seq, self.starts[seq], self.ends[seq]
+
+    def read(self, key):
+        """Read text of a block.
+
+        Args:
+            key (Union[str, int]): name or sequence number of the block
+
+        Returns:
+            Union[str, bytes]: text of the block as in the output file,
+            or :obj:`bytes` for binary formats (e.g. ``'cbor'``)
+
+        Raises:
+            KeyError: no such block
+
+        """
+        _, start, end = self.lookup(key)
+        with _open_output(self.path) as file:
+            file.seek(start, os.SEEK_SET)
+            data = file.read(end - start)
+        if self.kind == 'cbor':
+            return data
+        return data.decode('utf-8')
+
+    def parse(self, key):
+        """Read and parse a block of JSON output file.
+
+        Args:
+            key (Union[str, int]): name or sequence number of the block
+
+        Returns:
+            Any: content of the block
+
+        Raises:
+            KeyError: no such block
+            ValueError: output file is not JSON
+
+        """
+        if self.kind != 'json':
+            raise ValueError('cannot parse blocks of %s output file' % self.kind)
+        text = self.read(key).lstrip().lstrip(',')
+        value = json.loads('{%s}' % text)
+        return list(value.values())[0]
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, path):
+        """Load index of an output file.
+
+        Args:
+            path (str): path to the output file, its index file is looked
+                up as ``path + '.idx'``, or with compression extension
+                stripped, e.g. for segments compressed on rotation
+
+        Raises:
+            ValueError: malformed index file
+
+        """
+        ipath = index_path(path)
+        if not os.path.isfile(ipath):
+            root, ext = os.path.splitext(path)
+            if ext[1:] in FORMATS.values():
+                ipath = index_path(root)
+        with open(ipath, 'rb') as file:
+            data = file.read()
+        if not data.startswith(_MAGIC):
+            raise ValueError('malformed index file: %s' % ipath)
+
+        size = bytearray(data[len(_MAGIC):len(_MAGIC) + 1])[0]
+        offset = len(_MAGIC) + 1 + size
+
+        #: str: Path to the output file.
+        self.path = path
+        #: str: File format of the output file.
+        self.kind = data[len(_MAGIC) + 1:offset].decode('ascii')
+        #: List[str]: Names of blocks.
+        self.names = list()
+        #: array.array: Start offsets of blocks.
+        self.starts = array.array('Q')
+        #: array.array: End offsets of blocks.
+        self.ends = array.array('Q')
+
+        while offset + _ENTRY.size <= len(data):
+            start, end, size = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            self.starts.append(start)
+            self.ends.append(end)
+            self.names.append(data[offset:offset + size].decode('utf-8'))
+            offset += size
+
+        #: Optional[Dict[str, int]]: Sequence numbers of names, built on first use.
+        self._seqs = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return 'Index(%r, kind=%r, blocks=%d)' % (self.path, self.kind, len(self.names))
+
+
+def _open_output(path):
+    """Open an output file for reading, decompressing as needed.
+
+    Args:
+        path (str): path to the output file
+
+    Returns:
+        io.IOBase: binary file object
+
+    """
+    ext = os.path.splitext(path)[1][1:]
+    if ext == FORMATS['gzip']:
+        import gzip  # pylint: disable=import-outside-toplevel
+        return gzip.open(path, 'rb')
+    if ext == FORMATS['bz2']:
+        import bz2  # pylint: disable=import-outside-toplevel
+        return bz2.BZ2File(path, 'rb')
+    if ext == FORMATS['xz']:
+        import lzma  # pylint: disable=import-outside-toplevel
+        return lzma.open(path, 'rb')
+    return io.open(path, 'rb')
+
+
+def _load_index(path):
+    """Load index of an output file, with cache.
+
+    Args:
+        path (str): path to the output file
+
+    Returns:
+        Index: index of the output file
+
+    """
+    ipath = index_path(path)
+    stat = os.stat(ipath if os.path.isfile(ipath) else path)
+    stamp = (stat.st_mtime, stat.st_size)
+
+    cached = _CACHE.pop(path, None)
+    if cached is not None and cached[0] == stamp:
+        index = cached[1]
+    else:
+        index = Index(path)
+    _CACHE[path] = (stamp, index)
+    while len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return index
+
+
+def open_block(path, key, parse=False):
+    """Read a block of an output file through its index.
+
+    Only the block is read from the output file, with a single seek,
+    unless it is compressed, where decompression starts from the file
+    head. Indices are cached as long as their index files are unchanged.
+
+    Args:
+        path (str): path to the output file
+        key (Union[str, int]): name or sequence number of the block
+        parse (bool): parse the block of JSON output file
+
+    Returns:
+        Any: text of the block (c.f. :meth:`Index.read`), or its
+        content if ``parse``
+
+    Raises:
+        KeyError: no such block
+        ValueError: malformed index file, or parsing blocks of non-JSON
+            output file
+
+    """
+    index = _load_index(path)
+    if parse:
+        return index.parse(key)
+    return index.read(key)
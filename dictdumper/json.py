@@ -18,15 +18,17 @@ Usage sample is described as below.
 
 from __future__ import unicode_literals
 
-import collections
+import array
 import datetime
+import itertools
 import math
 import os
 import string
 
+from dictdumper._arrays import ArrayType, chunks
 from dictdumper._dateutil import isoformat
-from dictdumper._hexlify import hexlify
-from dictdumper._types import bytes_type, str_type
+from dictdumper._hexlify import byteview, decode, hexlify
+from dictdumper._types import Iterable, Mapping, bytes_type, str_type
 from dictdumper.dumper import Dumper
 
 __all__ = ['JSON']
@@ -37,6 +39,15 @@ _HEADER_START = '{\n'
 #: JSON tail string.
 _HEADER_END = '\n}'
 
+#: Initial depth of value counter stack.
+_VCTR_DEPTH = 8
+
+#: Number of array items looked ahead for the layout of arrays.
+_ARRAY_LOOKAHEAD = 256
+
+#: Types written as objects, i.e. mappings and typed wrappers.
+_OBJECT_TYPES = (Mapping, bytes_type, bytearray, memoryview, tuple, set, frozenset)
+
 #: Mapping for escaping special characters (c.f. :data:`json.encoder.ESCAPE_DCT`).
 ESCAPE_DCT = {
     '\\': '\\\\',
@@ -50,6 +61,26 @@ ESCAPE_DCT = {
 }
 
 
+def _quote(value):
+    """Format string as a JSON string.
+
+    Args:
+        value (str): string to format
+
+    Returns:
+        str: double-quoted and escaped string
+
+    """
+    text = ''
+    for char in str_type(value):
+        if char in string.printable:
+            temp = ESCAPE_DCT.get(char, char)
+        else:
+            temp = '\\u{0:04x}'.format(ord(char))
+        text += temp
+    return '"{text}"'.format(text=text)
+
+
 class JSON(Dumper):
     """Dump JavaScript object notation (JSON) format file.
 
@@ -66,7 +97,7 @@ class JSON(Dumper):
         _tctr (int): tab level counter
         _hsrt (str): :data:`~dictdumper.json._HEADER_START`
         _hend (str): :data:`~dictdumper.json._HEADER_END`
-        _vctr (DefaultDict[int, int]): value counter dict
+        _vctr (array.array): value counter stack, indexed by tab level
 
     .. note::
 
@@ -118,10 +149,25 @@ class JSON(Dumper):
 
         # object
         (dict, 'object'),
+        (Mapping, 'object'),
 
         # array
         (list, 'array'),
 
+        # typed wrappers
+        (bytes_type, 'binary'),
+        (bytearray, 'binary'),
+        (memoryview, 'binary'),
+        (tuple, 'collection'),
+        (set, 'collection'),
+        (frozenset, 'collection'),
+
+        # typed arrays
+        (ArrayType, 'buffer'),
+
+        # array (other iterables)
+        (Iterable, 'array'),
+
         # null
         (type(None), 'null'),
     )
@@ -130,6 +176,8 @@ class JSON(Dumper):
     # Attributes.
     ##########################################################################
 
+    __slots__ = ('_vctr',)
+
     #: JSON head string.
     _hsrt = _HEADER_START
     #: JSON tail string.
@@ -147,15 +195,59 @@ class JSON(Dumper):
             **kwargs: addition keyword arguments for initialisation
 
         """
-        super(JSON, self).__init__(fname, **kwargs)
+        #: array.array: Value counter stack, indexed by tab level.
+        self._vctr = array.array('I', [0]) * _VCTR_DEPTH  # value counter stack
 
-        #: DefaultDict[int, int]: Value counter dict.
-        self._vctr = collections.defaultdict(int)  # value counter dict
+        super(JSON, self).__init__(fname, **kwargs)
 
     ##########################################################################
     # Utilities.
     ##########################################################################
 
+    def _dump_header(self, **kwargs):
+        """Initially dump file heads and tails.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._vctr[self._tctr] = 0
+        super(JSON, self)._dump_header(**kwargs)
+
+    def _checkpoint(self):
+        """Save counters before dumping a block.
+
+        Returns:
+            Tuple[int, int, int]: appending point, tab level counter and
+            value counter of current tab level
+
+        """
+        return (self._sptr, self._tctr, self._vctr[self._tctr])
+
+    def _rollback(self, file, state):
+        """Roll back a partially dumped block, resetting value counters
+        of deeper tab levels.
+
+        Args:
+            file (io.IOBase): output file
+            state (Tuple[int, int, int]): counters saved by :meth:`_checkpoint`
+
+        """
+        tctr = state[1]
+        self._vctr[tctr] = state[2]
+        self._vctr[tctr + 1:] = array.array('I', [0]) * (len(self._vctr) - tctr - 1)
+        super(JSON, self)._rollback(file, state)
+
+    def _resume_header(self, **kwargs):
+        """Recover appending point and value counter from an existing output file.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        super(JSON, self)._resume_header(**kwargs)
+        self._vctr[self._tctr] = int(self._sptr > len(self._hsrt))
+
     def _encode_value(self, o):  # pylint: disable=unused-argument
         """Check content type for function call.
 
@@ -169,19 +261,26 @@ class JSON(Dumper):
             The function is a direct wrapper for :meth:`~dictdumper.dumper.Dumper.object_hook`.
 
         Notes:
-            The function will by default converts :obj:`bytearray`,
-            :obj:`memoryview`, :obj:`tuple`, :obj:`set`, :obj:`frozenset` to
-            JSON serialisable data.
+            :obj:`bytes`, :obj:`bytearray`, :obj:`memoryview`, :obj:`tuple`,
+            :obj:`set` and :obj:`frozenset` are left as is, and written as
+            typed wrappers (c.f. :meth:`~dictdumper.dumper.Dumper.make_object`)
+            by :meth:`_append_binary` and :meth:`_append_collection`. If
+            :meth:`~dictdumper.dumper.Dumper.object_hook` is overridden, they
+            are converted into typed wrappers instead, whose fields are then
+            converted by the hook as well.
 
         """
-        if isinstance(o, (bytes_type, bytearray)):
-            return self.make_object(o, o.decode(errors='replace'), hex=hexlify(o))
-        if isinstance(o, memoryview):
-            tobytes = o.tobytes()
-            return self.make_object(o, tobytes.decode(errors='replace'), hex=hexlify(tobytes))
-        if isinstance(o, (tuple, set, frozenset)):
-            return self.make_object(o, list(o))
-        return self.object_hook(o)
+        if isinstance(o, _OBJECT_TYPES[1:]):
+            if type(self).object_hook == Dumper.object_hook:
+                return o
+            if isinstance(o, (tuple, set, frozenset)):
+                return self.make_object(o, iter(o))
+            data = o.tobytes() if isinstance(o, memoryview) else o
+            return self.make_object(o, decode(data), hex=hexlify(data))
+        enc = self.object_hook(o)
+        if self._stat is not None and enc is not o:
+            self._stat.hooks += 1
+        return enc
 
     def _append_value(self, value, file, name):
         """Call this function to write contents.
@@ -210,14 +309,17 @@ class JSON(Dumper):
         """Call this function to write object contents.
 
         Args:
-            value (Dict[str, Any]): content to be dumped
+            value (Mapping[str, Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
         """
         labs = '{'
         file.write(labs)
         self._tctr += 1
+        if self._tctr >= len(self._vctr):
+            self._vctr.extend(array.array('I', [0]) * len(self._vctr))
 
+        prof = self._pact
         for (item, text) in value.items():
             tabs = '\t' * self._tctr
             cmma = ',' if self._vctr[self._tctr] else ''
@@ -226,9 +328,13 @@ class JSON(Dumper):
 
             self._vctr[self._tctr] += 1
 
+            if prof is not None:
+                prof.enter(item, file)
             enc_text = self._encode_value(text)
             func = self._encode_func(enc_text)
             func(enc_text, file)
+            if prof is not None:
+                prof.leave(file)
 
         self._vctr[self._tctr] = 0
         self._tctr -= 1
@@ -240,24 +346,53 @@ class JSON(Dumper):
         """Call this function to write array contents.
 
         Args:
-            value (List[Any]): content to be dumped
+            value (Iterable[Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
+        Notes:
+            Items are encoded and written one by one. The array is written
+            across multiple lines if any of its first
+            :data:`~dictdumper.json._ARRAY_LOOKAHEAD` items is an object
+            (c.f. :data:`~dictdumper.json._OBJECT_TYPES`). Homogeneous
+            numbers are written at once (c.f.
+            :meth:`~dictdumper.dumper.Dumper._numeric`).
+
         """
-        val_list = [self._encode_value(item) for item in value]
+        prof = self._pact
+        if prof is not None:
+            prof.enter_array(file)
+
+        if self._numeric(value) is not None:
+            labs = '[ '
+            for chunk in chunks(value):
+                file.write(labs + ', '.join(map(str_type, chunk)))
+                labs = ', '
+            file.write(' ]')
+            if prof is not None:
+                prof.leave(file)
+            return
+
+        items = iter(value)
+        val_list = list()
         mul_line = False
-        for item in val_list:
-            if isinstance(item, dict):
+        for item in items:
+            enc_item = self._encode_value(item)
+            val_list.append(enc_item)
+            if isinstance(enc_item, _OBJECT_TYPES):
                 mul_line = True
                 break
+            if len(val_list) >= _ARRAY_LOOKAHEAD:
+                break
 
         labs = '[\n' if mul_line else '[ '
         file.write(labs)
 
         self._tctr += 1
+        if self._tctr >= len(self._vctr):
+            self._vctr.extend(array.array('I', [0]) * len(self._vctr))
 
         tabs = '\t' * self._tctr
-        for item in val_list:
+        for item in itertools.chain(val_list, (self._encode_value(item) for item in items)):
             if self._vctr[self._tctr]:
                 file.write(',\n' if mul_line else ', ')
             if mul_line:
@@ -278,7 +413,81 @@ class JSON(Dumper):
             labs = ' ]'
         file.write(labs)
 
-    def _append_string(self, value, file):  # pylint: disable=no-self-use
+        if prof is not None:
+            prof.leave(file)
+
+    def _append_wrapper(self, value, file, *fields):
+        """Call this function to write typed wrapper contents.
+
+        Args:
+            value (Any): original content
+            file (io.TextIOWrapper): output file
+            *fields (Tuple[str, Any, Callable[[Any, io.TextIOWrapper], None]]):
+                key, converted content and handler of fields after ``type``
+
+        Notes:
+            The wrapper is written as the object created by
+            :meth:`~dictdumper.dumper.Dumper.make_object`, without creating it.
+            Handlers of fields are called directly, and counted as if
+            dispatched by :meth:`~dictdumper.dumper.Dumper._encode_func`.
+
+        """
+        labs = '{'
+        file.write(labs)
+        self._tctr += 1
+        if self._tctr >= len(self._vctr):
+            self._vctr.extend(array.array('I', [0]) * len(self._vctr))
+
+        stat = self._stat
+        prof = self._pact
+        tabs = '\t' * self._tctr
+        for (item, text, func) in (('type', str_type(type(value).__name__), self._append_string),) + fields:
+            cmma = ',' if self._vctr[self._tctr] else ''
+            keys = '{cmma}\n{tabs}"{item}": '.format(cmma=cmma, tabs=tabs, item=item)
+            file.write(keys)
+
+            self._vctr[self._tctr] += 1
+
+            if stat is not None:
+                stat.handlers[func.__name__.replace('_append_', '', 1)] += 1
+            if prof is not None:
+                prof.enter(item, file)
+            func(text, file)
+            if prof is not None:
+                prof.leave(file)
+
+        self._vctr[self._tctr] = 0
+        self._tctr -= 1
+        tabs = '\t' * self._tctr
+        labs = '\n{tabs}{}'.format('}', tabs=tabs)
+        file.write(labs)
+
+    def _append_binary(self, value, file):
+        """Call this function to write binary contents.
+
+        Args:
+            value (Union[bytes, bytearray, memoryview]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            Contiguous memoryviews are converted without copying.
+
+        """
+        data = byteview(value) if isinstance(value, memoryview) else value
+        self._append_wrapper(value, file, ('value', self._render('utf8', data, decode), self._append_string),
+                             ('hex', self._render('hex', data, hexlify), self._append_string))
+
+    def _append_collection(self, value, file):
+        """Call this function to write tuple and set contents.
+
+        Args:
+            value (Union[Tuple[Any], Set[Any], FrozenSet[Any]]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        self._append_wrapper(value, file, ('value', value, self._append_array))
+
+    def _append_string(self, value, file):
         """Call this function to write string contents.
 
         Args:
@@ -286,17 +495,10 @@ class JSON(Dumper):
             file (io.TextIOWrapper): output file
 
         """
-        text = ''
-        for char in str_type(value):
-            if char in string.printable:
-                temp = ESCAPE_DCT.get(char, char)
-            else:
-                temp = '\\u{0:04x}'.format(ord(char))
-            text += temp
-        labs = '"{text}"'.format(text=text)
+        labs = self._render('json.string', value, _quote)
         file.write(labs)
 
-    def _append_date(self, value, file):  # pylint: disable=no-self-use
+    def _append_date(self, value, file):
         """Call this function to write date contents.
 
         Args:
@@ -304,7 +506,7 @@ class JSON(Dumper):
             file (io.TextIOWrapper): output file
 
         """
-        text = isoformat(value)
+        text = self._render('isoformat', value, isoformat)
         labs = '"{text}"'.format(text=text)
         file.write(labs)
 
@@ -317,11 +519,13 @@ class JSON(Dumper):
 
         """
         if math.isnan(value):
-            text = self.make_object(value, None, number=str_type(value).replace(u'nan', u'NaN'))
-            self._append_object(text, file)
+            text = str_type(value).replace(u'nan', u'NaN')
+            self._append_wrapper(value, file, ('value', None, self._append_null),
+                                 ('number', text, self._append_string))
         elif math.isinf(value):
-            text = self.make_object(value, None, number=str_type(value).replace(u'inf', u'Infinity'))
-            self._append_object(text, file)
+            text = str_type(value).replace(u'inf', u'Infinity')
+            self._append_wrapper(value, file, ('value', None, self._append_null),
+                                 ('number', text, self._append_string))
         else:
             labs = str_type(value)
             file.write(labs)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""memory-mapped output
+
+:mod:`dictdumper.mapped` contains :class:`~dictdumper.mapped.MappedFile`
+only, which is a file object writing through a memory map of the output
+file. It is enabled by the ``backend`` argument of dumpers. Usage sample
+is described as below.
+
+.. code:: python
+
+    >>> dumper = JSON('capture.json', backend='mmap')
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.close()  # truncate to logical size
+
+"""
+# Memory-mapped output
+# Copy blocks into preallocated extents of output files
+
+import io
+import locale
+import mmap
+import os
+
+from dictdumper._types import str_type
+
+__all__ = ['MappedFile']
+
+#: Size of extents preallocated for output files.
+_EXTENT_SIZE = 16 << 20
+
+
+class MappedFile(object):  # pylint: disable=useless-object-inheritance
+    """File writing through a memory map.
+
+    .. code:: python
+
+        >>> with MappedFile(file_name, 'w') as file:
+        ...     file.write('text')
+
+    The file is preallocated in extents of :data:`_EXTENT_SIZE` bytes,
+    and the mapping grows geometrically, i.e. at least doubles, once a
+    write reaches its end. Written data are copied straight into the
+    mapping, and the file is truncated to its logical size, i.e. the end
+    of the furthest write (c.f. :meth:`truncate`), on :meth:`close`.
+    Until then, the file on disk is padded with null bytes, including
+    data truncated from the mapping.
+
+    Attributes:
+        _file (io.FileIO): underlying file
+        _mmap (Optional[mmap.mmap]): memory map of the file
+        _mcap (int): size of the memory map
+        _fptr (int): current position
+        _fend (int): logical size of the file
+        _extn (int): size of preallocated extents
+        _encd (str): encoding of text data
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def closed(self):
+        """If the file is closed.
+
+        :rtype: bool
+        """
+        return self._file.closed
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def write(self, data):
+        """Copy ``data`` into the mapping at current position.
+
+        Args:
+            data (Union[str, bytes]): data to be written, text is encoded
+                with the preferred encoding of the locale
+
+        Returns:
+            int: length of ``data``
+
+        """
+        chunk = data.encode(self._encd) if isinstance(data, str_type) else data
+        if not chunk:
+            return 0
+        stop = self._fptr + len(chunk)
+        if stop > self._mcap:
+            self._grow(stop)
+        self._mmap[self._fptr:stop] = chunk
+        self._fptr = stop
+        if stop > self._fend:
+            self._fend = stop
+        return len(data)
+
+    def tell(self):
+        """Current position."""
+        return self._fptr
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change current position.
+
+        Args:
+            offset (int): position
+            whence (int): reference point of ``offset``, where the end of
+                file is its logical size
+
+        Returns:
+            int: current position
+
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._fptr
+        elif whence == os.SEEK_END:
+            offset += self._fend
+        if offset < 0:
+            raise ValueError('negative seek position %d' % offset)
+        self._fptr = offset
+        return offset
+
+    def truncate(self, size=None):
+        """Set logical size of the file.
+
+        Data beyond the new logical size are zeroed in the mapping, so that
+        the file on disk is padded with null bytes only, even if not closed.
+
+        Args:
+            size (Optional[int]): logical size, default to current position
+
+        Returns:
+            int: logical size
+
+        """
+        fend = self._fptr if size is None else size
+        stop = min(self._fend, self._mcap)
+        if fend < stop:
+            self._mmap[fend:stop] = b'\x00' * (stop - fend)
+        self._fend = fend
+        return fend
+
+    def flush(self):
+        """Flush the mapping to the file."""
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def fileno(self):
+        """File descriptor of the underlying file."""
+        return self._file.fileno()
+
+    def close(self):
+        """Unmap and truncate the file to its logical size."""
+        if self._file.closed:
+            return
+        try:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            os.ftruncate(self._file.fileno(), self._fend)
+        finally:
+            self._file.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, path, mode='w', extent=_EXTENT_SIZE, encoding=None):
+        """Open file.
+
+        Args:
+            path (str): path to the file
+            mode (Literal['w', 'r+']): truncate the file, or update it
+                with its current size as logical size
+            extent (int): size of preallocated extents
+            encoding (Optional[str]): encoding of text data, default to
+                the preferred encoding of the locale
+
+        """
+        #: io.FileIO: Underlying file.
+        self._file = io.open(path, mode.replace('+', '') + '+b', buffering=0)
+        #: Optional[mmap.mmap]: Memory map of the file.
+        self._mmap = None
+        #: int: Size of the memory map.
+        self._mcap = 0
+        #: int: Current position.
+        self._fptr = 0
+        #: int: Logical size of the file.
+        self._fend = os.fstat(self._file.fileno()).st_size
+        #: int: Size of preallocated extents.
+        self._extn = max(int(extent), mmap.ALLOCATIONGRANULARITY)
+        #: str: Encoding of text data.
+        self._encd = encoding or locale.getpreferredencoding(False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _grow(self, size):
+        """Preallocate the file and remap it.
+
+        Args:
+            size (int): minimum size of the memory map
+
+        """
+        size = max(size, self._fend)
+        mcap = max(self._mcap * 2, self._extn)
+        while mcap < size:
+            mcap *= 2
+        mcap = -(-mcap // self._extn) * self._extn
+
+        if self._mmap is not None:
+            self._mmap.close()
+        fileno = self._file.fileno()
+        try:
+            os.posix_fallocate(fileno, 0, mcap)
+        except (AttributeError, OSError):
+            os.ftruncate(fileno, mcap)
+        self._mmap = mmap.mmap(fileno, mcap)
+        self._mcap = mcap
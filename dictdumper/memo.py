@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""memoization of leaf renderings
+
+:mod:`dictdumper.memo` contains :class:`~dictdumper.memo.Memo` only,
+which is a bounded least-recently-used (LRU) cache of rendered leaf
+values, e.g. escaped strings, hexadecimal representations of bytes and
+ISO 8601 representations of dates. It is enabled by the ``memo``
+argument of dumpers. Usage sample is described as below.
+
+.. code:: python
+
+    >>> dumper = JSON(file_name, memo=True)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.memo.hit_rate
+    0.75
+
+"""
+# Memoization of leaf renderings
+# Cache renderings of recurring immutable values
+
+import collections
+
+__all__ = ['Memo']
+
+#: Default maximum number of cached renderings.
+_MEMO_ENTRIES = 4096
+
+#: Default maximum size of cached values and renderings in characters (or bytes).
+_MEMO_BYTES = 1 << 20
+
+#: Default maximum length of values to be cached.
+_MEMO_THRESHOLD = 64
+
+
+class Memo(object):  # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+    """LRU cache of leaf renderings.
+
+    .. code:: python
+
+        >>> memo = Memo(entries=1024)
+        >>> dumper_1 = JSON(file_name_1, memo=memo)
+        >>> dumper_2 = Tree(file_name_2, memo=memo)
+
+    Renderings are keyed by a code naming the rendering (e.g.
+    ``'json.string'`` or ``'hex'``), the type of the value, the value
+    itself, and its time zone if any, as aware date/time objects of
+    different time zones may compare equal. Memory views are keyed by a
+    copy of their contents, so that no exporting buffer is held by the
+    cache. Values longer than ``threshold``, unhashable values (e.g.
+    :obj:`bytearray`) and renderings larger than ``bytes`` are rendered
+    without caching, and counted as skips. Once either ``entries`` or
+    ``bytes`` is exceeded, the least recently used renderings are
+    evicted.
+
+    A memo can be shared by dumpers of different formats, but not across
+    threads.
+
+    Attributes:
+        entries (int): maximum number of cached renderings
+        bytes (int): maximum size of cached values and renderings
+        threshold (int): maximum length of values to be cached
+        hits (int): number of renderings found in the cache
+        misses (int): number of renderings added to the cache
+        skips (int): number of renderings bypassing the cache
+        evictions (int): number of renderings evicted from the cache
+        size (int): current size of cached values and renderings
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def hit_rate(self):
+        """Ratio of hits among all renderings, ``0.0`` if none.
+
+        :rtype: float
+        """
+        total = self.hits + self.misses + self.skips
+        return float(self.hits) / total if total else 0.0
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def render(self, code, value, func):
+        """Render a value through the cache.
+
+        Args:
+            code (str): name of the rendering
+            value (Any): value to render
+            func (Callable[[Any], Union[str, bytes]]): rendering function
+
+        Returns:
+            Union[str, bytes]: rendering of ``value``
+
+        """
+        try:
+            size = len(value)
+        except TypeError:
+            size = 0
+        if size > self.threshold:
+            self.skips += 1
+            return func(value)
+
+        if isinstance(value, memoryview):
+            key = (code, memoryview, value.tobytes(), None)
+        else:
+            key = (code, type(value), value, getattr(value, 'tzinfo', None))
+        try:
+            text = self._data.pop(key)
+        except KeyError:
+            pass
+        except TypeError:  # unhashable
+            self.skips += 1
+            return func(value)
+        else:
+            self.hits += 1
+            self._data[key] = text
+            return text
+
+        text = func(value)
+        cost = size + len(text)
+        if cost > self.bytes:
+            self.skips += 1
+        else:
+            self.misses += 1
+            self._data[key] = text
+            self._cost[key] = cost
+            self.size += cost
+            while len(self._data) > self.entries or self.size > self.bytes:
+                (old, _) = self._data.popitem(last=False)
+                self.size -= self._cost.pop(old)
+                self.evictions += 1
+        return text
+
+    def clear(self):
+        """Drop all cached renderings."""
+        self._data.clear()
+        self._cost.clear()
+        self.size = 0
+
+    def reset(self):
+        """Reset all counters to zero."""
+        #: int: Number of renderings found in the cache.
+        self.hits = 0
+        #: int: Number of renderings added to the cache.
+        self.misses = 0
+        #: int: Number of renderings bypassing the cache.
+        self.skips = 0
+        #: int: Number of renderings evicted from the cache.
+        self.evictions = 0
+
+    def snapshot(self):
+        """Copy current counters.
+
+        Returns:
+            Dict[str, Any]: current counters, with size and hit rate
+
+        """
+        snap = collections.OrderedDict()
+        snap['entries'] = len(self._data)
+        snap['size'] = self.size
+        snap['hits'] = self.hits
+        snap['misses'] = self.misses
+        snap['skips'] = self.skips
+        snap['evictions'] = self.evictions
+        snap['hit_rate'] = self.hit_rate
+        return snap
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, entries=_MEMO_ENTRIES, bytes=_MEMO_BYTES, threshold=_MEMO_THRESHOLD):  # pylint: disable=redefined-builtin
+        """Initialise cache.
+
+        Args:
+            entries (int): maximum number of cached renderings
+            bytes (int): maximum size of cached values and renderings, in
+                characters of text and bytes of binary data
+            threshold (int): maximum length of values to be cached
+
+        """
+        #: int: Maximum number of cached renderings.
+        self.entries = max(int(entries), 1)
+        #: int: Maximum size of cached values and renderings.
+        self.bytes = int(bytes)
+        #: int: Maximum length of values to be cached.
+        self.threshold = int(threshold)
+
+        #: OrderedDict[Tuple[str, type, Hashable, Optional[datetime.tzinfo]], Union[str, bytes]]:
+        #: Cached renderings, least recently used first.
+        self._data = collections.OrderedDict()
+        #: Dict[Tuple[str, type, Hashable, Optional[datetime.tzinfo]], int]: Sizes of cached renderings.
+        self._cost = dict()
+        #: int: Current size of cached values and renderings.
+        self.size = 0
+
+        self.reset()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'Memo(entries=%r, bytes=%r, threshold=%r)' % (self.entries, self.bytes, self.threshold)
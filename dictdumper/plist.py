@@ -20,11 +20,17 @@ import base64
 import datetime
 import os
 
-from dictdumper._types import bytes_type, str_type
+from dictdumper._arrays import ArrayType, chunks
+from dictdumper._hexlify import byteview
+from dictdumper._types import Iterable, Mapping, bytes_type, str_type
+from dictdumper.dumper import Dumper
 from dictdumper.xml import XML
 
 __all__ = ['PLIST']
 
+#: Types written as typed wrappers.
+_WRAPPER_TYPES = (bytearray, memoryview, tuple, set, frozenset)
+
 #: PLIST head string.
 _HEADER_START = '''\
 <?xml version="1.0" encoding="UTF-8"?>
@@ -40,6 +46,32 @@ _HEADER_END = '''\
 '''
 
 
+def _base64(value):
+    """Base64 representation of binary data.
+
+    Args:
+        value (bytes): binary data
+
+    Returns:
+        str: Base64 representation
+
+    """
+    return base64.b64encode(value).decode()
+
+
+def _strftime(value):
+    """Format date as in PLIST.
+
+    Args:
+        value (Union[datetime.date, datetime.datetime]): date to format
+
+    Returns:
+        str: formatted date
+
+    """
+    return value.strftime(r'%Y-%m-%dT%H:%M:%S.%fZ')
+
+
 class PLIST(XML):
     """Dump Apple property list (PLIST) format file.
 
@@ -101,6 +133,7 @@ class PLIST(XML):
 
         # dict
         (dict, 'dict'),
+        (Mapping, 'dict'),
 
         # date
         (datetime.date, 'date'),
@@ -117,12 +150,27 @@ class PLIST(XML):
 
         # array
         (list, 'array'),
+
+        # typed wrappers
+        (bytearray, 'binary'),
+        (memoryview, 'binary'),
+        (tuple, 'collection'),
+        (set, 'collection'),
+        (frozenset, 'collection'),
+
+        # typed arrays
+        (ArrayType, 'buffer'),
+
+        # array (other iterables)
+        (Iterable, 'array'),
     )
 
     ##########################################################################
     # Attributes.
     ##########################################################################
 
+    __slots__ = ()
+
     #: PLIST head string.
     _hsrt = _HEADER_START
     #: PLIST tail string.
@@ -145,20 +193,29 @@ class PLIST(XML):
             The function is a direct wrapper for :meth:`~dictdumper.dumper.Dumper.object_hook`.
 
         Notes:
-            The function will by default converts :obj:`bytearray`, ``None``,
-            :obj:`memoryview`, :obj:`tuple`, :obj:`set`, :obj:`frozenset` to
-            PLIST serialisable data.
+            The function will by default converts ``None`` to PLIST
+            serialisable data. :obj:`bytearray`, :obj:`memoryview`,
+            :obj:`tuple`, :obj:`set` and :obj:`frozenset` are left as is,
+            and written as typed wrappers (c.f.
+            :meth:`~dictdumper.dumper.Dumper.make_object`) by
+            :meth:`_append_binary` and :meth:`_append_collection`. If
+            :meth:`~dictdumper.dumper.Dumper.object_hook` is overridden, they
+            are converted into typed wrappers instead, whose fields are then
+            converted by the hook as well.
 
         """
         if o is None:
             return self.make_object(o, 'None')
-        if isinstance(o, bytearray):
-            return self.make_object(o, bytes_type(o))
-        if isinstance(o, memoryview):
-            return self.make_object(o, o.tobytes())
-        if isinstance(o, (tuple, set, frozenset)):
-            return self.make_object(o, list(o))
-        return self.object_hook(o)
+        if isinstance(o, _WRAPPER_TYPES):
+            if type(self).object_hook == Dumper.object_hook:
+                return o
+            if isinstance(o, (tuple, set, frozenset)):
+                return self.make_object(o, iter(o))
+            return self.make_object(o, o.tobytes() if isinstance(o, memoryview) else bytes_type(o))
+        enc = self.object_hook(o)
+        if self._stat is not None and enc is not o:
+            self._stat.hooks += 1
+        return enc
 
     def _append_value(self, value, file, name):
         """Call this function to write contents.
@@ -185,7 +242,7 @@ class PLIST(XML):
         """Call this function to write dict contents.
 
         Args:
-            value (Dict[str, Any]): content to be dumped
+            value (Mapping[str, Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
         """
@@ -194,6 +251,7 @@ class PLIST(XML):
         file.write(labs)
         self._tctr += 1
 
+        prof = self._pact
         for (item, text) in value.items():
             if text is None:
                 continue
@@ -202,9 +260,13 @@ class PLIST(XML):
             keys = '{tabs}<key>{item}</key>\n'.format(tabs=tabs, item=item)
             file.write(keys)
 
+            if prof is not None:
+                prof.enter(item, file)
             enc_text = self._encode_value(text)
             func = self._encode_func(enc_text)
             func(enc_text, file)
+            if prof is not None:
+                prof.leave(file)
 
         self._tctr -= 1
         tabs = '\t' * self._tctr
@@ -215,28 +277,113 @@ class PLIST(XML):
         """Call this function to write array contents.
 
         Args:
-            value (List[Any]): content to be dumped
+            value (Iterable[Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
+        Notes:
+            Homogeneous numbers are written at once (c.f.
+            :meth:`~dictdumper.dumper.Dumper._numeric`).
+
         """
+        prof = self._pact
+        if prof is not None:
+            prof.enter_array(file)
+
         tabs = '\t' * self._tctr
         labs = '{tabs}<array>\n'.format(tabs=tabs)
         file.write(labs)
         self._tctr += 1
 
-        for item in value:
-            if item is None:
-                continue
-
-            enc_text = self._encode_value(item)
-            func = self._encode_func(enc_text)
-            func(enc_text, file)
+        kind = self._numeric(value)
+        if kind is not None:
+            tabs = '\t' * self._tctr
+            code = 'integer' if kind is int else 'real'
+            head = '{tabs}<{code}>'.format(tabs=tabs, code=code)
+            tail = '</{code}>\n'.format(code=code)
+            for chunk in chunks(value):
+                file.write(head + (tail + head).join(map(str_type, chunk)) + tail)
+        else:
+            for item in value:
+                if item is None:
+                    continue
+
+                enc_text = self._encode_value(item)
+                func = self._encode_func(enc_text)
+                func(enc_text, file)
 
         self._tctr -= 1
         tabs = '\t' * self._tctr
         labs = '{tabs}</array>\n'.format(tabs=tabs)
         file.write(labs)
 
+        if prof is not None:
+            prof.leave(file)
+
+    def _append_wrapper(self, value, file, *fields):
+        """Call this function to write typed wrapper contents.
+
+        Args:
+            value (Any): original content
+            file (io.TextIOWrapper): output file
+            *fields (Tuple[str, Any, Callable[[Any, io.TextIOWrapper], None]]):
+                key, converted content and handler of fields after ``type``
+
+        Notes:
+            The wrapper is written as the dict created by
+            :meth:`~dictdumper.dumper.Dumper.make_object`, without creating it.
+            Handlers of fields are called directly, and counted as if
+            dispatched by :meth:`~dictdumper.dumper.Dumper._encode_func`.
+
+        """
+        tabs = '\t' * self._tctr
+        labs = '{tabs}<dict>\n'.format(tabs=tabs)
+        file.write(labs)
+        self._tctr += 1
+
+        stat = self._stat
+        prof = self._pact
+        tabs = '\t' * self._tctr
+        for (item, text, func) in (('type', str_type(type(value).__name__), self._append_string),) + fields:
+            keys = '{tabs}<key>{item}</key>\n'.format(tabs=tabs, item=item)
+            file.write(keys)
+
+            if stat is not None:
+                stat.handlers[func.__name__.replace('_append_', '', 1)] += 1
+            if prof is not None:
+                prof.enter(item, file)
+            func(text, file)
+            if prof is not None:
+                prof.leave(file)
+
+        self._tctr -= 1
+        tabs = '\t' * self._tctr
+        labs = '{tabs}</dict>\n'.format(tabs=tabs)
+        file.write(labs)
+
+    def _append_binary(self, value, file):
+        """Call this function to write bytearray and memoryview contents.
+
+        Args:
+            value (Union[bytearray, memoryview]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            Contiguous memoryviews are converted without copying.
+
+        """
+        data = byteview(value) if isinstance(value, memoryview) else value
+        self._append_wrapper(value, file, ('value', data, self._append_data))
+
+    def _append_collection(self, value, file):
+        """Call this function to write tuple and set contents.
+
+        Args:
+            value (Union[Tuple[Any], Set[Any], FrozenSet[Any]]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        self._append_wrapper(value, file, ('value', value, self._append_array))
+
     def _append_string(self, value, file):
         """Call this function to write string contents.
 
@@ -254,7 +401,7 @@ class PLIST(XML):
         """Call this function to write data contents.
 
         Args:
-            value (bytes): content to be dumped
+            value (Union[bytes, bytearray, memoryview]): content to be dumped
             file (io.TextIOWrapper): output file
 
         """
@@ -262,7 +409,7 @@ class PLIST(XML):
         # binascii.a2b_base64(Data) -> value(bytes)
 
         tabs = '\t' * self._tctr
-        text = base64.b64encode(value).decode()
+        text = self._render('base64', value, _base64)
         labs = '{tabs}<data>{text}</data>\n'.format(tabs=tabs, text=text)
         file.write(labs)
 
@@ -275,7 +422,7 @@ class PLIST(XML):
 
         """
         tabs = '\t' * self._tctr
-        text = value.strftime(r'%Y-%m-%dT%H:%M:%S.%fZ')
+        text = self._render('plist.date', value, _strftime)
         labs = '{tabs}<date>{text}</date>\n'.format(tabs=tabs, text=text)
         file.write(labs)
 
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""keyed pool of dumpers
+
+:mod:`dictdumper.pool` contains :class:`~dictdumper.pool.DumperPool`
+only, which fans out blocks to one dumper per key (e.g. per TCP flow),
+while capping the number of output files held open at once. Usage
+sample is described as below.
+
+.. code:: python
+
+    >>> pool = DumperPool(JSON, 'flows/%s.json', maxopen=256)
+    >>> pool(flow_key_1, content_dict_1, name=content_name_1)
+    >>> pool(flow_key_2, content_dict_2, name=content_name_2)
+    ............
+    >>> pool.close()
+
+"""
+# Keyed pool of dumpers
+# Hold output files open with a least-recently-used cap
+
+import collections
+
+__all__ = ['DumperPool']
+
+
+class DumperPool(object):  # pylint: disable=useless-object-inheritance
+    """Keyed pool of dumpers.
+
+    .. code:: python
+
+        >>> pool = DumperPool(Tree, lambda key: 'flows/%s-%s.txt' % key)
+        >>> pool(('10.0.0.1:80', '10.0.0.2:51423'), content_dict, name=content_name)
+        >>> pool[('10.0.0.1:80', '10.0.0.2:51423')]
+        <dictdumper.tree.Tree object at 0x...>
+
+    Dumpers are created on the first block of their keys, and hold their
+    output files open (c.f. :meth:`Dumper.hold <dictdumper.dumper.Dumper.hold>`)
+    across calls. Once more than ``maxopen`` output files are held, the
+    least recently used one is flushed and closed (c.f.
+    :meth:`Dumper.release <dictdumper.dumper.Dumper.release>`), and its
+    dumper resumes at the saved appending point when its key comes back.
+
+    Attributes:
+        _dcls (Type[Dumper]): dumper class of all keys
+        _fnam (Union[str, Callable[[Hashable], str]]): output file name of a key
+        _mopn (int): maximum number of output files held open
+        _kwgs (Dict[str, Any]): keyword arguments for initialisation of dumpers
+        _dmps (Dict[Hashable, Dumper]): dumpers of keys
+        _held (OrderedDict[Hashable, Dumper]): dumpers holding output files
+            open, least recently used first
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def maxopen(self):
+        """Maximum number of output files held open.
+
+        :rtype: int
+        """
+        return self._mopn
+
+    @property
+    def nopen(self):
+        """Number of output files currently held open.
+
+        :rtype: int
+        """
+        return len(self._held)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def get(self, key):
+        """Get dumper of a key, creating it if not exists.
+
+        Args:
+            key (Hashable): key of the dumper
+
+        Returns:
+            Dumper: dumper of the key
+
+        """
+        dumper = self._dmps.get(key)
+        if dumper is None:
+            fname = self._fnam(key) if callable(self._fnam) else self._fnam % (key,)
+            dumper = self._dmps[key] = self._dcls(fname, **self._kwgs)
+        return dumper
+
+    def release(self, key=None):
+        """Flush and close held output files.
+
+        Args:
+            key (Optional[Hashable]): key of the dumper, or :data:`None`
+                for all dumpers
+
+        """
+        if key is None:
+            while self._held:
+                self._held.popitem(last=False)[1].release()
+        elif key in self._held:
+            self._held.pop(key).release()
+
+    def close(self):
+        """Finalise output files of all dumpers."""
+        self._held.clear()
+        for dumper in self._dmps.values():
+            dumper.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, dumper, fname, maxopen=128, **kwargs):
+        """Initialise pool.
+
+        Args:
+            dumper (Type[Dumper]): dumper class of all keys
+            fname (Union[str, Callable[[Hashable], str]]): output file name
+                of a key, as a ``%``-format string or a function of the key
+            maxopen (int): maximum number of output files held open
+            **kwargs: keyword arguments for initialisation of dumpers
+
+        """
+        #: Type[Dumper]: Dumper class of all keys.
+        self._dcls = dumper
+        #: Union[str, Callable[[Hashable], str]]: Output file name of a key.
+        self._fnam = fname
+        #: int: Maximum number of output files held open.
+        self._mopn = max(int(maxopen), 1)
+        #: Dict[str, Any]: Keyword arguments for initialisation of dumpers.
+        self._kwgs = kwargs
+        #: Dict[Hashable, Dumper]: Dumpers of keys.
+        self._dmps = dict()
+        #: OrderedDict[Hashable, Dumper]: Dumpers holding output files open,
+        #: least recently used first.
+        self._held = collections.OrderedDict()
+
+    def __call__(self, key, value, name=None):
+        """Dump a new block to dumper of a key.
+
+        Args:
+            key (Hashable): key of the dumper
+            value (Dict[str, Any]): content to be dumped
+            name (str): name of current content block
+
+        Returns:
+            DumperPool: the pool itself (to support chain calling)
+
+        """
+        dumper = self._held.pop(key, None)
+        if dumper is None:
+            dumper = self.get(key)
+            while len(self._held) >= self._mopn:
+                self._held.popitem(last=False)[1].release()
+        self._held[key] = dumper
+
+        dumper.hold()
+        dumper(value, name)
+        return self
+
+    def __getitem__(self, key):
+        return self._dmps[key]
+
+    def __contains__(self, key):
+        return key in self._dmps
+
+    def __iter__(self):
+        return iter(self._dmps)
+
+    def __len__(self):
+        return len(self._dmps)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
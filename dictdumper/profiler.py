@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""key-path profiler of dumpers
+
+:mod:`dictdumper.profiler` contains :class:`~dictdumper.profiler.Profiler`
+only, which attributes dumping time and output bytes to key paths of
+content blocks. It is enabled by the ``profile`` argument of dumpers
+and accessed through :attr:`Dumper.profiler <dictdumper.dumper.Dumper.profiler>`.
+Usage sample is described as below.
+
+.. code:: python
+
+    >>> dumper = JSON(file_name, profile=100)  # sample every 100th block
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> print(dumper.profiler.format_report(limit=20))
+    >>> dumper.profiler.export_folded(folded_file)
+
+"""
+# Key-path profiler of dumpers
+# Attribute time and bytes of traversal to normalised key paths
+
+from __future__ import unicode_literals
+
+import collections
+import io
+import time
+
+from dictdumper._types import str_type
+
+__all__ = ['Profiler']
+
+#: Timer function.
+timer = getattr(time, 'perf_counter', time.time)
+
+#: Path segment of array elements (list indices collapsed).
+_ARRAY = '[]'
+
+#: Report sort keys.
+_SORT_KEYS = ('time', 'self_time', 'bytes', 'self_bytes', 'count')
+
+
+def _frame(key):
+    """Sanitise key as frame of folded stacks.
+
+    Args:
+        key (str): key of value
+
+    Returns:
+        str: key with separators (``;``) and whitespaces replaced
+
+    """
+    return ''.join('_' if (char == ';' or char.isspace()) else char for char in str_type(key))
+
+
+class Profiler(object):  # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+    """Key-path profiler of a dumper.
+
+    .. code:: python
+
+        >>> dumper = JSON(file_name, profile=100)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper.profiler.report()
+        [('frame', 1, 0.0001, 0.00001, 84, 20), ...]
+
+    Key paths are the dotted keys from the block root, with list
+    indices collapsed into ``[]``, e.g. ``tcp.options[]``. Time and
+    bytes of a key path are inclusive of its children, while self time
+    and self bytes exclude them.
+
+    Attributes:
+        every (int): sample every N-th block
+        blocks (int): number of blocks seen
+        sampled (int): number of blocks sampled
+        count (Counter[str]): number of values per key path
+        time (Counter[str]): inclusive time per key path
+        bytes (Counter[str]): inclusive output bytes per key path
+        self_time (Counter[str]): exclusive time per key path
+        self_bytes (Counter[str]): exclusive output bytes per key path
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def reset(self):
+        """Reset all records."""
+        #: int: Number of blocks seen.
+        self.blocks = 0
+        #: int: Number of blocks sampled.
+        self.sampled = 0
+        #: Counter[str]: Number of values per key path.
+        self.count = collections.Counter()
+        #: Counter[str]: Inclusive time per key path.
+        self.time = collections.Counter()
+        #: Counter[str]: Inclusive output bytes per key path.
+        self.bytes = collections.Counter()
+        #: Counter[str]: Exclusive time per key path.
+        self.self_time = collections.Counter()
+        #: Counter[str]: Exclusive output bytes per key path.
+        self.self_bytes = collections.Counter()
+
+        #: Dict[str, str]: Folded stack of key paths.
+        self._fold = dict()
+        #: List[List[Any]]: Frames of current traversal, as ``[path,
+        #: start time, start position, children time, children bytes]``.
+        self._stck = list()
+
+    def sample(self):
+        """Check if the next block shall be sampled.
+
+        Returns:
+            bool: if the block is sampled
+
+        """
+        sampled = self.blocks % self.every == 0
+        self.blocks += 1
+        if sampled:
+            self.sampled += 1
+            del self._stck[:]
+        return sampled
+
+    def enter(self, key, file):
+        """Enter value of a key.
+
+        Args:
+            key (str): key of the value
+            file (io.IOBase): output file
+
+        """
+        if self._stck:
+            parent = self._stck[-1][0]
+            path = '%s.%s' % (parent, key)
+            fold = '%s;%s' % (self._fold[parent], _frame(key))
+        else:
+            path = str_type(key)
+            fold = _frame(key)
+        self._fold.setdefault(path, fold)
+        self._stck.append([path, timer(), file.tell(), 0.0, 0])
+
+    def enter_array(self, file):
+        """Enter elements of an array.
+
+        Args:
+            file (io.IOBase): output file
+
+        """
+        if self._stck:
+            parent = self._stck[-1][0]
+            path = parent + _ARRAY
+            fold = '%s;%s' % (self._fold[parent], _ARRAY)
+        else:
+            path = fold = _ARRAY
+        self._fold.setdefault(path, fold)
+        self._stck.append([path, timer(), file.tell(), 0.0, 0])
+
+    def leave(self, file):
+        """Leave current key or array.
+
+        Args:
+            file (io.IOBase): output file
+
+        """
+        path, start, sptr, ctime, csize = self._stck.pop()
+        elapsed = timer() - start
+        size = file.tell() - sptr
+
+        self.count[path] += 1
+        self.time[path] += elapsed
+        self.bytes[path] += size
+        self.self_time[path] += elapsed - ctime
+        self.self_bytes[path] += size - csize
+
+        if self._stck:
+            frame = self._stck[-1]
+            frame[3] += elapsed
+            frame[4] += size
+
+    def report(self, sort='time', limit=None):
+        """Report records of key paths.
+
+        Args:
+            sort (Literal['time', 'self_time', 'bytes', 'self_bytes', 'count']):
+                sort key, in descending order
+            limit (Optional[int]): maximum number of key paths
+
+        Returns:
+            List[Tuple[str, int, float, float, int, int]]: ``(key path,
+            count, time, self time, bytes, self bytes)`` of key paths
+
+        Raises:
+            ValueError: unknown sort key
+
+        """
+        if sort not in _SORT_KEYS:
+            raise ValueError('unknown sort key: %s' % sort)
+        table = getattr(self, sort)
+
+        paths = sorted(self.count, key=lambda path: (-table[path], path))
+        if limit is not None:
+            paths = paths[:limit]
+        return [(path, self.count[path], self.time[path], self.self_time[path],
+                 self.bytes[path], self.self_bytes[path]) for path in paths]
+
+    def format_report(self, sort='time', limit=None):
+        """Format report of key paths as text table.
+
+        Args:
+            sort (Literal['time', 'self_time', 'bytes', 'self_bytes', 'count']):
+                sort key, in descending order
+            limit (Optional[int]): maximum number of key paths
+
+        Returns:
+            str: formatted report
+
+        """
+        lines = ['%d of %d blocks sampled' % (self.sampled, self.blocks),
+                 '%12s %12s %12s %12s %12s  %s' % ('count', 'time (ms)', 'self (ms)',
+                                                   'bytes', 'self bytes', 'key path')]
+        for (path, count, ttime, stime, size, ssize) in self.report(sort, limit):
+            lines.append('%12d %12.3f %12.3f %12d %12d  %s' % (count, ttime * 1e3, stime * 1e3,
+                                                              size, ssize, path))
+        return '\n'.join(lines) + '\n'
+
+    def folded(self, weight='time'):
+        """Format records as folded stacks.
+
+        Args:
+            weight (Literal['time', 'bytes']): weight of stacks, exclusive
+                time in microseconds or exclusive output bytes
+
+        Returns:
+            List[str]: lines of folded stacks, as consumed by
+            ``flamegraph.pl`` and compatible tools
+
+        Raises:
+            ValueError: unknown weight
+
+        """
+        if weight == 'time':
+            values = dict((path, int(round(value * 1e6))) for (path, value) in self.self_time.items())
+        elif weight == 'bytes':
+            values = self.self_bytes
+        else:
+            raise ValueError('unknown weight: %s' % weight)
+        return ['%s %d' % (self._fold[path], values[path])
+                for path in sorted(values, key=self._fold.get) if values[path] > 0]
+
+    def export_folded(self, path, weight='time'):
+        """Write records as folded stacks to a file.
+
+        Args:
+            path (str): path to output file
+            weight (Literal['time', 'bytes']): weight of stacks
+                (c.f. :meth:`folded`)
+
+        """
+        with io.open(path, 'w', encoding='utf-8') as file:
+            for line in self.folded(weight):
+                file.write(line + '\n')
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, every=1):
+        """Initialise profiler.
+
+        Args:
+            every (int): sample every N-th block
+
+        """
+        #: int: Sample every N-th block.
+        self.every = max(int(every), 1)
+        self.reset()
+
+    def __repr__(self):
+        return 'Profiler(every=%d, sampled=%d)' % (self.every, self.sampled)
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""streaming block readers
+
+:mod:`dictdumper.reader` contains generators reading blocks back from
+output files of :class:`~dictdumper.json.JSON`,
+:class:`~dictdumper.plist.PLIST` and :class:`~dictdumper.tree.Tree`
+dumpers one at a time, without loading the whole file. Usage sample is
+described as below.
+
+.. code:: python
+
+    >>> for (name, value) in read('capture.json'):
+    ...     print(name, value)
+
+Output files are mapped into memory (c.f. :mod:`mmap`), and blocks are
+split at the top-level layout written by dumpers, i.e. ``"name": {...}``
+entries at depth one of JSON, ``<key>name</key><dict>`` entries at depth
+one of PLIST, and name headers of Tree, so that only the current block
+is copied and parsed.
+
+"""
+# Streaming block readers
+# Yield blocks from existing dumps through mmap
+
+import collections
+import contextlib
+import datetime
+import json
+import mmap
+import os
+import plistlib
+import re
+
+from dictdumper.compression import FORMATS
+
+__all__ = ['READERS', 'read', 'read_json', 'read_plist', 'read_tree']
+
+#: Start of top-level entries of JSON output.
+_JSON_HEAD = b'\n\t"'
+#: Tail of JSON output.
+_JSON_TAIL = b'\n}'
+
+#: Start of top-level entries of PLIST output.
+_PLIST_HEAD = b'\n\t<key>'
+#: Tail of PLIST output.
+_PLIST_TAIL = b'</dict>\n</plist>'
+#: Wrapper of top-level entries of PLIST output for parsing.
+_PLIST_WRAP = b'<?xml version="1.0" encoding="UTF-8"?>\n<plist version="1.0">\n<dict>\n%s</dict>\n</plist>\n'
+
+#: Date elements of PLIST output, with fractional seconds unsupported by :mod:`plistlib`.
+_PLIST_DATE = re.compile(br'<date>([^<]*)</date>')
+#: Prefix of dates of PLIST output, marked as strings for parsing.
+_PLIST_DATE_MARK = u'\ue000date:'
+
+#: Separator of blocks of Tree output.
+_TREE_SEP = b'\n\n'
+
+
+@contextlib.contextmanager
+def _mapped(path):
+    """Map an output file into memory.
+
+    Args:
+        path (str): path to the output file
+
+    Yields:
+        Optional[mmap.mmap]: read-only memory map of the output file,
+        :data:`None` if the file is empty
+
+    Raises:
+        ValueError: compressed output file
+
+    """
+    if os.path.splitext(path)[1][1:] in FORMATS.values():
+        raise ValueError('cannot map compressed output file: %s' % path)
+
+    with open(path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield None
+            return
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def _split(data, head, tail):
+    """Split top-level entries of an output file.
+
+    Args:
+        data (mmap.mmap): memory map of the output file
+        head (bytes): start of top-level entries, led by a newline
+        tail (bytes): tail of the output file
+
+    Yields:
+        bytes: top-level entries, without the leading newline
+
+    """
+    stop = data.rfind(tail)
+    if stop == -1:
+        stop = len(data)
+
+    start = data.find(head, 0, stop)
+    while start != -1:
+        end = data.find(head, start + 1, stop)
+        yield data[start + 1:stop if end == -1 else end]
+        start = end
+
+
+def read_json(path):
+    """Read blocks of JSON output file.
+
+    Args:
+        path (str): path to the output file
+
+    Yields:
+        Tuple[str, Any]: name and content of each block
+
+    """
+    with _mapped(path) as data:
+        if data is None:
+            return
+        for chunk in _split(data, _JSON_HEAD, _JSON_TAIL):
+            text = chunk.decode('utf-8').rstrip().rstrip(',')
+            block = json.loads('{%s}' % text, object_pairs_hook=collections.OrderedDict)
+            for item in block.items():
+                yield item
+
+
+def read_plist(path):
+    """Read blocks of PLIST output file.
+
+    Args:
+        path (str): path to the output file
+
+    Yields:
+        Tuple[str, Any]: name and content of each block
+
+    """
+    with _mapped(path) as data:
+        if data is None:
+            return
+        for chunk in _split(data, _PLIST_HEAD, _PLIST_TAIL):
+            dates = b'<date>' in chunk
+            if dates:
+                mark = _PLIST_DATE_MARK.encode('utf-8')
+                chunk = _PLIST_DATE.sub(lambda match: b'<string>' + mark + match.group(1) + b'</string>', chunk)
+
+            text = _PLIST_WRAP % chunk
+            if hasattr(plistlib, 'loads'):
+                block = plistlib.loads(text, dict_type=collections.OrderedDict)
+            else:  # pragma: no cover
+                block = plistlib.readPlistFromString(text)  # pylint: disable=no-member
+            if dates:
+                block = _restore_dates(block)
+            for item in block.items():
+                yield item
+
+
+def _restore_dates(value):
+    """Convert dates of PLIST output marked as strings back.
+
+    Args:
+        value (Any): parsed content
+
+    Returns:
+        Any: content with dates restored
+
+    """
+    if isinstance(value, dict):
+        for (key, item) in value.items():
+            value[key] = _restore_dates(item)
+    elif isinstance(value, list):
+        value[:] = [_restore_dates(item) for item in value]
+    elif isinstance(value, type(_PLIST_DATE_MARK)) and value.startswith(_PLIST_DATE_MARK):
+        text = value[len(_PLIST_DATE_MARK):].rstrip('Z')
+        fmt = '%Y-%m-%dT%H:%M:%S.%f' if '.' in text else '%Y-%m-%dT%H:%M:%S'
+        return datetime.datetime.strptime(text, fmt)
+    return value
+
+
+def read_tree(path):
+    """Read blocks of Tree output file.
+
+    As the tree-view layout does not preserve content types, blocks are
+    yielded as text, i.e. their branches without the name header.
+
+    Args:
+        path (str): path to the output file
+
+    Yields:
+        Tuple[str, str]: name and text of each block
+
+    """
+    with _mapped(path) as data:
+        if data is None:
+            return
+
+        start = 0
+        while start < len(data):
+            # blocks are separated by a blank line before the next name header
+            end = data.find(_TREE_SEP, start)
+            while end != -1 and data[end + 2:end + 3] in (b' ', b'\n'):
+                end = data.find(_TREE_SEP, end + 1)
+            if end == -1:
+                end = len(data)
+
+            text = data[start:end].decode('utf-8').rstrip('\n')
+            name, _, branch = text.partition('\n')
+            yield name.rstrip(), branch
+            start = end + 2
+
+
+#: Dict[str, Callable[[str], Iterator[Tuple[str, Any]]]]: Readers of file formats.
+READERS = {
+    'json': read_json,
+    'plist': read_plist,
+    'txt': read_tree,
+}
+
+
+def read(path, kind=None):
+    """Read blocks of an output file.
+
+    Args:
+        path (str): path to the output file
+        kind (Optional[Literal['json', 'plist', 'txt']]): file format of
+            the output file, default to its extension
+
+    Returns:
+        Iterator[Tuple[str, Any]]: name and content of each block
+
+    Raises:
+        ValueError: unsupported file format
+
+    """
+    if kind is None:
+        kind = os.path.splitext(path)[1][1:]
+    if kind not in READERS:
+        raise ValueError('unsupported file format: %s' % kind)
+    return READERS[kind](path)
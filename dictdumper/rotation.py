@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""output rotation of dumpers
+
+:mod:`dictdumper.rotation` contains :class:`~dictdumper.rotation.Rotation`
+only, which describes when a dumper shall close its output file and
+start a new segment, and what to do with the rotated segments. It is
+enabled by the ``rotate`` argument of dumpers. Usage sample is described
+as below.
+
+.. code:: python
+
+    >>> rotation = Rotation(blocks=100000, size=1 << 30, interval=3600,
+    ...                     callback=print, compress='gzip')
+    >>> dumper = JSON('capture.json', rotate=rotation)
+    >>> dumper(content_dict_1, name=content_name_1)
+    ............
+    >>> dumper.close()  # wait for pending compressions
+
+Segments are named after the output file, i.e. ``capture.json``,
+``capture.0001.json``, ``capture.0002.json``, etc., each of which is a
+complete document with its own heads and tails.
+
+"""
+# Output rotation of dumpers
+# Start new segments after N blocks, M bytes or T seconds
+
+import functools
+import os
+import threading
+import time
+
+from dictdumper.compression import _CHUNK_SIZE, FORMATS, CompressedFile
+
+__all__ = ['Rotation']
+
+#: Monotonic timer function.
+timer = getattr(time, 'monotonic', time.time)
+
+
+def _compress_file(path, compress):
+    """Compress a file and remove the original.
+
+    The file is copied chunk by chunk, each committed to the compressor
+    at once (c.f. :meth:`CompressedFile.commit
+    <dictdumper.compression.CompressedFile.commit>`), so that memory
+    usage does not grow with the size of the file.
+
+    Args:
+        path (str): path to the file
+        compress (Literal['gzip', 'bz2', 'xz']): compression format
+
+    Returns:
+        str: path to the compressed file
+
+    """
+    dest = '%s.%s' % (path, FORMATS[compress])
+    with open(path, 'rb') as src, CompressedFile(dest, 'w', compress) as dst:
+        for chunk in iter(functools.partial(src.read, _CHUNK_SIZE), b''):
+            dst.write(chunk)
+            dst.commit()
+    os.remove(path)
+    return dest
+
+
+class Rotation(object):  # pylint: disable=useless-object-inheritance
+    """Rotation policy of output files.
+
+    .. code:: python
+
+        >>> dumper = Tree(file_name, rotate=Rotation(size=64 << 20))
+
+    Limits are checked before each block, and a dumper rotates once its
+    current segment reaches any of them, thus segments hold at most
+    ``blocks`` blocks, and exceed ``size`` bytes by at most the last
+    block. Idle dumpers do not rotate until the next block, and closing
+    a dumper never leaves an empty segment behind.
+
+    Once a segment is rotated (and compressed, if enabled), ``callback``
+    is called with its path. With compression, this happens in a
+    background thread, and the callback shall be thread-safe.
+
+    Attributes:
+        blocks (Optional[int]): maximum number of blocks per segment
+        size (Optional[int]): maximum size of segments in bytes
+        interval (Optional[float]): maximum age of segments in seconds
+        callback (Optional[Callable[[str], Any]]): function called with
+            path to each rotated segment
+        compress (Optional[Literal['gzip', 'bz2', 'xz']]): compression
+            format of rotated segments
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def due(self, blocks, size, start):
+        """Check if a segment shall be rotated.
+
+        Args:
+            blocks (int): number of blocks in the segment
+            size (int): size of the segment in bytes
+            start (float): start time of the segment (c.f. :data:`timer`)
+
+        Returns:
+            bool: if the segment reaches any of the limits
+
+        """
+        if self.blocks is not None and blocks >= self.blocks:
+            return True
+        if self.size is not None and size >= self.size:
+            return True
+        return self.interval is not None and timer() - start >= self.interval
+
+    def submit(self, path):
+        """Finish a rotated segment.
+
+        Args:
+            path (str): path to the rotated segment
+
+        """
+        if self.compress is None:
+            if self.callback is not None:
+                self.callback(path)
+            return
+
+        thread = threading.Thread(target=self._finish, args=(path,))
+        thread.daemon = True
+        thread.start()
+        with self._lock:
+            self._thrd = [item for item in self._thrd if item.is_alive()]
+            self._thrd.append(thread)
+
+    def wait(self):
+        """Wait for pending compressions of rotated segments.
+
+        Raises:
+            Exception: the first error raised in background threads
+
+        """
+        with self._lock:
+            threads, self._thrd = self._thrd, list()
+        for thread in threads:
+            thread.join()
+
+        with self._lock:
+            errors, self._errs = self._errs, list()
+        if errors:
+            raise errors[0]
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, blocks=None, size=None, interval=None, callback=None, compress=None):
+        """Initialise rotation policy.
+
+        Args:
+            blocks (Optional[int]): maximum number of blocks per segment
+            size (Optional[int]): maximum size of segments in bytes
+            interval (Optional[float]): maximum age of segments in seconds
+            callback (Optional[Callable[[str], Any]]): function called with
+                path to each rotated segment
+            compress (Optional[Literal['gzip', 'bz2', 'xz']]): compression
+                format of rotated segments
+
+        Raises:
+            ValueError: unknown compression format
+
+        """
+        if compress is not None and compress not in FORMATS:
+            raise ValueError('unknown compression format: %s' % compress)
+
+        #: Optional[int]: Maximum number of blocks per segment.
+        self.blocks = None if blocks is None else max(int(blocks), 1)
+        #: Optional[int]: Maximum size of segments in bytes.
+        self.size = None if size is None else max(int(size), 1)
+        #: Optional[float]: Maximum age of segments in seconds.
+        self.interval = interval
+        #: Optional[Callable[[str], Any]]: Function called with path to each rotated segment.
+        self.callback = callback
+        #: Optional[str]: Compression format of rotated segments.
+        self.compress = compress
+
+        #: List[threading.Thread]: Pending compression threads.
+        self._thrd = list()
+        #: List[Exception]: Errors raised in compression threads.
+        self._errs = list()
+        #: threading.Lock: Lock of pending threads and errors.
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'Rotation(blocks=%r, size=%r, interval=%r, compress=%r)' % (
+            self.blocks, self.size, self.interval, self.compress)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _finish(self, path):
+        """Compress a rotated segment and call back, in background thread.
+
+        Args:
+            path (str): path to the rotated segment
+
+        """
+        try:
+            dest = _compress_file(path, self.compress)
+            if self.callback is not None:
+                self.callback(dest)
+        except Exception as error:  # pylint: disable=broad-except
+            with self._lock:
+                self._errs.append(error)
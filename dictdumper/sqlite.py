@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""dumper a SQLite database
+
+:mod:`dictdumper.sqlite` contains :class:`~dictdumper.sqlite.SQLite`
+only, which dumpers blocks as rows of a SQLite database file. Usage
+sample is described as below.
+
+.. code:: python
+
+    >>> dumper = SQLite(file_name)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.close()
+
+"""
+# Writer for SQLite databases
+# Dump a SQLite database for PCAP analyser
+
+from __future__ import unicode_literals
+
+import array
+import io
+import os
+import sqlite3
+
+from dictdumper._types import str_type
+from dictdumper.dumper import Dumper
+from dictdumper.json import JSON
+from dictdumper.stats import timer
+from dictdumper.tree import Tree
+
+__all__ = ['SQLite']
+
+#: Table schema of dumped blocks.
+_TABLE_SCHEMA = '''\
+CREATE TABLE blocks (
+    seq INTEGER PRIMARY KEY,
+    name TEXT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+)'''
+
+#: Index schema of block names.
+_INDEX_SCHEMA = 'CREATE INDEX blocks_name ON blocks (name)'
+
+#: Statement to insert a block.
+_INSERT_STMT = 'INSERT INTO blocks (seq, name, kind, payload) VALUES (?, ?, ?, ?)'
+
+#: Supported journal modes.
+_JOURNAL_MODES = ('delete', 'truncate', 'persist', 'memory', 'wal', 'off')
+
+#: Supported synchronous levels.
+_SYNCHRONOUS = ('off', 'normal', 'full', 'extra')
+
+
+def _render_json(dumper, value, name):  # pylint: disable=unused-argument
+    """Render a block as JSON object.
+
+    If rendering fails, counters of the inner dumper are restored, so
+    that later payloads are not affected.
+
+    Args:
+        dumper (JSON): inner dumper
+        value (Dict[str, Any]): content to be dumped
+        name (str): name of current content block
+
+    Returns:
+        str: rendered payload
+
+    """
+    tctr = dumper._tctr  # pylint: disable=protected-access
+    vctr = dumper._vctr[tctr]  # pylint: disable=protected-access
+
+    file = io.StringIO()
+    try:
+        dumper._append_object(value, file)  # pylint: disable=protected-access
+    except BaseException:
+        dumper._tctr = tctr  # pylint: disable=protected-access
+        dumper._vctr[tctr] = vctr  # pylint: disable=protected-access
+        dumper._vctr[tctr + 1:] = array.array('I', [0]) * (len(dumper._vctr) - tctr - 1)  # pylint: disable=protected-access
+        raise
+    return file.getvalue()
+
+
+def _render_tree(dumper, value, name):
+    """Render a block as tree-view text.
+
+    If rendering fails, counters and branch context of the inner dumper
+    are restored, so that later payloads are not affected.
+
+    Args:
+        dumper (Tree): inner dumper
+        value (Dict[str, Any]): content to be dumped
+        name (str): name of current content block
+
+    Returns:
+        str: rendered payload
+
+    """
+    tctr = dumper._tctr  # pylint: disable=protected-access
+
+    file = io.StringIO()
+    file.write(str_type(name))
+    del dumper._bctx[:]  # pylint: disable=protected-access
+    try:
+        dumper._append_branch(value, file)  # pylint: disable=protected-access
+    except BaseException:
+        dumper._tctr = tctr  # pylint: disable=protected-access
+        del dumper._bctx[:]  # pylint: disable=protected-access
+        raise
+    return file.getvalue()
+
+
+#: Dict[str, Tuple[Type[Dumper], Callable[[Dumper, Dict[str, Any], str], str]]]:
+#: Inner dumpers and renderers of supported payload formats.
+_PAYLOAD_FORMATS = {
+    'json': (JSON, _render_json),
+    'tree': (Tree, _render_tree),
+}
+
+
+class SQLite(Dumper):
+    """Dump blocks as rows of SQLite database file.
+
+    .. code:: python
+
+        >>> dumper = SQLite(file_name)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper(content_dict_2, name=content_name_2)
+        ............
+        >>> dumper.close()
+
+    Each block is stored as a row ``(seq, name, kind, payload)`` of the
+    ``blocks`` table, where ``seq`` is the (zero-based) sequence number of
+    the block, ``kind`` is the file format of the payload and ``payload``
+    is the block rendered in the chosen inner format (``'json'`` or
+    ``'tree'``). The ``name`` column is indexed.
+
+    Attributes:
+        _file (str): output file name
+        _conn (sqlite3.Connection): database connection
+        _pfmt (str): payload format
+        _pdmp (Dumper): inner dumper rendering payloads
+        _bsiz (int): number of rows to insert per transaction
+        _jmod (str): journal mode of the database
+        _sync (str): synchronous level of the database
+        _sctr (int): block sequence counter
+        _rows (List[Tuple[int, str, str, str]]): pending rows
+
+    .. note::
+
+        Rows are buffered and inserted in batched transactions, thus
+        :meth:`close` (or :meth:`flush`) must be called for the database
+        to be complete.
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        """File format of current dumper.
+
+        :rtype: Literal['sqlite']
+        """
+        return 'sqlite'
+
+    @property
+    def held(self):
+        """If the database connection is held open.
+
+        :rtype: bool
+        """
+        return self._conn is not None
+
+    ##########################################################################
+    # Attributes.
+    ##########################################################################
+
+    __slots__ = ('_pfmt', '_pdmp', '_bsiz', '_jmod', '_sync', '_sctr', '_rows', '_conn')
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def flush(self):
+        """Insert pending rows in a transaction."""
+        if not self._rows:
+            return
+
+        if self._stat is not None:
+            start = timer()
+
+        if self._conn is None:
+            self._connect()
+        self._conn.execute('BEGIN')
+        try:
+            self._conn.executemany(_INSERT_STMT, self._rows)
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+        if self._stat is not None:
+            self._stat.io_time += timer() - start
+            self._stat.bytes += sum(len(row[3].encode('utf-8')) for row in self._rows)
+            self._stat.flushes += 1
+        del self._rows[:]
+
+    def hold(self):
+        """Hold the database connection open across calls."""
+        if self._conn is None:
+            self._connect()
+
+    def release(self):
+        """Insert all pending rows and close the database connection.
+
+        The connection is reopened as needed by later calls.
+
+        """
+        self.flush()
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            conn.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, payload='json', batch=1000,
+                 journal_mode='wal', synchronous='normal', **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            payload (Literal['json', 'tree']): format of payloads
+            batch (int): number of rows to insert per transaction
+            journal_mode (str): journal mode of the database
+                (c.f. ``PRAGMA journal_mode``)
+            synchronous (str): synchronous level of the database
+                (c.f. ``PRAGMA synchronous``)
+            **kwargs: addition keyword arguments for initialisation
+
+        Raises:
+            ValueError: unknown payload format, journal mode or
+                synchronous level, or compression, index, backend or
+                durability requested
+
+        """
+        if kwargs.get('compression') is not None:
+            raise ValueError('compression is not supported by SQLite')
+        if kwargs.get('index'):
+            raise ValueError('index is not supported by SQLite')
+        if kwargs.get('backend', 'file') != 'file':
+            raise ValueError('backend is not supported by SQLite')
+        if kwargs.get('durability', 'none') != 'none':
+            raise ValueError('durability is not supported by SQLite, use synchronous instead')
+        if payload not in _PAYLOAD_FORMATS:
+            raise ValueError('unknown payload format: %s' % payload)
+        if journal_mode.lower() not in _JOURNAL_MODES:
+            raise ValueError('unknown journal mode: %s' % journal_mode)
+        if synchronous.lower() not in _SYNCHRONOUS:
+            raise ValueError('unknown synchronous level: %s' % synchronous)
+
+        dumper, _ = _PAYLOAD_FORMATS[payload]
+
+        #: str: Payload format.
+        self._pfmt = payload
+        #: Dumper: Inner dumper rendering payloads.
+        self._pdmp = dumper(os.devnull)
+        self._pdmp._tctr = 0  # pylint: disable=protected-access
+        #: int: Number of rows to insert per transaction.
+        self._bsiz = max(batch, 1)
+        #: str: Journal mode of the database.
+        self._jmod = journal_mode.lower()
+        #: str: Synchronous level of the database.
+        self._sync = synchronous.lower()
+        #: int: Block sequence counter.
+        self._sctr = 0
+        #: List[Tuple[int, str, str, str]]: Pending rows.
+        self._rows = list()
+        #: sqlite3.Connection: Database connection.
+        self._conn = None
+
+        super(SQLite, self).__init__(fname, **kwargs)
+
+        # share metrics, profiler and memo with inner dumper, which renders
+        # every value of the payloads
+        self._pdmp._stat = self._stat  # pylint: disable=protected-access
+        self._pdmp._prof = self._prof  # pylint: disable=protected-access
+        self._pdmp._memo = self._memo  # pylint: disable=protected-access
+
+    def __call__(self, value, name=None):
+        """Dumper a new block.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            name (str): name of current content block
+
+        Returns:
+            SQLite: the dumper class itself (to support chain calling)
+
+        """
+        if self._rott is not None:
+            self._rollover()
+        if self._stat is not None:
+            token = self._stat.start()
+        if self._prof is not None:
+            self._pdmp._pact = self._prof if self._prof.sample() else None  # pylint: disable=protected-access
+
+        written = False
+        try:
+            _, render = _PAYLOAD_FORMATS[self._pfmt]
+            try:
+                text = render(self._pdmp, value, name)
+            except BaseException:
+                if self._rott is not None:
+                    self._rblk -= 1
+                raise
+
+            self._rows.append((self._sctr, None if name is None else str_type(name),
+                               self._pdmp.kind, text))
+            self._sctr += 1
+
+            if len(self._rows) >= self._bsiz:
+                self.flush()
+            written = True
+        finally:
+            if self._stat is not None:
+                self._stat.stop(token, written)
+        return self
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _dump_header(self, **kwargs):  # pylint: disable=unused-argument
+        """Initially create the database schema.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._sctr = 0
+
+        self._connect()
+        self._conn.execute('BEGIN')
+        self._conn.execute('DROP TABLE IF EXISTS blocks')
+        self._conn.execute(_TABLE_SCHEMA)
+        self._conn.execute(_INDEX_SCHEMA)
+        self._conn.execute('COMMIT')
+
+    def _resume_header(self, **kwargs):
+        """Recover block sequence counter from an existing database.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._connect()
+        if self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'blocks'").fetchone() is None:
+            self._dump_header(**kwargs)
+            return
+
+        last, = self._conn.execute('SELECT max(seq) FROM blocks').fetchone()
+        self._sctr = 0 if last is None else last + 1
+
+    def _connect(self):
+        """Connect to the database and apply ``PRAGMA`` settings."""
+        self._conn = sqlite3.connect(self._file, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode = %s' % self._jmod)
+        self._conn.execute('PRAGMA synchronous = %s' % self._sync)
+
+    def _size(self):
+        """Size of current segment, as of the last flush.
+
+        Returns:
+            int: size of the database (and its write-ahead log) in bytes
+
+        """
+        size = 0
+        for path in (self._file, self._file + '-wal'):
+            if os.path.isfile(path):
+                size += os.path.getsize(path)
+        return size
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""runtime metrics of dumpers
+
+:mod:`dictdumper.stats` contains :class:`~dictdumper.stats.Stats`
+only, which collects runtime metrics of a dumper. It is enabled by
+the ``stats`` argument of dumpers and accessed through
+:attr:`Dumper.stats <dictdumper.dumper.Dumper.stats>`. Usage sample
+is described as below.
+
+.. code:: python
+
+    >>> dumper = JSON(file_name, stats=True)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+    >>> dumper.stats.snapshot()
+    >>> dumper.stats.export_prometheus(metrics_file)
+
+"""
+# Runtime metrics of dumpers
+# Count blocks, bytes, handlers and time spent in dumpers
+
+from __future__ import unicode_literals
+
+import collections
+import io
+import os
+import time
+
+from dictdumper._types import str_type
+
+__all__ = ['Stats']
+
+#: Timer function.
+timer = getattr(time, 'perf_counter', time.time)
+
+#: Tuple[Tuple[str, str, str]]: Prometheus metrics of scalar counters,
+#: as ``(attribute, metric name, help text)``.
+_PROMETHEUS_COUNTERS = (
+    ('blocks', 'blocks_total', 'Number of blocks written.'),
+    ('bytes', 'bytes_total', 'Number of bytes written to output files.'),
+    ('defaults', 'defaults_total', 'Number of values falling back to default().'),
+    ('hooks', 'hooks_total', 'Number of values converted by object_hook().'),
+    ('flushes', 'flushes_total', 'Number of flushes of output files.'),
+    ('encode_time', 'encode_seconds_total', 'Time spent encoding blocks.'),
+    ('io_time', 'io_seconds_total', 'Time spent on I/O of output files.'),
+)
+
+
+def _escape(value):
+    """Escape Prometheus label value.
+
+    Args:
+        value (str): label value
+
+    Returns:
+        str: escaped label value
+
+    """
+    return str_type(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    """Format Prometheus labels.
+
+    Args:
+        labels (List[Tuple[str, str]]): label names and values
+
+    Returns:
+        str: formatted labels, e.g. ``'{kind="json"}'``
+
+    """
+    if not labels:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (key, _escape(val)) for (key, val) in labels)
+
+
+class _TracedFile(object):  # pylint: disable=useless-object-inheritance
+    """File object tracing I/O time, bytes written and flushes.
+
+    Bytes written are counted by positions of the file rather than
+    encoding written text once more, i.e. by the distance travelled by
+    each run of writes, as of the next :meth:`tell`, :meth:`seek`,
+    :meth:`truncate` or :meth:`close`, which dumpers call at block
+    boundaries anyway.
+
+    Args:
+        file (io.IOBase): file object to be traced
+        stats (Stats): metrics to be updated
+
+    """
+
+    def __init__(self, file, stats):
+        self._file = file
+        self._stat = stats
+        #: Optional[int]: Position where the current run of writes started.
+        self._mark = None
+        #: bool: If the current run of writes is not yet counted.
+        self._dirt = False
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, data):
+        """Write ``data``."""
+        start = timer()
+        if self._mark is None:
+            self._mark = self._file.tell()
+        size = self._file.write(data)
+        self._dirt = True
+        self._stat.io_time += timer() - start
+        return size
+
+    def seek(self, *args):
+        """Seek to position."""
+        start = timer()
+        try:
+            self._count()
+            self._mark = self._file.seek(*args)
+            return self._mark
+        finally:
+            self._stat.io_time += timer() - start
+
+    def tell(self):
+        """Current position."""
+        start = timer()
+        try:
+            self._count()
+            return self._mark
+        finally:
+            self._stat.io_time += timer() - start
+
+    def truncate(self, *args):
+        """Truncate file."""
+        start = timer()
+        try:
+            self._count()
+            self._mark = None  # position of some files moved, e.g. compressed
+            return self._file.truncate(*args)
+        finally:
+            self._stat.io_time += timer() - start
+
+    def flush(self):
+        """Flush write buffers."""
+        start = timer()
+        try:
+            return self._file.flush()
+        finally:
+            self._stat.io_time += timer() - start
+            self._stat.flushes += 1
+
+    def close(self):
+        """Flush write buffers and close file."""
+        start = timer()
+        try:
+            if not self._file.closed:
+                self._count()
+            return self._file.close()
+        finally:
+            self._stat.io_time += timer() - start
+            self._stat.flushes += 1
+
+    def _count(self):
+        """Count bytes of the current run of writes, and update current position."""
+        if self._mark is None or self._dirt:
+            pos = self._file.tell()
+            if self._dirt:
+                self._stat.bytes += pos - self._mark
+                self._dirt = False
+            self._mark = pos
+
+
+class Stats(object):  # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+    """Runtime metrics of a dumper.
+
+    .. code:: python
+
+        >>> dumper = JSON(file_name, stats=True)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper.stats.blocks
+        1
+
+    Time spent in a dumper call is split into I/O time, i.e. opening,
+    seeking and writing output files, and encode time, i.e. the rest.
+
+    Attributes:
+        blocks (int): number of blocks written
+        bytes (int): number of bytes written to output files
+        handlers (Counter[str]): number of values per ``_append_*``
+            handler, keyed by type code (e.g. ``'string'``)
+        defaults (int): number of values falling back to
+            :meth:`~dictdumper.dumper.Dumper.default`
+        hooks (int): number of values converted by
+            :meth:`~dictdumper.dumper.Dumper.object_hook`, i.e. for which
+            it returns another object
+        flushes (int): number of flushes of output files
+        encode_time (float): cumulative encode time in seconds
+        io_time (float): cumulative I/O time in seconds
+        labels (List[Tuple[str, str]]): labels of Prometheus metrics
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def reset(self):
+        """Reset all metrics to zero."""
+        #: int: Number of blocks written.
+        self.blocks = 0
+        #: int: Number of bytes written to output files.
+        self.bytes = 0
+        #: Counter[str]: Number of values per ``_append_*`` handler.
+        self.handlers = collections.Counter()
+        #: int: Number of values falling back to ``default()``.
+        self.defaults = 0
+        #: int: Number of values converted by ``object_hook()``.
+        self.hooks = 0
+        #: int: Number of flushes of output files.
+        self.flushes = 0
+        #: float: Cumulative encode time in seconds.
+        self.encode_time = 0.0
+        #: float: Cumulative I/O time in seconds.
+        self.io_time = 0.0
+
+    def snapshot(self):
+        """Copy current metrics.
+
+        Returns:
+            Dict[str, Any]: current metrics, with ``handlers`` sorted
+            by type code
+
+        """
+        snap = collections.OrderedDict()
+        snap['blocks'] = self.blocks
+        snap['bytes'] = self.bytes
+        snap['handlers'] = collections.OrderedDict(sorted(self.handlers.items()))
+        snap['defaults'] = self.defaults
+        snap['hooks'] = self.hooks
+        snap['flushes'] = self.flushes
+        snap['encode_time'] = self.encode_time
+        snap['io_time'] = self.io_time
+        return snap
+
+    def to_prometheus(self, prefix='dictdumper'):
+        """Format metrics in Prometheus text exposition format.
+
+        Args:
+            prefix (str): prefix of metric names
+
+        Returns:
+            str: formatted metrics
+
+        """
+        labels = _format_labels(self.labels)
+        lines = list()
+        for (attr, name, text) in _PROMETHEUS_COUNTERS:
+            lines.append('# HELP %s_%s %s' % (prefix, name, text))
+            lines.append('# TYPE %s_%s counter' % (prefix, name))
+            lines.append('%s_%s%s %s' % (prefix, name, labels, getattr(self, attr)))
+
+        name = '%s_handler_values_total' % prefix
+        lines.append('# HELP %s Number of values per handler.' % name)
+        lines.append('# TYPE %s counter' % name)
+        for (code, count) in sorted(self.handlers.items()):
+            lines.append('%s%s %d' % (name, _format_labels(list(self.labels) + [('handler', code)]), count))
+        return '\n'.join(lines) + '\n'
+
+    def export_prometheus(self, path, prefix='dictdumper'):
+        """Write metrics in Prometheus text exposition format to a file.
+
+        The file is replaced atomically, thus it is safe to be collected
+        (e.g. by the textfile collector of ``node_exporter``) at any time.
+
+        Args:
+            path (str): path to output file
+            prefix (str): prefix of metric names
+
+        """
+        temp = '%s.%d.tmp' % (path, os.getpid())
+        with io.open(temp, 'w', encoding='utf-8') as file:
+            file.write(self.to_prometheus(prefix))
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+        os.rename(temp, path)
+
+    def open(self, opener, *args, **kwargs):
+        """Open a file and trace its I/O.
+
+        Args:
+            opener (Callable[..., io.IOBase]): function to open the file
+            *args: positional arguments of ``opener``
+            **kwargs: keyword arguments of ``opener``
+
+        Returns:
+            io.IOBase: the traced file object
+
+        """
+        start = timer()
+        file = opener(*args, **kwargs)
+        self.io_time += timer() - start
+        return _TracedFile(file, self)
+
+    def start(self):
+        """Start measuring a block.
+
+        Returns:
+            Tuple[float, float]: token to :meth:`stop`
+
+        """
+        return (timer(), self.io_time)
+
+    def stop(self, token, written=True):
+        """Stop measuring a block.
+
+        Args:
+            token (Tuple[float, float]): token from :meth:`start`
+            written (bool): if the block is written, or rolled back
+                otherwise, thus timed but not counted
+
+        """
+        start, io_time = token
+        self.encode_time += (timer() - start) - (self.io_time - io_time)
+        if written:
+            self.blocks += 1
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, labels=None):
+        """Initialise metrics.
+
+        Args:
+            labels (Optional[List[Tuple[str, str]]]): labels of Prometheus metrics
+
+        """
+        #: List[Tuple[str, str]]: Labels of Prometheus metrics.
+        self.labels = list(labels or ())
+        self.reset()
+
+    def __repr__(self):
+        return 'Stats(blocks=%d, bytes=%d)' % (self.blocks, self.bytes)
@@ -24,9 +24,11 @@ import math
 import os
 import textwrap
 
+from dictdumper._arrays import ArrayType, chunks
 from dictdumper._dateutil import isoformat
-from dictdumper._hexlify import hexlify
-from dictdumper._types import bytes_type, str_type
+from dictdumper._hexlify import byteview, decode, hexlify
+from dictdumper._iterutil import lookahead, peek
+from dictdumper._types import Iterable, Mapping, bytes_type, str_type
 from dictdumper.dumper import Dumper
 
 __all__ = ['Tree']
@@ -55,6 +57,23 @@ _TEMP_BRANCH = '  |   '  # branch
 #: Spaces template
 _TEMP_SPACES = '      '  # spaces
 
+#: Types written as typed wrappers.
+_WRAPPER_TYPES = (bytearray, memoryview, tuple, set, frozenset)
+
+
+def _label_bytes(value):
+    """Format bytes of up to 16 octets as a label.
+
+    Args:
+        value (bytes): bytes to format
+
+    Returns:
+        str: label of space-separated hexadecimal octets
+
+    """
+    text = ' '.join(textwrap.wrap(hexlify(value), 2))
+    return '-> {text}'.format(text=text)
+
 
 @contextlib.contextmanager
 def indent(ctx, branch=True):
@@ -149,6 +168,7 @@ class Tree(Dumper):
 
         # branch
         (dict, 'branch'),
+        (Mapping, 'branch'),
 
         # none
         (type(None), 'none'),
@@ -168,6 +188,19 @@ class Tree(Dumper):
 
         # array
         (list, 'array'),
+
+        # typed wrappers
+        (bytearray, 'binary'),
+        (memoryview, 'binary'),
+        (tuple, 'collection'),
+        (set, 'collection'),
+        (frozenset, 'collection'),
+
+        # typed arrays
+        (ArrayType, 'buffer'),
+
+        # array (other iterables)
+        (Iterable, 'array'),
     )
 
     ##########################################################################
@@ -179,7 +212,7 @@ class Tree(Dumper):
         """Check if newline is needed.
 
         Args:
-            value (Union[Dict[str, Any], AnyStr]): value to check if
+            value (Union[Mapping[str, Any], AnyStr]): value to check if
                 new line is needed
 
         Returns:
@@ -188,14 +221,15 @@ class Tree(Dumper):
         Notes:
             Newline is needed if
 
-            1. ``value`` is a :obj:`dict`
+            1. ``value`` is a mapping (:class:`~collections.abc.Mapping`)
+               or a typed wrapper (c.f. :data:`~dictdumper.tree._WRAPPER_TYPES`)
             2. ``value`` is string (:obj:`str`) and its length is greater than
                32 distinct characters
             3. ``value`` is bytestring (:obj:`bytes`) and the length of its hex
                representation is greater than 40 distinct characters
 
         """
-        if isinstance(value, dict):
+        if isinstance(value, (Mapping,) + _WRAPPER_TYPES):
             return True
         if isinstance(value, str_type):
             return len(value) > 40
@@ -207,20 +241,78 @@ class Tree(Dumper):
     # Attributes.
     ##########################################################################
 
-    #: int: Branch number counter.
-    _nctr = 0
-    #: List[str]: Blank branch (indentation) context record.
-    _bctx = list()
+    __slots__ = ('_nctr', '_bctx')
 
     #: Tree-view head string.
     _hsrt = _HEADER_START
     #: Tree-view tail string.
     _hend = _HEADER_END
 
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            **kwargs: addition keyword arguments for initialisation
+
+        """
+        #: int: Branch number counter.
+        self._nctr = 0
+        #: List[str]: Blank branch (indentation) context record.
+        self._bctx = list()
+
+        super(Tree, self).__init__(fname, **kwargs)
+
     ##########################################################################
     # Utilities.
     ##########################################################################
 
+    def _dump_header(self, **kwargs):
+        """Initially dump file heads and tails.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        self._nctr = 0
+        super(Tree, self)._dump_header(**kwargs)
+
+    def _checkpoint(self):
+        """Save counters before dumping a block.
+
+        Returns:
+            Tuple[int, int, int]: appending point, tab level counter and
+            branch number counter
+
+        """
+        return (self._sptr, self._tctr, self._nctr)
+
+    def _rollback(self, file, state):
+        """Roll back a partially dumped block.
+
+        Args:
+            file (io.IOBase): output file
+            state (Tuple[int, int, int]): counters saved by :meth:`_checkpoint`
+
+        """
+        self._nctr = state[2]
+        del self._bctx[:]
+        super(Tree, self)._rollback(file, state)
+
+    def _resume_header(self, **kwargs):
+        """Recover appending point and branch counter from an existing output file.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        super(Tree, self)._resume_header(**kwargs)
+        self._nctr = int(self._sptr > len(self._hsrt))
+
     def _encode_value(self, o):  # pylint: disable=unused-argument
         """Convert content for function call.
 
@@ -234,19 +326,26 @@ class Tree(Dumper):
             The function is a direct wrapper for :meth:`~dictdumper.dumper.Dumper.object_hook`.
 
         Notes:
-            The function will by default converts :obj:`bytearray`,
-            :obj:`memoryview`, :obj:`tuple`, :obj:`set`, :obj:`frozenset` to
-            tree-view represetable data.
+            :obj:`bytearray`, :obj:`memoryview`, :obj:`tuple`, :obj:`set`
+            and :obj:`frozenset` are left as is, and written as typed
+            wrappers (c.f. :meth:`~dictdumper.dumper.Dumper.make_object`)
+            by :meth:`_append_binary` and :meth:`_append_collection`. If
+            :meth:`~dictdumper.dumper.Dumper.object_hook` is overridden, they
+            are converted into typed wrappers instead, whose fields are then
+            converted by the hook as well.
 
         """
-        if isinstance(o, bytearray):
-            return self.make_object(o, bytes_type(o), text=o.decode(errors='replace'))
-        if isinstance(o, memoryview):
-            tobytes = o.tobytes()
-            return self.make_object(o, tobytes, text=tobytes.decode(errors='replace'))
-        if isinstance(o, (tuple, set, frozenset)):
-            return self.make_object(o, list(o))
-        return self.object_hook(o)
+        if isinstance(o, _WRAPPER_TYPES):
+            if type(self).object_hook == Dumper.object_hook:
+                return o
+            if isinstance(o, (tuple, set, frozenset)):
+                return self.make_object(o, iter(o))
+            data = o.tobytes() if isinstance(o, memoryview) else bytes_type(o)
+            return self.make_object(o, data, text=decode(data))
+        enc = self.object_hook(o)
+        if self._stat is not None and enc is not o:
+            self._stat.hooks += 1
+        return enc
 
     def _append_value(self, value, file, name):
         """Call this function to write contents.
@@ -262,7 +361,7 @@ class Tree(Dumper):
             file.write('\n')
         file.write(name)
 
-        self._bctx = list()  # blank branch indent context
+        del self._bctx[:]  # blank branch indent context
         self._append_branch(value, file)
 
         self._nctr += 1
@@ -276,7 +375,7 @@ class Tree(Dumper):
         """Call this function to write branch contents.
 
         Args:
-            value (Dict[str, Any]): content to be dumped
+            value (Mapping[str, Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
         """
@@ -284,33 +383,54 @@ class Tree(Dumper):
             file.write(' ')
             return self._append_none(None, file)
 
+        prof = self._pact
         vlen = len(value)
         for (vctr, (item, text)) in enumerate(value.items(), start=1):
             file.write('\n' + ''.join(self._bctx))
             file.write('  |-- {item} '.format(item=item))
 
+            if prof is not None:
+                prof.enter(item, file)
             with indent(self._bctx, branch=vctr != vlen):
                 enc_text = self._encode_value(text)
                 func = self._encode_func(enc_text)
                 func(enc_text, file)
+            if prof is not None:
+                prof.leave(file)
 
     def _append_array(self, value, file):  # pylint: disable=inconsistent-return-statements
         """Call this function to write array contents.
 
         Args:
-            value (List[Any]): content to be dumped
+            value (Iterable[Any]): content to be dumped
             file (io.TextIOWrapper): output file
 
+        Notes:
+            Homogeneous numbers are written at once (c.f.
+            :meth:`~dictdumper.dumper.Dumper._numeric`).
+
         """
-        if not value:
+        empty, items = peek(value)
+        if empty:
             file.write(' ')
             return self._append_none(None, file)
 
-        vlen = len(value)
-        for (vctr, item) in enumerate(value, start=1):
+        prof = self._pact
+        if prof is not None:
+            prof.enter_array(file)
+
+        if self._numeric(value) is not None:
+            labs = '\n' + ''.join(self._bctx) + '  |--> '
+            for chunk in chunks(value):
+                file.write(labs + labs.join(map(str_type, chunk)))
+            if prof is not None:
+                prof.leave(file)
+            return None
+
+        for (item, last) in lookahead(items):
             file.write('\n' + ''.join(self._bctx) + '  |-')
 
-            if vctr != vlen:
+            if not last:
                 ctx = indent(self._bctx)
             else:
                 ctx = nullcontext()
@@ -324,6 +444,68 @@ class Tree(Dumper):
                 func = self._encode_func(enc_text)
                 func(enc_text, file)
 
+        if prof is not None:
+            prof.leave(file)
+
+    def _append_wrapper(self, value, file, *fields):
+        """Call this function to write typed wrapper contents.
+
+        Args:
+            value (Any): original content
+            file (io.TextIOWrapper): output file
+            *fields (Tuple[str, Any, Callable[[Any, io.TextIOWrapper], None]]):
+                key, converted content and handler of fields after ``type``
+
+        Notes:
+            The wrapper is written as the branch created by
+            :meth:`~dictdumper.dumper.Dumper.make_object`, without creating it.
+            Handlers of fields are called directly, and counted as if
+            dispatched by :meth:`~dictdumper.dumper.Dumper._encode_func`.
+
+        """
+        fields = (('type', str_type(type(value).__name__), self._append_string),) + fields
+
+        stat = self._stat
+        prof = self._pact
+        vlen = len(fields)
+        for (vctr, (item, text, func)) in enumerate(fields, start=1):
+            file.write('\n' + ''.join(self._bctx))
+            file.write('  |-- {item} '.format(item=item))
+
+            if stat is not None:
+                stat.handlers[func.__name__.replace('_append_', '', 1)] += 1
+            if prof is not None:
+                prof.enter(item, file)
+            with indent(self._bctx, branch=vctr != vlen):
+                func(text, file)
+            if prof is not None:
+                prof.leave(file)
+
+    def _append_binary(self, value, file):
+        """Call this function to write bytearray and memoryview contents.
+
+        Args:
+            value (Union[bytearray, memoryview]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            Contiguous memoryviews are converted without copying.
+
+        """
+        data = byteview(value) if isinstance(value, memoryview) else value
+        self._append_wrapper(value, file, ('value', data, self._append_bytes),
+                             ('text', decode(data), self._append_string))
+
+    def _append_collection(self, value, file):
+        """Call this function to write tuple and set contents.
+
+        Args:
+            value (Union[Tuple[Any], Set[Any], FrozenSet[Any]]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        self._append_wrapper(value, file, ('value', value, self._append_array))
+
     def _append_string(self, value, file):  # pylint: disable=inconsistent-return-statements
         """Call this function to write string contents.
 
@@ -359,11 +541,10 @@ class Tree(Dumper):
             file.write(' ')
             return self._append_none(None, file)
 
-        value_hex = hexlify(value)
-        if len(value_hex) <= 32:
-            text = ' '.join(textwrap.wrap(value_hex, 2))
-            labs = '-> {text}'.format(text=text)
+        if len(value) <= 16:  # 32 hexadecimal digits
+            labs = self._render('tree.bytes', value, _label_bytes)
         else:
+            value_hex = hexlify(value)
             labs = '\n' + ''.join(self._bctx) + '  |-'
 
             text_list = textwrap.wrap(value_hex, 32)
@@ -374,7 +555,7 @@ class Tree(Dumper):
                 labs += '\n' + ''.join(self._bctx) + '       {text}'.format(text=text)
         file.write(labs)
 
-    def _append_date(self, value, file):  # pylint: disable=no-self-use
+    def _append_date(self, value, file):
         """Call this function to write date contents.
 
         Args:
@@ -382,7 +563,7 @@ class Tree(Dumper):
             file (io.TextIOWrapper): output file
 
         """
-        text = isoformat(value)
+        text = self._render('isoformat', value, isoformat)
         labs = '-> {text}'.format(text=text)
         file.write(labs)
 
@@ -19,6 +19,8 @@ thus it is now deprecated. Usage sample is described as below.
 
 .. deprecated:: 0.8.0
 
+    Use :class:`~dictdumper.html.HTML` instead.
+
 """
 # Writer for Vue.js files
 # Dump a Vue.js file for PCAP analyser
@@ -103,7 +105,7 @@ class VueJS(JSON):
         _tctr (int): tab level counter
         _hsrt (str): :data:`~dictdumper.json._HEADER_START`
         _hend (str): :data:`~dictdumper.json._HEADER_END`
-        _vctr (DefaultDict[int, int]): value counter dict
+        _vctr (array.array): value counter stack, indexed by tab level
 
     """
     ##########################################################################
@@ -122,6 +124,8 @@ class VueJS(JSON):
     # Attributes.
     ##########################################################################
 
+    __slots__ = ()
+
     #: Vue.js head string.
     _hsrt = _HEADER_START
     #: Vue.js tail string.
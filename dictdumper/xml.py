@@ -81,6 +81,8 @@ class XML(Dumper):
     # Attributes.
     ##########################################################################
 
+    __slots__ = ()
+
     #: XML head string.
     _hsrt = _HEADER_START
     #: XML tail string.
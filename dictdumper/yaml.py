@@ -0,0 +1,648 @@
+# -*- coding: utf-8 -*-
+"""dumper a YAML file
+
+:mod:`dictdumper.yaml` contains :class:`~dictdumper.yaml.YAML`
+only, which dumpers a multi-document YAML Ain't Markup Language
+(YAML) file. Usage sample is described as below.
+
+.. code:: python
+
+    >>> dumper = YAML(file_name)
+    >>> dumper(content_dict_1, name=content_name_1)
+    >>> dumper(content_dict_2, name=content_name_2)
+    ............
+
+"""
+# Writer for YAML files
+# Dump a multi-document YAML file for PCAP analyser
+
+from __future__ import unicode_literals
+
+import binascii
+import collections
+import datetime
+import hashlib
+import math
+import os
+import re
+
+from dictdumper._arrays import ArrayType, chunks
+from dictdumper._dateutil import isoformat
+from dictdumper._hexlify import byteview
+from dictdumper._iterutil import peek
+from dictdumper._types import Iterable, Iterator, Mapping, bytes_type, str_type
+from dictdumper.dumper import Dumper
+
+__all__ = ['YAML']
+
+#: YAML head string.
+_HEADER_START = ''
+
+#: YAML tail string.
+_HEADER_END = ''
+
+#: Indentation template.
+_TEMP_INDENT = '  '
+
+#: Number of bytes per ``!!binary`` line (76 characters in Base64).
+_BINARY_CHUNK = 57
+
+#: Threshold of string length to use block scalars.
+_BLOCK_LENGTH = 80
+
+#: Pattern of strings which can be written as plain scalars.
+_PLAIN_RE = re.compile(r'^[^\W\d][\w./-]*(?: [\w./-]+)*$', re.UNICODE)
+
+#: Pattern of characters which cannot be written in block scalars.
+_UNSAFE_RE = re.compile('[^\x09\x0A\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD'
+                        '\U00010000-\U0010FFFF]')
+
+#: Plain scalars resolved as other types (YAML 1.1).
+_RESERVED = frozenset([
+    'y', 'yes', 'n', 'no', 'true', 'false', 'on', 'off', 'null',
+])
+
+#: Mapping for escaping special characters in double-quoted scalars.
+ESCAPE_DCT = dict((code, '\\x%02x' % code) for code in range(0x20))
+ESCAPE_DCT.update({
+    0x00: '\\0',
+    0x07: '\\a',
+    0x08: '\\b',
+    0x09: '\\t',
+    0x0A: '\\n',
+    0x0B: '\\v',
+    0x0C: '\\f',
+    0x0D: '\\r',
+    0x1B: '\\e',
+    0x22: '\\"',
+    0x5C: '\\\\',
+    0x7F: '\\x7f',
+    0x85: '\\N',
+    0x2028: '\\L',
+    0x2029: '\\P',
+    0xFEFF: '\\ufeff',
+})
+
+
+def _quote(value):
+    """Format string as a double-quoted scalar.
+
+    Args:
+        value (str): string to format
+
+    Returns:
+        str: double-quoted scalar
+
+    """
+    return '"%s"' % value.translate(ESCAPE_DCT)
+
+
+def _scalar(value):
+    """Format string as plain scalar if possible, else double-quoted.
+
+    Args:
+        value (str): string to format
+
+    Returns:
+        str: plain or double-quoted scalar
+
+    """
+    if _PLAIN_RE.match(value) is not None and value.lower() not in _RESERVED:
+        return value
+    return _quote(value)
+
+
+def _float(value):
+    """Format float as YAML 1.1 float.
+
+    Args:
+        value (float): float to format
+
+    Returns:
+        str: formatted float
+
+    """
+    if math.isnan(value):
+        return '.nan'
+    if math.isinf(value):
+        return '.inf' if value > 0 else '-.inf'
+    text = repr(value)
+    if '.' not in text:
+        # YAML 1.1 floats require a decimal point
+        mantissa, _, exponent = text.partition('e')
+        text = '%s.0%s%s' % (mantissa, 'e' if exponent else '', exponent)
+    return text
+
+
+def _digest(value):
+    """Digest homogeneous numbers.
+
+    Args:
+        value (Union[List[Any], Tuple[Any], array.array, numpy.ndarray]):
+            numbers to digest
+
+    Returns:
+        bytes: SHA-1 digest of the numbers, identical for equal numbers
+        regardless of the type of ``value``
+
+    """
+    digest = hashlib.sha1()
+    for chunk in chunks(value):
+        digest.update(', '.join(map(repr, chunk)).encode('ascii'))
+        digest.update(b', ')
+    return digest.digest()
+
+
+class YAML(Dumper):
+    """Dump multi-document YAML Ain't Markup Language (YAML) format file.
+
+    .. code:: python
+
+        >>> dumper = YAML(file_name)
+        >>> dumper(content_dict_1, name=content_name_1)
+        >>> dumper(content_dict_2, name=content_name_2)
+        ............
+
+    Each block is written as its own document (``--- name: ...``), thus the
+    output file is append-only and no tail string needs rewriting. Repeated
+    identical subtrees within a block are written once with an anchor, and
+    referred to with aliases afterwards.
+
+    Attributes:
+        _file (str): output file name
+        _sptr (int): indicates start of appending point (file pointer)
+        _tctr (int): indentation level counter
+        _hsrt (str): start string (:data:`~dictdumper.yaml._HEADER_START`)
+        _hend (str): end string (:data:`~dictdumper.yaml._HEADER_END`)
+        _anch (bool): if emit anchors and aliases for repeated subtrees
+        _ords (List[Tuple[int, int]]): node identifiers and subtree sizes
+            of collections of current block, in pre-order
+        _optr (int): pointer to :attr:`_ords` of the next collection
+        _sids (Dict[Hashable, int]): subtree identifiers of current block
+        _nref (DefaultDict[int, int]): reference counter of subtrees
+        _anam (Dict[int, str]): anchor names of subtrees
+
+    .. note::
+
+        Terminology:
+
+        .. code::
+
+            stream    ::=  document*
+            document  ::=  "---" "\\n" name ":" mapping
+            mapping   ::=  "{}" | [anchor] ("\\n" key ":" node)+ | alias
+            sequence  ::=  "[]" | [anchor] ("\\n" "-" node)+ | alias
+            node      ::=  mapping | sequence | scalar
+            scalar    ::=  plain | quoted | literal | binary
+                            | int | float | bool | null | timestamp
+            literal   ::=  "|" chomping ("\\n" text)+
+            binary    ::=  "!!binary |" ("\\n" base64)+
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        """File format of current dumper.
+
+        :rtype: Literal['yaml']
+        """
+        return 'yaml'
+
+    ##########################################################################
+    # Type codes.
+    ##########################################################################
+
+    #: Tuple[Tuple[type, str]]: Type codes.
+    __type__ = (
+        # string
+        (str_type, 'string'),
+
+        # bool
+        (bool, 'bool'),
+
+        # number
+        (int, 'integer'),
+        (float, 'float'),
+
+        # mapping
+        (dict, 'mapping'),
+        (Mapping, 'mapping'),
+
+        # sequence
+        (list, 'sequence'),
+        (tuple, 'sequence'),
+        (set, 'sequence'),
+        (frozenset, 'sequence'),
+
+        # binary
+        (bytes_type, 'binary'),
+        (bytearray, 'binary'),
+        (memoryview, 'binary'),
+
+        # timestamp
+        (datetime.datetime, 'timestamp'),
+        (datetime.date, 'timestamp'),
+        (datetime.time, 'time'),
+
+        # typed arrays
+        (ArrayType, 'buffer'),
+
+        # sequence (other iterables)
+        (Iterable, 'sequence'),
+
+        # null
+        (type(None), 'null'),
+    )
+
+    ##########################################################################
+    # Attributes.
+    ##########################################################################
+
+    __slots__ = ('_anch', '_ords', '_optr', '_sids', '_nref', '_anam')
+
+    #: YAML head string.
+    _hsrt = _HEADER_START
+    #: YAML tail string.
+    _hend = _HEADER_END
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fname, anchors=True, **kwargs):
+        """Initialise dumper.
+
+        Args:
+            fname (str): output file name
+            anchors (bool): if emit anchors and aliases for repeated
+                identical subtrees
+            **kwargs: addition keyword arguments for initialisation
+
+        """
+        super(YAML, self).__init__(fname, **kwargs)
+
+        #: int: Indentation level counter.
+        self._tctr = 0
+        #: bool: If emit anchors and aliases for repeated subtrees.
+        self._anch = anchors
+        #: List[Tuple[int, int]]: Node identifiers and subtree sizes of collections.
+        self._ords = list()
+        #: int: Pointer to the next collection.
+        self._optr = 0
+        #: Dict[Hashable, int]: Subtree identifiers.
+        self._sids = dict()
+        #: DefaultDict[int, int]: Reference counter of subtrees.
+        self._nref = collections.defaultdict(int)
+        #: Dict[int, str]: Anchor names of subtrees.
+        self._anam = dict()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _append_value(self, value, file, name):
+        """Call this function to write contents.
+
+        Args:
+            value (Dict[str, Any]): content to be dumped
+            file (io.TextIOWrapper): output file
+            name (str): name of current content block
+
+        """
+        self._ords = list()
+        self._optr = 0
+        self._sids = dict()
+        self._nref = collections.defaultdict(int)
+        self._anam = dict()
+        if self._anch:
+            self._scan_value(value)
+
+        file.seek(self._sptr, os.SEEK_SET)
+        file.write('---\n%s:' % _scalar(str_type(name)))
+
+        self._append_mapping(value, file)
+
+    def _scan_value(self, value):
+        """Identify (possibly repeated) subtrees of contents.
+
+        Args:
+            value (Any): content to be scanned
+
+        Returns:
+            Hashable: identifier of ``value``
+
+        Notes:
+            Each collection is identified by its (recursively identified)
+            contents, so that identical subtrees share the same identifier.
+            Identifiers are recorded in pre-order to :attr:`_ords`, along
+            with the number of collections in the subtree, so that aliased
+            subtrees can be skipped while writing. Iterators (e.g.
+            generators) can only be consumed once, so they are neither
+            scanned nor identified with others; neither are typed arrays,
+            except for homogeneous numbers (c.f.
+            :meth:`~dictdumper.dumper.Dumper._numeric`), which are identified
+            at once as lists, by their kind, length and digest (c.f.
+            :func:`_digest`) rather than item by item.
+
+        """
+        enc_value = self._encode_value(value)
+        numbers = self._numeric(enc_value, dispatch=False)
+        if numbers is not None:
+            kind = list
+            items = None
+        elif isinstance(enc_value, ArrayType):
+            return (type(enc_value), id(enc_value))
+        elif isinstance(enc_value, Mapping):
+            kind = dict
+            items = enc_value.items()
+        elif isinstance(enc_value, (bytearray, memoryview)):
+            return (bytes_type, bytes_type(enc_value))
+        elif isinstance(enc_value, Iterable) and not isinstance(enc_value, (str_type, bytes_type, Iterator)):
+            kind = list
+            items = enumerate(enc_value)
+        else:
+            try:
+                hash(enc_value)
+            except TypeError:
+                return (type(enc_value), id(enc_value))
+            return (type(enc_value), enc_value)
+
+        index = len(self._ords)
+        self._ords.append(None)
+
+        if items is None:
+            key = (kind, numbers, len(enc_value), _digest(enc_value))
+        else:
+            key = (kind, tuple((str_type(item), self._scan_value(text)) for (item, text) in items))
+        ident = self._sids.setdefault(key, len(self._sids))
+        self._nref[ident] += 1
+
+        self._ords[index] = (ident, len(self._ords) - index)
+        return ident
+
+    def _node_property(self, file):
+        """Write anchor or alias of current collection.
+
+        Args:
+            file (io.TextIOWrapper): output file
+
+        Returns:
+            bool: if an alias is written, i.e. the collection shall be skipped
+
+        """
+        if not self._anch:
+            return False
+
+        ident, size = self._ords[self._optr]
+        if self._nref[ident] < 2:
+            self._optr += 1
+            return False
+
+        if ident in self._anam:
+            file.write(' *%s\n' % self._anam[ident])
+            self._optr += size
+            return True
+
+        anchor = self._anam[ident] = 'id%03d' % (len(self._anam) + 1)
+        file.write(' &%s' % anchor)
+        self._optr += 1
+        return False
+
+    def _is_compact(self, value):
+        """Check if a collection item can be written in compact form.
+
+        Args:
+            value (Any): sequence item to check
+
+        Returns:
+            bool: if ``value`` is a non-empty mapping which is neither
+            anchored nor aliased
+
+        """
+        if not isinstance(value, Mapping) or not value:
+            return False
+        if not self._anch:
+            return True
+        ident, _ = self._ords[self._optr]
+        return self._nref[ident] < 2
+
+    ##########################################################################
+    # Functions.
+    ##########################################################################
+
+    def _append_mapping(self, value, file):
+        """Call this function to write mapping contents.
+
+        Args:
+            value (Mapping[str, Any]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        if not value:
+            if self._anch:
+                self._optr += 1
+            file.write(' {}\n')
+            return
+
+        if self._node_property(file):
+            return
+        file.write('\n')
+
+        self._tctr += 1
+        self._append_items(value, file, _TEMP_INDENT * self._tctr)
+        self._tctr -= 1
+
+    def _append_items(self, value, file, lead):
+        """Call this function to write items of mapping contents.
+
+        Args:
+            value (Mapping[str, Any]): content to be dumped
+            file (io.TextIOWrapper): output file
+            lead (str): indentation of the first item
+
+        """
+        tabs = _TEMP_INDENT * self._tctr
+        for (item, text) in value.items():
+            file.write('%s%s:' % (lead, self._render('yaml.scalar', str_type(item), _scalar)))
+            lead = tabs
+
+            enc_text = self._encode_value(text)
+            func = self._encode_func(enc_text)
+            func(enc_text, file)
+
+    def _append_sequence(self, value, file):
+        """Call this function to write sequence contents.
+
+        Args:
+            value (Iterable[Any]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            Iterators are not scanned by :meth:`_scan_value`, thus anchors
+            and aliases are disabled within them. Homogeneous numbers are
+            written at once (c.f. :meth:`~dictdumper.dumper.Dumper._numeric`).
+
+        """
+        if self._anch and isinstance(value, Iterator):
+            self._anch = False
+            try:
+                self._append_sequence(value, file)
+            finally:
+                self._anch = True
+            return
+
+        empty, items = peek(value)
+        if empty:
+            if self._anch:
+                self._optr += 1
+            file.write(' []\n')
+            return
+
+        if self._node_property(file):
+            return
+        file.write('\n')
+
+        self._tctr += 1
+        tabs = _TEMP_INDENT * self._tctr
+        kind = self._numeric(value)
+        if kind is not None:
+            labs = '%s- ' % tabs
+            for chunk in chunks(value):
+                text = map(str_type, chunk) if kind is int else map(_float, chunk)
+                file.write(labs + ('\n' + labs).join(text) + '\n')
+            self._tctr -= 1
+            return
+        for item in items:
+            enc_item = self._encode_value(item)
+            if self._is_compact(enc_item):
+                if self._anch:
+                    self._optr += 1
+                file.write('%s- ' % tabs)
+                self._tctr += 1
+                self._append_items(enc_item, file, '')
+                self._tctr -= 1
+                continue
+
+            file.write('%s-' % tabs)
+            func = self._encode_func(enc_item)
+            func(enc_item, file)
+        self._tctr -= 1
+
+    def _append_string(self, value, file):
+        """Call this function to write string contents.
+
+        Args:
+            value (str): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            Multi-line and long strings are written as literal block scalars
+            (thus requiring no escaping) whenever possible.
+
+        """
+        if ('\n' in value or len(value) > _BLOCK_LENGTH) and value[:1] not in ' \n' \
+                and _UNSAFE_RE.search(value) is None:
+            text = value.rstrip('\n')
+            tail = len(value) - len(text)
+            if tail == 0:
+                chomp = '-'
+            elif tail == 1:
+                chomp = ''
+            else:
+                chomp = '+'
+
+            tabs = _TEMP_INDENT * (self._tctr + 1)
+            file.write(' |%s\n' % chomp)
+            for line in text.split('\n'):
+                file.write('%s%s\n' % (tabs, line) if line else '\n')
+            file.write('\n' * (tail - 1))
+            return
+
+        file.write(' %s\n' % self._render('yaml.scalar', value, _scalar))
+
+    def _append_binary(self, value, file):
+        """Call this function to write binary contents.
+
+        Args:
+            value (Union[bytes, bytearray, memoryview]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        Notes:
+            The contents are encoded as Base64 in chunks of
+            :data:`~dictdumper.yaml._BINARY_CHUNK` bytes, without encoding
+            the whole buffer at once.
+
+        """
+        view = byteview(memoryview(value))
+        if not view:
+            file.write(' !!binary ""\n')
+            return
+
+        tabs = _TEMP_INDENT * (self._tctr + 1)
+        file.write(' !!binary |\n')
+        for index in range(0, len(view), _BINARY_CHUNK):
+            text = binascii.b2a_base64(view[index:index + _BINARY_CHUNK]).decode('ascii')
+            file.write(tabs + text)
+
+    def _append_timestamp(self, value, file):
+        """Call this function to write timestamp contents.
+
+        Args:
+            value (Union[datetime.date, datetime.datetime]): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' %s\n' % self._render('isoformat', value, isoformat))
+
+    def _append_time(self, value, file):
+        """Call this function to write time contents.
+
+        Args:
+            value (datetime.time): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' %s\n' % _quote(self._render('isoformat', value, isoformat)))
+
+    def _append_integer(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write integer contents.
+
+        Args:
+            value (int): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' %d\n' % value)
+
+    def _append_float(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write float contents.
+
+        Args:
+            value (float): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' %s\n' % _float(value))
+
+    def _append_bool(self, value, file):  # pylint: disable=no-self-use
+        """Call this function to write bool contents.
+
+        Args:
+            value (bool): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' true\n' if value else ' false\n')
+
+    def _append_null(self, value, file):  # pylint: disable=unused-argument,no-self-use
+        """Call this function to write null contents.
+
+        Args:
+            value (None): content to be dumped
+            file (io.TextIOWrapper): output file
+
+        """
+        file.write(' null\n')
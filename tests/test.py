@@ -3,21 +3,45 @@
 
 from __future__ import unicode_literals
 
+import array
+import base64
+import binascii
 import collections
+import contextlib
+import csv
 import datetime
+import gzip
+import json
 import os
+import re
+import sqlite3
+import subprocess  # nosec: B404
 import tempfile
 import unittest
 import sys
 
 import dictdumper
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 PY2 = '.py2' if sys.version_info.major < 3 else ''
 
 try:
     from tempfile import TemporaryDirectory
 except ImportError:
-    import contextlib
     import shutil
 
     @contextlib.contextmanager
@@ -36,6 +60,28 @@ except ImportError:
             shutil.rmtree(tempdir)
 
 
+@contextlib.contextmanager
+def count_fsync():
+    """Count calls to :func:`os.fsync`.
+
+    Yields:
+        List[int]: file descriptors synchronised so far
+
+    """
+    calls = list()
+    fsync = os.fsync
+
+    def wrapper(fd):
+        calls.append(fd)
+        return fsync(fd)
+
+    os.fsync = wrapper
+    try:
+        yield calls
+    finally:
+        os.fsync = fsync
+
+
 ROOT = os.path.dirname(os.path.realpath(__file__))
 
 test_1 = collections.OrderedDict()
@@ -75,10 +121,10 @@ class TestDictDumper(unittest.TestCase):
 
     maxDiff = None
 
-    def assertFile(self, first, second):
-        with open(first) as file:
+    def assertFile(self, first, second, mode='r'):
+        with open(first, mode) as file:
             text_first = file.read()
-        with open(second) as file:
+        with open(second, mode) as file:
             text_second = file.read()
         self.assertEqual(text_first, text_second)
 
@@ -139,6 +185,1038 @@ class TestDictDumper(unittest.TestCase):
                 dumper(test_3, name='test_3')
                 self.assertFile(dst, os.path.join(rootdir, 'test_3%s.txt' % PY2))
 
+    def test_cbor(self):
+        """Test CBOR dumper."""
+        rootdir = os.path.join(ROOT, 'cbor')
+        with TemporaryDirectory() as tempdir:
+            for index in range(2):
+                dst = os.path.join(tempdir, 'test_%s.cbor' % index)
+
+                dumper = dictdumper.CBOR(dst)
+                self.assertFile(dst, os.path.join(rootdir, 'test_0.cbor'), 'rb')
+
+                dumper(test_1, name='test_1')
+                self.assertFile(dst, os.path.join(rootdir, 'test_1.cbor'), 'rb')
+
+                dumper(test_2, name='test_2')
+                self.assertFile(dst, os.path.join(rootdir, 'test_2.cbor'), 'rb')
+
+                dumper(test_3, name='test_3')
+                self.assertFile(dst, os.path.join(rootdir, 'test_3.cbor'), 'rb')
+
+    def test_csv(self):
+        """Test CSV dumper."""
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.csv')
+            with dictdumper.CSV(dst, infer=2) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+                dumper(test_3, name='test_3')
+
+            with open(dst) as file:
+                rows = list(csv.reader(file))
+            self.assertEqual(rows[0], ['name', 'foo', 'bar', 'boo.foo_again', 'boo.bar_again',
+                                       'boo.boo_again', '_overflow'])
+            self.assertEqual(rows[1], ['test_1', '-1', 'Hello, world!', 'true', '6279746573', '', ''])
+            self.assertEqual(rows[2][3:6], ['62797465737472696e67', '2020-01-31T20:15:10.163010', '-inf'])
+            self.assertEqual(json.loads(rows[3][-1])['far.far_var'], 's4')
+
+    def test_csv_reserved(self):
+        """Test CSV dumper with keys of reserved columns."""
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.csv')
+            with dictdumper.CSV(dst) as dumper:
+                for key in ('name', '_overflow'):
+                    with self.assertRaises(ValueError):
+                        dumper({key: 'x'}, name='broken')
+                dumper({'name': {'foo': 1}}, name='test_1')
+            with open(dst) as file:
+                self.assertEqual(file.read(), 'name,name.foo,_overflow\ntest_1,1,\n')
+
+    def test_csv_rotate(self):
+        """Test CSV dumper with file rotation on new columns."""
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.tsv')
+            with dictdumper.CSV(dst, delimiter='\t', infer=1, overflow='rotate') as dumper:
+                dumper({'ip': {'src': 1}}, name='test_1')
+                dumper({'ip': {'src': 2, 'dst': 3}}, name='test_2')
+            self.assertEqual(dumper.kind, 'tsv')
+
+            with open(dst) as file:
+                self.assertEqual(file.read(), 'name\tip.src\ntest_1\t1\n')
+            with open(os.path.join(tempdir, 'test.0001.tsv')) as file:
+                self.assertEqual(file.read(), 'name\tip.src\tip.dst\ntest_2\t2\t3\n')
+
+    @unittest.skipIf(yaml is None, 'PyYAML not installed')
+    def test_yaml(self):
+        """Test YAML dumper."""
+        flags = collections.OrderedDict()
+        flags['syn'] = True
+        flags['ack'] = False
+
+        test_4 = collections.OrderedDict()
+        test_4['foo'] = u'multi-line\nstring\n'
+        test_4['bar'] = [flags, dict(flags), list(range(3))]
+        test_4['boo'] = collections.OrderedDict(flags=dict(flags), opts=list(range(3)))
+        test_4['far'] = bytes(bytearray(range(128)))
+
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.yaml')
+
+            dumper = dictdumper.YAML(dst)
+            dumper(test_1, name='test_1')
+            dumper(test_2, name='test_2')
+            dumper(test_3, name='test_3')
+            dumper(test_4, name='test_4')
+
+            with open(dst) as file:
+                text = file.read()
+            self.assertIn('foo: |\n', text)
+            self.assertIn('&id001', text)
+            self.assertIn('*id001', text)
+
+            docs = list(yaml.safe_load_all(text))
+            self.assertEqual([list(doc) for doc in docs], [['test_1'], ['test_2'], ['test_3'], ['test_4']])
+            self.assertEqual(docs[0]['test_1']['boo']['bar_again'], b'bytes')
+            self.assertEqual(docs[1]['test_2']['bar'], [1.0, b'a long long bytes', 3.0])
+            self.assertEqual(docs[1]['test_2']['boo']['bar_again'], test_2['boo']['bar_again'])
+            self.assertEqual(docs[2]['test_3']['boo'], [u's4', {u's': u'5', u'j': u'5'}, u's6'])
+            self.assertEqual(docs[3]['test_4'], {
+                'foo': test_4['foo'],
+                'bar': [dict(flags), dict(flags), [0, 1, 2]],
+                'boo': {'flags': dict(flags), 'opts': [0, 1, 2]},
+                'far': test_4['far'],
+            })
+
+    def test_sqlite(self):
+        """Test SQLite dumper."""
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.db')
+            with dictdumper.SQLite(dst, payload='tree', batch=2) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+                dumper(test_3, name='test_3')
+
+            with open(os.path.join(ROOT, 'tree', 'test_3%s.txt' % PY2)) as file:
+                blocks = file.read().rstrip('\n').split('\n\n')
+
+            conn = sqlite3.connect(dst)
+            try:
+                rows = conn.execute('SELECT seq, name, kind, payload FROM blocks ORDER BY seq').fetchall()
+                self.assertEqual(rows, [(0, 'test_1', 'txt', blocks[0]),
+                                        (1, 'test_2', 'txt', blocks[1]),
+                                        (2, 'test_3', 'txt', blocks[2])])
+
+                plan = conn.execute('EXPLAIN QUERY PLAN SELECT * FROM blocks WHERE name = ?',
+                                    ('test_2',)).fetchall()
+                self.assertIn('blocks_name', str(plan))
+            finally:
+                conn.close()
+
+            dst = os.path.join(tempdir, 'test_options.db')
+            with dictdumper.SQLite(dst, memo=True, profile=2) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+                dumper(test_3, name='test_3')
+            self.assertGreater(dumper.memo.hits, 0)
+            self.assertEqual((dumper.profiler.blocks, dumper.profiler.sampled), (3, 2))
+            self.assertEqual(dumper.profiler.count['foo'], 2)
+            self.assertEqual(dumper.profiler.count['boo[].s'], 1)
+
+    def test_sqlite_rollback(self):
+        """Test SQLite dumper after a failed block."""
+        from dictdumper.dumper import DumperError
+
+        broken = collections.OrderedDict()
+        broken['foo'] = [1, collections.OrderedDict([('bar', [2, object()])])]
+
+        with TemporaryDirectory() as tempdir:
+            for (payload, text) in (('json', '{\n\t"a": 1\n}'), ('tree', 'clean\n  |-- a -> 1')):
+                dst = os.path.join(tempdir, 'test_%s.db' % payload)
+                with dictdumper.SQLite(dst, payload=payload) as dumper:
+                    with self.assertRaises(DumperError):
+                        dumper(broken, name='broken')
+                    dumper({'a': 1}, name='clean')
+
+                conn = sqlite3.connect(dst)
+                try:
+                    rows = conn.execute('SELECT seq, name, payload FROM blocks').fetchall()
+                    self.assertEqual(rows, [(0, 'clean', text)])
+                finally:
+                    conn.close()
+
+    def test_html(self):
+        """Test HTML dumper."""
+        with open(os.path.join(ROOT, 'json', 'test_3%s.json' % PY2)) as file:
+            blocks = json.load(file)
+
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test_inline.html')
+            dumper = dictdumper.HTML(dst, inline=True)
+            dumper(test_1, name='test_1')
+            dumper(test_2, name='test_2')
+
+            with open(dst) as file:
+                text = file.read()
+            self.assertTrue(text.endswith('</body>\n</html>\n'))
+
+            entries = re.findall(r'<script type="application/json" class="dd-block" '
+                                 r'data-name="([^"]*)">([^<]*)</script>', text)
+            self.assertEqual([entry[0] for entry in entries], ['test_1', 'test_2'])
+            for (name, data) in entries:
+                self.assertEqual(json.loads(base64.b64decode(data).decode('utf-8')), blocks[name])
+
+            dst = os.path.join(tempdir, 'test_chunks.html')
+            dumper = dictdumper.HTML(dst, chunk=2)
+            dumper(test_1, name='test_1')
+            dumper(test_2, name='test_2')
+            dumper(test_3, name='test_3')
+
+            with open(dst) as file:
+                entries = re.findall(r'data-name="([^"]*)" data-chunk="([^"]*)" data-index="(\d+)"',
+                                     file.read())
+            self.assertEqual(entries, [('test_1', 'test_chunks.chunks/chunk_000001.js', '0'),
+                                       ('test_2', 'test_chunks.chunks/chunk_000001.js', '1'),
+                                       ('test_3', 'test_chunks.chunks/chunk_000002.js', '0')])
+            for (name, src, index) in entries:
+                with open(os.path.join(tempdir, src)) as file:
+                    text = file.read()
+                self.assertTrue(text.startswith('DictDumper.chunk("%s", [' % src))
+                chunk = json.loads(text[text.index('['):text.rindex(']') + 1])
+                self.assertEqual(chunk[int(index)], blocks[name])
+
+    def test_stats(self):
+        """Test runtime metrics."""
+        from dictdumper.dumper import DumperError
+
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test_stats.json')
+            self.assertIsNone(dictdumper.JSON(dst).stats)
+
+            dumper = dictdumper.JSON(dst, stats=True)
+            dumper(test_1, name='test_1')
+            dumper(test_2, name='test_2')
+
+            stats = dumper.stats.snapshot()
+            self.assertEqual(stats['blocks'], 2)
+            self.assertEqual(stats['bytes'], os.path.getsize(dst) + 2 * len(dumper._hend))
+            self.assertEqual(stats['flushes'], 3)
+            self.assertEqual(stats['defaults'], 0)
+            self.assertEqual(stats['handlers']['bool'], 1)
+            self.assertEqual(stats['handlers']['null'], 2)
+            self.assertEqual(stats['hooks'], 0)  # nothing converted
+            self.assertGreater(stats['encode_time'], 0)
+            self.assertGreater(stats['io_time'], 0)
+
+            prom = os.path.join(tempdir, 'test_stats.prom')
+            dumper.stats.export_prometheus(prom)
+            with open(prom) as file:
+                text = file.read()
+            self.assertIn('dictdumper_blocks_total{kind="json",file="%s"} 2\n' % dst, text)
+            self.assertIn('handler="null"} 2\n', text)
+
+            dumper.stats.reset()
+            self.assertEqual(dumper.stats.blocks, 0)
+            self.assertEqual(dumper.stats.handlers, {})
+
+            shared = dictdumper.stats.Stats()
+            dictdumper.Tree(os.path.join(tempdir, 'test_stats.txt'), stats=shared)(test_3, name='test_3')
+            dictdumper.CSV(os.path.join(tempdir, 'test_stats.csv'), stats=shared)(test_3, name='test_3').close()
+            self.assertEqual(shared.blocks, 2)
+
+            shared.reset()
+            hooked = type('JSON', (dictdumper.JSON,), {'object_hook': lambda self, o: str(o) if o is None else o})
+            hooked(os.path.join(tempdir, 'test_stats.json'), stats=shared)({'foo': None, 'bar': [None, 1]}, name='test')
+            self.assertEqual(shared.hooks, 2)
+
+            shared.reset()
+            for cls in (dictdumper.JSON, dictdumper.CSV, dictdumper.SQLite):
+                with cls(os.path.join(tempdir, 'test_stats.%s' % cls.__name__), stats=shared) as dumper:
+                    with self.assertRaises(DumperError):
+                        dumper({'foo': object()}, name='broken')
+            self.assertEqual(shared.blocks, 0)
+            self.assertGreater(shared.encode_time, 0)
+
+    def test_profiler(self):
+        """Test key-path profiler."""
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test_profiler.json')
+            self.assertIsNone(dictdumper.JSON(dst).profiler)
+
+            dumper = dictdumper.JSON(dst, profile=2)
+            dumper(test_1, name='test_1')
+            dumper(test_2, name='test_2')
+            dumper(test_3, name='test_3')
+
+            profiler = dumper.profiler
+            self.assertEqual((profiler.blocks, profiler.sampled), (3, 2))
+            self.assertEqual(profiler.count['foo'], 2)
+            self.assertEqual(profiler.count['boo[].s'], 1)
+            self.assertNotIn('bar.value[]', profiler.count)
+            self.assertEqual(profiler.bytes['far'],
+                             profiler.self_bytes['far'] + profiler.bytes['far.far_foo']
+                             + profiler.bytes['far.far_var'])
+            self.assertEqual(profiler.bytes['far.far_foo'], profiler.bytes['far.far_foo[]'])
+
+            report = profiler.report(sort='bytes', limit=3)
+            self.assertEqual(len(report), 3)
+            self.assertEqual([row[4] for row in report], sorted([row[4] for row in report], reverse=True))
+
+            folded = os.path.join(tempdir, 'test_profiler.folded')
+            profiler.export_folded(folded, weight='bytes')
+            with open(folded) as file:
+                lines = file.read().splitlines()
+            self.assertIn('boo;[];s %d' % profiler.self_bytes['boo[].s'], lines)
+            for line in lines:
+                self.assertTrue(re.match(r'^[^ ;]+(;[^ ;]+)* \d+$', line))
+
+            dst = os.path.join(tempdir, 'test_profiler.txt')
+            dumper = dictdumper.Tree(dst, profile=dictdumper.profiler.Profiler())
+            dumper(test_3, name='test_3')
+            self.assertEqual(dumper.profiler.count['far.far_foo[]'], 1)
+
+    def test_lazy_import(self):
+        """Test lazy import of dumpers."""
+        from dictdumper.bench import run_import
+
+        result = run_import(repeat=1)
+        self.assertEqual(result['unexpected'], [])
+
+        script = ('import os, sys, dictdumper\n'
+                  'dictdumper.JSON(os.devnull)({"foo": [1, 2]}, name="test")\n'
+                  'print("\\n".join(sys.modules))\n')
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                          env.get('PYTHONPATH')]))
+        modules = subprocess.check_output([sys.executable, '-c', script], env=env).decode().split()  # nosec: B603
+        for name in ('compression', 'durability', 'index', 'mapped', 'memo', 'profiler', 'rotation', 'stats'):
+            self.assertNotIn('dictdumper.%s' % name, modules)
+        self.assertNotIn('numpy', modules)
+
+        for name in dictdumper.__all__ + ['Dumper', 'XML']:
+            self.assertIn(name, dir(dictdumper))
+            self.assertEqual(getattr(dictdumper, name).__name__, name)
+        with self.assertRaises(AttributeError):
+            dictdumper.Dumpers  # pylint: disable=pointless-statement
+
+    def test_instances(self):
+        """Test many interleaved dumper instances."""
+        kinds = [('json', 'json', dictdumper.JSON), ('plist', 'plist', dictdumper.PLIST),
+                 ('tree', 'txt', dictdumper.Tree)]
+        with TemporaryDirectory() as tempdir:
+            dumpers = list()
+            for index in range(50):
+                folder, ext, cls = kinds[index % len(kinds)]
+                dst = os.path.join(tempdir, 'test_%s.%s' % (index, ext))
+                dumpers.append((dst, folder, ext, cls(dst)))
+
+            for (dst, _, _, dumper) in dumpers:
+                self.assertFalse(hasattr(dumper, '__dict__'))
+                dumper(test_1, name='test_1')
+            for (dst, _, _, dumper) in reversed(dumpers):
+                dumper(test_2, name='test_2')
+            for (dst, _, _, dumper) in dumpers:
+                dumper(test_3, name='test_3')
+
+            for (dst, folder, ext, _) in dumpers:
+                self.assertFile(dst, os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext)))
+
+    def test_pool(self):
+        """Test keyed pool of dumpers."""
+        rootdir = os.path.join(ROOT, 'json')
+        with TemporaryDirectory() as tempdir:
+            with dictdumper.DumperPool(dictdumper.JSON, os.path.join(tempdir, 'flow_%s.json'),
+                                       maxopen=2) as pool:
+                for value, name in ((test_1, 'test_1'), (test_2, 'test_2'), (test_3, 'test_3')):
+                    for key in range(5):
+                        pool(key, value, name=name)
+                        self.assertLessEqual(pool.nopen, 2)
+                self.assertEqual(len(pool), 5)
+                self.assertEqual(sum(pool[key].held for key in pool), 2)
+
+                pool.release(4)
+                self.assertFalse(pool[4].held)
+                self.assertFile(pool[4].filename, os.path.join(rootdir, 'test_3%s.json' % PY2))
+
+            for key in range(5):
+                self.assertFalse(pool[key].held)
+                self.assertFile(os.path.join(tempdir, 'flow_%s.json' % key),
+                                os.path.join(rootdir, 'test_3%s.json' % PY2))
+
+            dst = os.path.join(tempdir, 'test.csv')
+            with dictdumper.CSV(dst, batch=1, infer=1) as dumper:
+                dumper.hold()
+                dumper({'foo': 1}, name='test_1')
+                dumper({'foo': 2}, name='test_2')
+            with open(dst) as file:
+                self.assertEqual(file.read(), 'name,foo,_overflow\ntest_1,1,\ntest_2,2,\n')
+
+    @unittest.skipIf(tracemalloc is None, 'tracemalloc not available')
+    def test_rotation_memory(self):
+        """Test memory usage of compressing rotated segments."""
+        from dictdumper.rotation import _compress_file
+
+        with TemporaryDirectory() as tempdir:
+            src = os.path.join(tempdir, 'test.json')
+            with open(src, 'wb') as file:
+                for _ in range(16):
+                    file.write(os.urandom(1 << 20))
+
+            tracemalloc.start()
+            try:
+                dst = _compress_file(src, 'gzip')
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, 4 << 20)
+            self.assertFalse(os.path.exists(src))
+            with gzip.open(dst, 'rb') as file:
+                self.assertEqual(len(file.read()), 16 << 20)
+
+    def test_rotation(self):
+        """Test rotation of output files."""
+        from dictdumper.dumper import DumperError
+        from dictdumper.rotation import Rotation
+
+        rootdir = os.path.join(ROOT, 'json')
+        with TemporaryDirectory() as tempdir:
+            rotated = list()
+            dst = os.path.join(tempdir, 'test.json')
+            with dictdumper.JSON(dst, rotate=Rotation(blocks=1, callback=rotated.append)) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            self.assertEqual(rotated, [dst])
+            self.assertFile(dst, os.path.join(rootdir, 'test_1%s.json' % PY2))
+            with open(os.path.join(tempdir, 'test.0001.json')) as file:
+                self.assertEqual(list(json.load(file)), ['test_2'])
+            self.assertFalse(os.path.exists(os.path.join(tempdir, 'test.0002.json')))
+
+            dst = os.path.join(tempdir, 'test.txt')
+            rotation = Rotation(size=1, compress='gzip', callback=rotated.append)
+            with dictdumper.Tree(dst, rotate=rotation) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_1, name='test_1')
+            self.assertEqual(rotated[1:], [dst + '.gz'])
+            self.assertFalse(os.path.exists(dst))
+            self.assertTrue(os.path.exists(os.path.join(tempdir, 'test.0001.txt')))
+
+            with gzip.open(dst + '.gz', 'rt') as file:
+                text = file.read()
+            with open(os.path.join(ROOT, 'tree', 'test_1%s.txt' % PY2)) as file:
+                self.assertEqual(text, file.read())
+
+            dst = os.path.join(tempdir, 'test.csv')
+            with dictdumper.CSV(dst, infer=1, rotate=Rotation(blocks=2)) as dumper:
+                for index in range(3):
+                    dumper({'foo': index}, name='test_%d' % index)
+                    with self.assertRaises(DumperError):  # not counted
+                        dumper({'foo': object()}, name='broken')
+            with open(dst) as file:
+                self.assertEqual(file.read(), 'name,foo,_overflow\ntest_0,0,\ntest_1,1,\n')
+            with open(os.path.join(tempdir, 'test.0001.csv')) as file:
+                self.assertEqual(file.read(), 'name,foo,_overflow\ntest_2,2,\n')
+
+            dst = os.path.join(tempdir, 'test.db')
+            with dictdumper.SQLite(dst, rotate=Rotation(blocks=2)) as dumper:
+                for index in range(3):
+                    dumper({'foo': index}, name='test_%d' % index)
+                    with self.assertRaises(DumperError):  # not counted
+                        dumper({'foo': object()}, name='broken')
+            for (path, names) in ((dst, ['test_0', 'test_1']),
+                                  (os.path.join(tempdir, 'test.0001.db'), ['test_2'])):
+                conn = sqlite3.connect(path)
+                self.assertEqual([row[0] for row in conn.execute('SELECT name FROM blocks ORDER BY seq')],
+                                 names)
+                conn.close()
+
+        with self.assertRaises(ValueError):
+            Rotation(compress='zip')
+
+    def test_compression(self):
+        """Test streaming compression of outputs."""
+        import bz2
+        import lzma
+
+        from dictdumper.rotation import Rotation
+
+        openers = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+        with TemporaryDirectory() as tempdir:
+            for (compression, opener) in openers.items():
+                for (folder, ext, cls) in (('json', 'json', dictdumper.JSON), ('tree', 'txt', dictdumper.Tree)):
+                    dst = os.path.join(tempdir, 'test.%s.%s' % (ext, compression))
+                    with cls(dst, compression=compression, compresslevel=1) as dumper:
+                        dumper(test_1, name='test_1')
+                        dumper.release()
+                        dumper(test_2, name='test_2')
+                        dumper(test_3, name='test_3')
+                    with opener(dst, 'rt') as file:
+                        text = file.read()
+                    with open(os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext))) as file:
+                        self.assertEqual(text, file.read())
+
+            dst = os.path.join(tempdir, 'test.cbor.gz')
+            with dictdumper.CBOR(dst, compression='gzip') as dumper:
+                dumper(test_1, name='test_1')
+            with gzip.open(dst, 'rb') as file:
+                data = file.read()
+            with open(os.path.join(ROOT, 'cbor', 'test_1.cbor'), 'rb') as file:
+                self.assertEqual(data, file.read())
+
+            dst = os.path.join(tempdir, 'test.json.gz')
+            with dictdumper.JSON(dst, compression='gzip', rotate=Rotation(blocks=1)) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            for path in (dst, os.path.join(tempdir, 'test.0001.json.gz')):
+                with gzip.open(path, 'rt') as file:
+                    self.assertEqual(len(json.load(file)), 1)
+
+            dst = os.path.join(tempdir, 'test.csv.gz')
+            with dictdumper.CSV(dst, compression='gzip') as dumper:
+                dumper({'foo': 1}, name='test_1')
+            with gzip.open(dst, 'rt') as file:
+                self.assertEqual(file.read(), 'name,foo,_overflow\ntest_1,1,\n')
+
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, compression='zip')
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, compression='gzip', rotate=Rotation(blocks=1, compress='gzip'))
+
+    def test_index(self):
+        """Test sidecar index of blocks."""
+        from dictdumper.index import Index, open_block
+
+        with TemporaryDirectory() as tempdir:
+            dst = os.path.join(tempdir, 'test.json')
+            with dictdumper.JSON(dst, index=True) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+                dumper(test_3, name='test_3')
+            with open(dst) as file:
+                content = json.load(file)
+            for (seq, name) in enumerate(('test_1', 'test_2', 'test_3')):
+                self.assertEqual(open_block(dst, name, parse=True), content[name])
+                self.assertEqual(open_block(dst, seq, parse=True), content[name])
+            self.assertIn('"test_2": {', open_block(dst, -2))
+            with self.assertRaises(KeyError):
+                open_block(dst, 'test_4')
+
+            dst = os.path.join(tempdir, 'test.txt')
+            with dictdumper.Tree(dst, index=True) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            index = Index(dst)
+            self.assertEqual((len(index), index.kind), (2, 'txt'))
+            with open(os.path.join(ROOT, 'tree', 'test_2%s.txt' % PY2)) as file:
+                self.assertEqual(index.read(0) + index.read(1), file.read())
+            with self.assertRaises(ValueError):
+                index.parse(0)
+
+            dst = os.path.join(tempdir, 'test.json.gz')
+            with dictdumper.JSON(dst, index=True, compression='gzip') as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            self.assertEqual(open_block(dst, 'test_2', parse=True), content['test_2'])
+
+        with self.assertRaises(ValueError):
+            dictdumper.CSV(os.devnull, index=True)
+
+    def test_reader(self):
+        """Test streaming block readers."""
+        from dictdumper.reader import read
+
+        names = ['test_1', 'test_2', 'test_3']
+        with open(os.path.join(ROOT, 'json', 'test_3%s.json' % PY2)) as file:
+            content = json.load(file, object_pairs_hook=collections.OrderedDict)
+        self.assertEqual(list(read(os.path.join(ROOT, 'json', 'test_3%s.json' % PY2))),
+                         list(content.items()))
+        self.assertEqual(list(read(os.path.join(ROOT, 'json', 'test_0%s.json' % PY2))), [])
+
+        blocks = list(read(os.path.join(ROOT, 'plist', 'test_3%s.plist' % PY2)))
+        self.assertEqual([name for (name, _) in blocks], names)
+        self.assertEqual(blocks[1][1]['boo']['foo_again'], b'bytestring')
+        self.assertEqual(blocks[1][1]['boo']['bar_again'], datetime.datetime(2020, 1, 31, 20, 15, 10, 163010))
+
+        blocks = list(read(os.path.join(ROOT, 'tree', 'test_3%s.txt' % PY2)))
+        self.assertEqual([name for (name, _) in blocks], names)
+        self.assertTrue(blocks[0][1].startswith('  |-- foo -> -1\n'))
+
+        with self.assertRaises(ValueError):
+            read('test.json.gz')
+
+    def test_resume(self):
+        """Test resuming appending to existing output files."""
+        from dictdumper.rotation import Rotation
+
+        formats = (('json', 'json', dictdumper.JSON), ('plist', 'plist', dictdumper.PLIST),
+                   ('tree', 'txt', dictdumper.Tree))
+        with TemporaryDirectory() as tempdir:
+            for (folder, ext, cls) in formats:
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                cls(dst, mode='resume')(test_1, name='test_1')
+                if cls is not dictdumper.Tree:  # trailing whitespaces
+                    with open(dst, 'a') as file:
+                        file.write('\n\n')
+                cls(dst, mode='resume')(test_2, name='test_2')
+                cls(dst, mode='resume')(test_3, name='test_3')
+                with open(dst) as file:
+                    text = file.read()
+                with open(os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext))) as file:
+                    self.assertEqual(text, file.read())
+
+            dst = os.path.join(tempdir, 'test.json')
+            with open(dst, 'a') as file:
+                file.write('{"test_4": ')
+            with self.assertRaises(ValueError):
+                dictdumper.JSON(dst, mode='resume')
+
+            dst = os.path.join(tempdir, 'rotate.json')
+            with dictdumper.JSON(dst, rotate=Rotation(blocks=1)) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            with dictdumper.JSON(dst, rotate=Rotation(blocks=2), mode='resume') as dumper:
+                self.assertEqual(dumper.filename, os.path.join(tempdir, 'rotate.0001.json'))
+                dumper(test_3, name='test_3')
+            with open(os.path.join(tempdir, 'rotate.0001.json')) as file:
+                self.assertEqual(list(json.load(file)), ['test_2', 'test_3'])
+
+            dst = os.path.join(tempdir, 'test.db')
+            with dictdumper.SQLite(dst) as dumper:
+                dumper(test_1, name='test_1')
+            with dictdumper.SQLite(dst, mode='resume') as dumper:
+                dumper(test_2, name='test_2')
+            conn = sqlite3.connect(dst)
+            self.assertEqual(conn.execute('SELECT seq, name FROM blocks').fetchall(),
+                             [(0, 'test_1'), (1, 'test_2')])
+            conn.close()
+
+        with self.assertRaises(ValueError):
+            dictdumper.HTML(os.devnull, mode='resume')
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, mode='append')
+
+    def test_mmap(self):
+        """Test memory-mapped output backend."""
+        from dictdumper.dumper import DumperError
+        from dictdumper.mapped import _EXTENT_SIZE
+
+        formats = (('json', 'json', dictdumper.JSON), ('plist', 'plist', dictdumper.PLIST),
+                   ('tree', 'txt', dictdumper.Tree), ('cbor', 'cbor', dictdumper.CBOR))
+        with TemporaryDirectory() as tempdir:
+            for (folder, ext, cls) in formats:
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                with cls(dst, backend='mmap') as dumper:
+                    self.assertTrue(dumper.held)
+                    dumper(test_1, name='test_1')
+                    dumper(test_2, name='test_2')
+                    self.assertEqual(os.path.getsize(dst), _EXTENT_SIZE)
+                    dumper.release()
+                    dumper(test_3, name='test_3')
+                name = 'test_3.cbor' if ext == 'cbor' else 'test_3%s.%s' % (PY2, ext)
+                self.assertFile(dst, os.path.join(ROOT, folder, name), 'rb')
+
+            # null paddings left by unclosed memory-mapped output
+            dst = os.path.join(tempdir, 'test.json')
+            dictdumper.JSON(dst)(test_1, name='test_1')
+            with open(dst, 'ab') as file:
+                file.write(b'\x00' * 10000)
+            dumper = dictdumper.JSON(dst, mode='resume')
+            dumper(test_2, name='test_2')
+            self.assertFile(dst, os.path.join(ROOT, 'json', 'test_2%s.json' % PY2))
+
+            # crashed after rolling back a block
+            src = os.path.join(tempdir, 'crash.json')
+            with dictdumper.JSON(dst, backend='mmap') as dumper:
+                dumper(test_1, name='test_1')
+                with self.assertRaises(DumperError):
+                    dumper({'foo': ['x' * 100] * 100 + [object()]}, name='broken')
+                with open(dst, 'rb') as file, open(src, 'wb') as copy:
+                    copy.write(file.read())
+            dumper = dictdumper.JSON(src, mode='resume')
+            dumper(test_2, name='test_2')
+            self.assertFile(src, os.path.join(ROOT, 'json', 'test_2%s.json' % PY2))
+
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, backend='mmap', compression='gzip')
+
+    def test_durability(self):
+        """Test durability policies."""
+        from dictdumper.durability import GroupCommit
+
+        with TemporaryDirectory() as tempdir, count_fsync() as calls:
+            dst = os.path.join(tempdir, 'test.json')
+            with dictdumper.JSON(dst, durability='block') as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+            self.assertEqual(len(calls), 2)
+
+            del calls[:]
+            with dictdumper.JSON(dst, durability='interval', sync_interval=3600) as dumper:
+                dumper(test_1, name='test_1')
+                dumper(test_2, name='test_2')
+                self.assertEqual(len(calls), 0)
+            self.assertEqual(len(calls), 1)  # on close
+
+            del calls[:]
+            group = GroupCommit(blocks=3)
+            dumpers = [dictdumper.Tree(os.path.join(tempdir, 'test_%d.txt' % index), durability=group)
+                       for index in range(2)]
+            dumpers[1].hold()
+            dumpers[0](test_1, name='test_1')
+            dumpers[1](test_1, name='test_1')
+            self.assertEqual(len(calls), 0)
+            dumpers[0](test_2, name='test_2')
+            self.assertEqual(len(calls), 2)  # both dumpers at once
+            self.assertFile(os.path.join(tempdir, 'test_1.txt'), os.path.join(ROOT, 'tree', 'test_1%s.txt' % PY2))
+            for dumper in dumpers:
+                dumper.close()
+            self.assertEqual(len(calls), 2)
+
+            del calls[:]
+            group = GroupCommit(blocks=2)
+            dumpers = [dictdumper.Tree(os.path.join(tempdir, 'test_%d.txt' % index), durability=group)
+                       for index in range(2)]
+            dumpers[0](test_1, name='test_1')
+            group.enter(dumpers[0])  # in the middle of a block
+            dumpers[1](test_1, name='test_1')
+            self.assertEqual(len(calls), 1)  # deferred to block boundary
+            group.mark(dumpers[0])
+            self.assertEqual(len(calls), 2)
+            for dumper in dumpers:
+                dumper.close()
+            self.assertEqual(len(calls), 2)
+
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, durability='always')
+        with self.assertRaises(ValueError):
+            dictdumper.JSON(os.devnull, backend='mmap', durability='block')
+
+    def test_rollback(self):
+        """Test rollback of partially dumped blocks."""
+        from dictdumper.dumper import DumperError
+
+        broken = collections.OrderedDict()
+        broken['foo'] = [1, collections.OrderedDict([('bar', [2, object()])])]
+
+        formats = (('json', 'json', dictdumper.JSON, {}), ('plist', 'plist', dictdumper.PLIST, {}),
+                   ('tree', 'txt', dictdumper.Tree, {}), ('json', 'json', dictdumper.JSON, {'backend': 'mmap'}))
+        with TemporaryDirectory() as tempdir:
+            for (folder, ext, cls, kwargs) in formats:
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                with cls(dst, **kwargs) as dumper:
+                    dumper(test_1, name='test_1')
+                    with self.assertRaises(DumperError):
+                        dumper(broken, name='broken')
+                    dumper.release()
+                    self.assertFile(dst, os.path.join(ROOT, folder, 'test_1%s.%s' % (PY2, ext)))
+                    dumper(test_2, name='test_2')
+                    with self.assertRaises(DumperError):
+                        dumper(broken, name='broken')
+                    dumper(test_3, name='test_3')
+                self.assertFile(dst, os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext)))
+
+            dst = os.path.join(tempdir, 'test.cbor')
+            with dictdumper.CBOR(dst) as dumper:
+                with self.assertRaises(DumperError):
+                    dumper(broken, name='broken')
+                dumper(test_1, name='test_1')
+            self.assertFile(dst, os.path.join(ROOT, 'cbor', 'test_1.cbor'), 'rb')
+
+            dst = os.path.join(tempdir, 'test.json.gz')
+            with dictdumper.JSON(dst, compression='gzip') as dumper:
+                dumper(test_1, name='test_1')
+                with self.assertRaises(DumperError):
+                    dumper(broken, name='broken')
+                with self.assertRaises(DumperError):  # beyond chunk size
+                    dumper({'foo': ['x' * 4096] * 300 + [object()]}, name='broken')
+                dumper(test_2, name='test_2')
+            with gzip.open(dst, 'rt') as file:
+                text = file.read()
+            with open(os.path.join(ROOT, 'json', 'test_2%s.json' % PY2)) as file:
+                self.assertEqual(text, file.read())
+
+    def test_lazy(self):
+        """Test dumping of arbitrary mappings and iterables."""
+        class View(collections.Mapping if PY2 else collections.abc.Mapping):  # pylint: disable=no-member
+            def __init__(self, data):
+                self.data = data
+
+            def __getitem__(self, key):
+                return lazy(self.data[key])
+
+            def __iter__(self):
+                return iter(self.data)
+
+            def __len__(self):
+                return len(self.data)
+
+        def lazy(value):
+            if isinstance(value, dict):
+                return View(value)
+            if isinstance(value, list):
+                return (lazy(item) for item in value)
+            return value
+
+        formats = (('json', 'json', dictdumper.JSON), ('plist', 'plist', dictdumper.PLIST),
+                   ('tree', 'txt', dictdumper.Tree))
+        with TemporaryDirectory() as tempdir:
+            for (folder, ext, cls) in formats:
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                with cls(dst) as dumper:
+                    dumper(lazy(test_1), name='test_1')
+                    dumper(lazy(test_2), name='test_2')
+                    dumper(lazy(test_3), name='test_3')
+                self.assertFile(dst, os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext)))
+
+            for (ext, cls, kwargs) in (('yaml', dictdumper.YAML, {'anchors': False}),
+                                       ('yaml', dictdumper.YAML, {})):
+                src = os.path.join(tempdir, 'src.%s' % ext)
+                dst = os.path.join(tempdir, 'dst.%s' % ext)
+                with cls(src, **kwargs) as dumper:
+                    dumper(test_3, name='test_3')
+                with cls(dst, **kwargs) as dumper:
+                    dumper(lazy(test_3), name='test_3')
+                self.assertFile(dst, src)
+
+            dst = os.path.join(tempdir, 'test.cbor')
+            with dictdumper.CBOR(dst) as dumper:
+                dumper(View({'foo': iter([1, 2]), 'bar': {}.keys()}), name='test')
+            with open(dst, 'rb') as file:
+                self.assertEqual(file.read(), b'\xbfdtest\xa2cfoo\x9f\x01\x02\xffcbar\x80\xff')
+
+            dst = os.path.join(tempdir, 'test.json')
+            with dictdumper.JSON(dst) as dumper:
+                dumper({'foo': (str(item) for item in range(3))}, name='test')
+            with open(dst) as file:
+                self.assertEqual(json.load(file), {'test': {'foo': ['0', '1', '2']}})
+
+    @unittest.skipIf(PY2, 'memoryview.cast not supported')
+    def test_memoryview(self):
+        """Test dumping of strided and multi-byte memoryviews."""
+        import array
+
+        views = collections.OrderedDict()
+        views['foo'] = memoryview(bytearray(b'abcdef'))[::2]
+        views['bar'] = [memoryview(array.array('H', [0x6968, 0xff00])), (1, memoryview(b''))]
+        plain = collections.OrderedDict()
+        plain['foo'] = memoryview(b'ace')
+        plain['bar'] = [memoryview(views['bar'][0].tobytes()), (1, memoryview(b''))]
+
+        formats = (('json', dictdumper.JSON), ('plist', dictdumper.PLIST), ('txt', dictdumper.Tree),
+                   ('yaml', dictdumper.YAML), ('cbor', dictdumper.CBOR))
+        with TemporaryDirectory() as tempdir:
+            for (ext, cls) in formats:
+                src = os.path.join(tempdir, 'src.%s' % ext)
+                dst = os.path.join(tempdir, 'dst.%s' % ext)
+                with cls(src) as dumper:
+                    dumper(plain, name='test')
+                with cls(dst) as dumper:
+                    dumper(views, name='test')
+                self.assertFile(dst, src, 'rb')
+
+    def test_object_hook(self):
+        """Test object hook applied to fields of typed wrappers."""
+        def object_hook(self, o):  # pylint: disable=unused-argument
+            if isinstance(o, type(u'')):
+                return o.upper()
+            return o
+
+        content = collections.OrderedDict()
+        content['tuple'] = (u'foo', 1)
+        content['bytes'] = bytearray(b'bar')
+
+        formats = (('json', dictdumper.JSON), ('plist', dictdumper.PLIST), ('txt', dictdumper.Tree))
+        with TemporaryDirectory() as tempdir:
+            for (ext, cls) in formats:
+                hooked = type(cls.__name__, (cls,), {'object_hook': object_hook})
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                with hooked(dst) as dumper:
+                    dumper(content, name='test')
+                with open(dst) as file:
+                    text = file.read()
+                self.assertIn('TUPLE', text)
+                self.assertIn('BYTEARRAY', text)
+                self.assertIn('FOO', text)
+
+            with open(os.path.join(tempdir, 'test.json')) as file:
+                self.assertEqual(json.load(file)['test']['bytes'],
+                                 {'type': 'BYTEARRAY', 'value': 'BAR', 'hex': '626172'})
+
+    def test_memo(self):
+        """Test memoization of leaf renderings."""
+        from dictdumper.memo import Memo
+
+        formats = (('json', 'json', dictdumper.JSON), ('plist', 'plist', dictdumper.PLIST),
+                   ('tree', 'txt', dictdumper.Tree))
+        with TemporaryDirectory() as tempdir:
+            memo = Memo(entries=4, threshold=16)
+            for (folder, ext, cls) in formats:
+                dst = os.path.join(tempdir, 'test.%s' % ext)
+                with cls(dst, memo=memo) as dumper:
+                    dumper(test_1, name='test_1')
+                    dumper(test_2, name='test_2')
+                    dumper(test_3, name='test_3')
+                self.assertIs(dumper.memo, memo)
+                self.assertFile(dst, os.path.join(ROOT, folder, 'test_3%s.%s' % (PY2, ext)))
+            self.assertLessEqual(len(memo), 4)
+            self.assertGreater(memo.evictions, 0)
+            self.assertGreater(memo.skips, 0)
+
+            dst = os.path.join(tempdir, 'test.json')
+            stamp = datetime.datetime(2020, 1, 31, 20, 15, 10)
+            with dictdumper.JSON(dst, memo=True) as dumper:
+                for index in range(10):
+                    dumper({'mac': b'\x00\x1b\x21\x3a\x4f\x5e', 'proto': 'TCP', 'time': stamp}, name=str(index))
+            snap = dumper.memo.snapshot()
+            self.assertEqual(snap['misses'], 7)
+            self.assertEqual(snap['hits'], 63)
+            self.assertEqual(snap['hit_rate'], 0.9)
+            with open(dst) as file:
+                self.assertEqual(json.load(file)['9']['time'], '2020-01-31T20:15:10')
+
+        memo = Memo(bytes=64)
+        self.assertEqual(memo.render('hex', b'\xff' * 16, bytes.hex), 'ff' * 16)
+        self.assertEqual(memo.render('hex', b'\xff' * 16, bytes.hex), 'ff' * 16)
+        self.assertEqual(memo.render('hex', b'\xee' * 32, bytes.hex), 'ee' * 32)
+        self.assertEqual((memo.hits, memo.misses, memo.skips, len(memo), memo.size), (1, 1, 1, 1, 48))
+
+        buf = bytearray(b'\xff' * 16)
+        for data in (buf, b'\xff' * 16):
+            self.assertEqual(memo.render('hex', memoryview(data), binascii.hexlify), b'ff' * 16)
+        self.assertEqual(memo.hits, 2)  # keyed by contents
+        buf.append(0)  # not held by the cache
+
+    def test_numeric(self):
+        """Test bulk writing of homogeneous numbers."""
+        content = collections.OrderedDict()
+        content['int'] = [1, -2, 3, 2 ** 70, -2 ** 70]
+        content['float'] = [0.5, -1e300, 1e-320, 3.0]
+        content['tuple'] = (1, 2, 3)
+        content['nested'] = [[1, 2], {'foo': [0.5, 1.5]}, (4,), [1, 2]]
+        content['mixed'] = [[1, 2.0], [True, 1], [1.0, float('nan')], [1e308, 1e308], []]
+
+        formats = (('json', dictdumper.JSON), ('plist', dictdumper.PLIST), ('txt', dictdumper.Tree),
+                   ('yaml', dictdumper.YAML), ('cbor', dictdumper.CBOR))
+        with TemporaryDirectory() as tempdir:
+            for (ext, cls) in formats:
+                plain = type(cls.__name__, (cls,), {'object_hook': lambda self, o: o})
+                src = os.path.join(tempdir, 'src.%s' % ext)
+                dst = os.path.join(tempdir, 'dst.%s' % ext)
+                with plain(src, stats=True) as dumper:
+                    dumper(content, name='test')
+                    counts = dumper.stats.snapshot()
+                with cls(dst, stats=True) as dumper:
+                    dumper(content, name='test')
+                    handlers = dumper.stats.snapshot()['handlers']
+                # tuples are converted into typed wrappers if the hook is overridden,
+                # thus counted (and hooked) differently
+                for key in ('object', 'dict', 'branch', 'collection', 'string'):
+                    handlers.pop(key, None)
+                    counts['handlers'].pop(key, None)
+                self.assertEqual(handlers, counts['handlers'])
+                self.assertFile(dst, src, 'rb')
+
+    def test_arrays(self):
+        """Test dumping of typed arrays."""
+        def content(convert):
+            value = collections.OrderedDict()
+            value['int'] = convert(array.array('i', range(-5000, 5000)))
+            value['float'] = convert(array.array('d', [0.5, -1e300, 3.0]))
+            value['nan'] = convert(array.array('d', [0.5, float('nan')]))
+            value['empty'] = convert(array.array('B'))
+            value['nested'] = [convert(array.array('h', [1, 2])), {'foo': convert(array.array('f', [0.25]))}]
+            return value
+
+        formats = (('json', dictdumper.JSON), ('plist', dictdumper.PLIST), ('txt', dictdumper.Tree),
+                   ('yaml', dictdumper.YAML), ('cbor', dictdumper.CBOR), ('csv', dictdumper.CSV))
+        with TemporaryDirectory() as tempdir:
+            for (ext, cls) in formats:
+                src = os.path.join(tempdir, 'src.%s' % ext)
+                dst = os.path.join(tempdir, 'dst.%s' % ext)
+                with cls(src) as dumper:
+                    dumper(content(lambda value: value.tolist()), name='test')
+                with cls(dst) as dumper:
+                    dumper(content(lambda value: value), name='test')
+                self.assertFile(dst, src, 'rb')
+
+            dst = os.path.join(tempdir, 'test.yaml')
+            with dictdumper.YAML(dst) as dumper:
+                dumper({'foo': [1, 2], 'bar': array.array('b', [1, 2]), 'baz': (1.0, 2.0)}, name='test')
+            with open(dst) as file:
+                text = file.read()
+            self.assertEqual(text.count('&id'), 1)  # equal numbers aliased, but not to floats
+            self.assertEqual(text.count('*id'), 1)
+
+    @unittest.skipIf(numpy is None, 'NumPy not installed')
+    def test_numpy(self):
+        """Test dumping of NumPy arrays."""
+        def content(convert):
+            value = collections.OrderedDict()
+            value['int'] = convert(numpy.arange(-5000, 5000))
+            value['float'] = convert(numpy.linspace(0, 1, 9, dtype=numpy.float32))
+            value['nan'] = convert(numpy.array([0.5, numpy.nan, -numpy.inf]))
+            value['bool'] = convert(numpy.array([True, False]))
+            value['matrix'] = convert(numpy.arange(5000.0).reshape(100, 50)[:, ::2])
+            value['scalar'] = convert(numpy.array(7))
+            value['bytes'] = convert(numpy.array([b'foo', b'ba'], dtype='S4'))
+            value['record'] = convert(numpy.zeros(2, dtype=[('foo', '<i4'), ('bar', '<f8')])[::-1])
+            return value
+
+        def tolist(value):
+            if value.dtype.kind in 'SV':
+                return memoryview(numpy.ascontiguousarray(value).tobytes())
+            return value.tolist()
+
+        formats = (('json', dictdumper.JSON, {}), ('plist', dictdumper.PLIST, {}), ('txt', dictdumper.Tree, {}),
+                   ('yaml', dictdumper.YAML, {'anchors': False}), ('cbor', dictdumper.CBOR, {}),
+                   ('csv', dictdumper.CSV, {}))
+        with TemporaryDirectory() as tempdir:
+            for (ext, cls, kwargs) in formats:
+                src = os.path.join(tempdir, 'src.%s' % ext)
+                dst = os.path.join(tempdir, 'dst.%s' % ext)
+                with cls(src, **kwargs) as dumper:
+                    dumper(content(tolist), name='test')
+                with cls(dst, **kwargs) as dumper:
+                    dumper(content(lambda value: value), name='test')
+                self.assertFile(dst, src, 'rb')
+
+    def test_bench(self):
+        """Test benchmark harness."""
+        from dictdumper.bench import TARGETS, compare, make_records, run
+
+        self.assertEqual(make_records('small', 3, seed=1), make_records('small', 3, seed=1))
+
+        report = run(workloads=['small'], count=5, repeat=1)
+        self.assertEqual(len(report['results']), len(TARGETS))
+        for item in report['results']:
+            self.assertEqual(item['records'], 5)
+            self.assertGreater(item['bytes'], 0)
+            self.assertLessEqual(item['latency']['p50'], item['latency']['max'])
+
+        rows = compare(report, json.loads(json.dumps(report)))
+        self.assertEqual([row[4] for row in rows], [1.0] * len(TARGETS))
+
+    def test_bench_memory(self):
+        """Test memory benchmark and regression check."""
+        from dictdumper.bench import check, load_baseline, make_records, run_memory
+
+        records = make_records('small', 5)
+        result = run_memory('json', records, repeat=1)
+        self.assertEqual(result['records'], 5)
+        self.assertGreater(result['peak'], 0)
+
+        report = dict(meta=dict(count=5, seed=0), results=[dict(result, workload='small')])
+        self.assertEqual(check(report, report), [])
+        regressed = dict(result, workload='small', peak=result['peak'] * 2 + 65536)
+        self.assertEqual(check(dict(report, results=[regressed]), report),
+                         [('json', 'small', 'peak', result['peak'], regressed['peak'])])
+        with self.assertRaises(ValueError):
+            check(dict(report, meta=dict(count=6, seed=0)), report)
+
+        baseline = load_baseline()
+        if baseline is not None:
+            self.assertEqual(set(item['target'] for item in baseline['results']),
+                             set(dictdumper.bench.TARGETS))
+
 
 if __name__ == "__main__":
     unittest.main()